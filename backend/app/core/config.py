@@ -1,6 +1,6 @@
 """Application configuration."""
 from pydantic_settings import BaseSettings
-from typing import List
+from typing import Dict, List
 
 
 class Settings(BaseSettings):
@@ -15,13 +15,84 @@ class Settings(BaseSettings):
     cors_origins: List[str] = ["*"]
 
     # Scraping Settings
+    # Débit vers chaque hôte amont : une requête toutes les `scraper_delay`
+    # secondes en régime établi, rafales de `scraper_burst` requêtes
     scraper_delay: float = 1.0
+    scraper_burst: int = 3
+    # Intervalles propres à certains hôtes (pages de détail WTTJ)
+    scraper_host_delays: Dict[str, float] = {"www.welcometothejungle.com": 0.25}
     max_retries: int = 3
     request_timeout: float = 30.0
 
+    # Résilience des scrapers : budget de retries partagé (fraction des
+    # scrapings + minimum par seconde) et disjoncteur par source
+    retry_budget_ratio: float = 0.2
+    retry_budget_min_per_second: float = 0.5
+    circuit_breaker_threshold: int = 3
+    circuit_breaker_cooldown: float = 120.0
+
+    # HTTP client (pool partagé)
+    http2: bool = True
+    http_connect_timeout: float = 10.0
+    http_max_connections: int = 100
+    http_max_connections_per_host: int = 10
+    http_max_keepalive_connections: int = 10
+    http_keepalive_expiry: float = 30.0
+
+    # Playwright (Welcome to the Jungle)
+    browser_pool_size: int = 2
+    browser_context_max_pages: int = 50
+    browser_pool_warmup: bool = False
+    # Rendu allégé : images, polices, styles et traceurs non chargés
+    browser_block_resources: bool = True
+    wttj_timeout: float = 60.0
+    # Enrichissement des offres WTTJ depuis leur page de détail (JSON-LD)
+    wttj_details_enabled: bool = True
+    wttj_details_concurrency: int = 4
+    wttj_details_timeout: float = 20.0
+    wttj_details_ttl: float = 86400.0
+    # Pages en erreur ou sans JSON-LD : pas de nouvel essai avant ce délai
+    wttj_details_negative_ttl: float = 600.0
+
+    # Stockage des caches (flux, jeux de résultats) : "memory" (un seul
+    # worker), "sqlite" (fichier WAL partagé par les workers d'un volume) ou
+    # "redis" (partagé entre nœuds)
+    cache_backend: str = "memory"
+    cache_sqlite_path: str = "data/cache.sqlite3"
+    cache_redis_url: str = "redis://localhost:6379/0"
+
+    # Cache des flux complets (RemoteOK, Jobicy)
+    feed_cache_ttl: float = 300.0
+
+    # Cache des jeux de résultats (pagination, export)
+    result_cache_ttl: float = 300.0
+    result_cache_max_entries: int = 200
+    result_cache_max_jobs: int = 50000
+    result_cache_idle_ttl: float = 1800.0
+
+    # Index plein texte des offres (SQLite FTS5)
+    search_index_path: str = "data/job_index.sqlite3"
+    search_index_max_results: int = 1000
+
+    # Fusion des quasi-doublons entre sources
+    dedup_enabled: bool = True
+
+    # Crawler de fond (alimente l'index lu par défaut par /api/search).
+    # Désactivé par défaut : chaque worker lancerait le sien ; avec
+    # plusieurs workers, le lancer en processus séparé
+    crawler_enabled: bool = False
+    crawler_interval: float = 900.0
+    crawler_sources: List[str] = ["remoteok", "jobicy", "welcometothejungle"]
+    # Requêtes larges des sources sans flux entier (WTTJ)
+    crawler_queries: List[str] = ["developer", "engineer", "data", "designer", "product"]
+    crawler_max_results: int = 500
+
     # Pagination
     default_page_size: int = 20
     max_page_size: int = 100
+    # Offres tirées de chaque source au-delà des pages demandées, pour que
+    # le tri porte sur plus que la seule page servie
+    search_sort_window: int = 30
 
     class Config:
         env_file = ".env"
@@ -0,0 +1,90 @@
+"""Shared, pooled HTTP client."""
+from typing import Iterable, Optional
+from urllib.parse import urlsplit
+
+import httpx
+
+from app.core.config import settings
+
+try:
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+_client: Optional[httpx.AsyncClient] = None
+
+
+def create_http_client(upstream_urls: Iterable[str] = ()) -> httpx.AsyncClient:
+    """
+    Construit un client HTTP avec keep-alive, HTTP/2 si disponible et un
+    pool de connexions dédié (et limité) pour chaque hôte amont.
+
+    Args:
+        upstream_urls: URLs des sources ; chaque hôte reçoit son propre pool
+
+    Returns:
+        Client httpx asynchrone configuré depuis les settings
+    """
+    http2 = settings.http2 and HTTP2_AVAILABLE
+    timeout = httpx.Timeout(
+        settings.request_timeout, connect=settings.http_connect_timeout
+    )
+    host_limits = httpx.Limits(
+        max_connections=settings.http_max_connections_per_host,
+        max_keepalive_connections=settings.http_max_keepalive_connections,
+        keepalive_expiry=settings.http_keepalive_expiry,
+    )
+
+    mounts = {}
+    for url in upstream_urls:
+        parts = urlsplit(url)
+        mounts[f"{parts.scheme}://{parts.hostname}"] = httpx.AsyncHTTPTransport(
+            http2=http2, limits=host_limits
+        )
+
+    return httpx.AsyncClient(
+        timeout=timeout,
+        http2=http2,
+        limits=httpx.Limits(
+            max_connections=settings.http_max_connections,
+            max_keepalive_connections=settings.http_max_keepalive_connections,
+            keepalive_expiry=settings.http_keepalive_expiry,
+        ),
+        mounts=mounts,
+    )
+
+
+async def start_http_client(upstream_urls: Iterable[str] = ()) -> httpx.AsyncClient:
+    """Crée le client partagé du processus (appelé au démarrage de l'app)."""
+    global _client
+    if _client is None:
+        _client = create_http_client(upstream_urls)
+    return _client
+
+
+async def close_http_client() -> None:
+    """Ferme le client partagé et ses connexions (appelé à l'arrêt de l'app)."""
+    global _client
+    if _client is not None:
+        client, _client = _client, None
+        await client.aclose()
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """
+    Retourne le client partagé.
+
+    Hors du cycle de vie de l'application (scripts, benchmarks), le client
+    est créé à la demande.
+    """
+    global _client
+    if _client is None:
+        _client = create_http_client()
+    return _client
+
+
+def set_http_client(client: Optional[httpx.AsyncClient]) -> None:
+    """Remplace le client partagé (ex: client avec transport simulé)."""
+    global _client
+    _client = client
@@ -1,23 +1,51 @@
-from fastapi import FastAPI, HTTPException, Query
+from fastapi import FastAPI, HTTPException, Query, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import Response, JSONResponse
+from fastapi.responses import JSONResponse, Response, StreamingResponse
 from datetime import datetime
-from typing import Optional, List, Callable, Any
+from typing import Optional, List, Set, Callable, Any, Awaitable, AsyncIterator, Collection
+from contextlib import asynccontextmanager
 import asyncio
-import re
+import json
 import math
+import sqlite3
+import time
+from collections import Counter
+
+from app.core.config import settings
+from app.core.http_client import start_http_client, close_http_client
+from app.models import SearchRequest, SearchResponse, HealthResponse, JobRecord
+from app.scrapers.remoteok import scrape_remoteok, REMOTEOK_API_URL
+from app.scrapers.welcometothejungle import scrape_welcometothejungle, WTTJ_BASE_URL
+from app.scrapers.browser_pool import browser_pool
+from app.scrapers.jobicy import scrape_jobicy, JOBICY_URL
+from app.scrapers.errors import CircuitOpenError, is_retryable
+from app.services.export_service import (
+    encode_chunks, gzip_chunks, iter_csv, iter_json, iter_ndjson
+)
+from app.services.cache_store import cache_store
+from app.services.result_cache import (
+    DEFAULT_SOURCES, ResultSet, result_cache, result_set_key
+)
+from app.services.search_index import search_index
+from app.services.crawler import crawler
+from app.services.dedup import deduplicate_jobs
+from app.services.metrics import (
+    PROMETHEUS_CONTENT_TYPE, current_timing, record_timing, registry,
+    request_timing, retry_budget_exhausted, scraper_attempt_duration,
+    scraper_coalesced, scraper_errors, scraper_results, scraper_retries,
+    search_requests, search_results, timed_stage
+)
+from app.services.resilience import circuit_breakers, retry_budget
+from app.services.single_flight import scraper_flights
 
-from app.models import SearchRequest, SearchResponse, HealthResponse, JobOffer
-from app.scrapers.remoteok import scrape_remoteok
-from app.scrapers.welcometothejungle import scrape_welcometothejungle
-from app.scrapers.jobicy import scrape_jobicy
-from app.services.export_service import export_to_csv, export_to_json
+# Sources qui ignorent la localisation (offres 100% remote)
+LOCATION_AGNOSTIC_SOURCES = {"remoteok"}
 
-# Stockage temporaire des derniers résultats pour l'export
-last_results: List[JobOffer] = []
+# Âge maximal d'un crawl servi par l'index, en intervalles de crawl
+CRAWL_MAX_AGE_INTERVALS = 2
 
 # Configuration du retry
-MAX_RETRIES = 3
+MAX_RETRIES = settings.max_retries
 RETRY_DELAY = 1.0  # secondes
 
 
@@ -26,59 +54,212 @@ async def retry_scraper(
     source_name: str,
     max_retries: int = MAX_RETRIES,
     **kwargs
-) -> List[JobOffer]:
+) -> List[JobRecord]:
     """
-    Exécute un scraper avec mécanisme de retry et backoff exponentiel.
+    Exécute un scraper avec retry (backoff exponentiel) et disjoncteur.
+
+    Seules les erreurs transitoires (connexion, 5xx, 429) sont retentées, et
+    seulement dans la limite du budget de retries partagé par toutes les
+    sources. Après des échecs répétés, le disjoncteur de la source l'écarte
+    pendant un temps de refroidissement : elle échoue alors immédiatement
+    (`CircuitOpenError`) et apparaît comme dégradée.
+
+    Chaque tentative est mesurée (durée, résultat, type d'erreur).
+
+    Raises:
+        ScraperError: Dernière erreur du scraper, ou disjoncteur ouvert
     """
+    breaker = circuit_breakers.get(source_name)
+    if not breaker.allow():
+        scraper_errors.inc(source=source_name, error_type=CircuitOpenError.__name__)
+        raise CircuitOpenError(
+            source_name,
+            f"source dégradée après {breaker.failures} échecs consécutifs, "
+            f"nouvel essai dans {breaker.retry_in:.0f} s"
+        )
+    retry_budget.record_call()
+
     last_error = None
-    for attempt in range(max_retries):
-        try:
-            return await scraper_func(**kwargs)
-        except Exception as e:
-            last_error = e
-            if attempt < max_retries - 1:
+    try:
+        for attempt in range(max_retries):
+            attempt_started = time.perf_counter()
+            try:
+                jobs = await scraper_func(**kwargs)
+            except Exception as e:
+                scraper_attempt_duration.observe(
+                    time.perf_counter() - attempt_started, source=source_name, outcome="error"
+                )
+                scraper_errors.inc(source=source_name, error_type=type(e).__name__)
+                last_error = e
+                if attempt == max_retries - 1 or not is_retryable(e):
+                    break
+                if not retry_budget.try_acquire():
+                    retry_budget_exhausted.inc(source=source_name)
+                    break
+                scraper_retries.inc(source=source_name)
                 delay = RETRY_DELAY * (2 ** attempt)
                 await asyncio.sleep(delay)
-    raise last_error
+            else:
+                breaker.record_success()
+                scraper_attempt_duration.observe(
+                    time.perf_counter() - attempt_started, source=source_name, outcome="ok"
+                )
+                scraper_results.observe(len(jobs), source=source_name)
+                return jobs
+        breaker.record_failure(last_error)
+        raise last_error
+    except asyncio.CancelledError:
+        # Source annulée (délai de la recherche) : ni succès ni échec
+        breaker.release()
+        raise
+
+
+def _normalize_param(value: Any) -> Any:
+    # Espaces seulement : la casse des mots-clés distingue les opérateurs
+    if isinstance(value, str):
+        return " ".join(value.split()) or None
+    return value
+
+
+def scraper_call_key(source_name: str, params: dict) -> tuple:
+    """
+    Clé normalisée d'un scraping : source et paramètres transmis au scraper,
+    hors nombre d'offres à tirer (voir `coalesced_scraper`).
+    """
+    return (source_name,) + tuple(
+        (name, _normalize_param(value)) for name, value in sorted(params.items())
+    )
 
 
-def parse_salary(salary_str: Optional[str]) -> Optional[int]:
+async def coalesced_scraper(
+    scraper_func: Callable,
+    source_name: str,
+    max_results: int,
+    **kwargs
+) -> List[JobRecord]:
     """
-    Parse une chaîne de salaire pour extraire une valeur numérique moyenne.
-    Retourne None si le parsing échoue.
+    Scrape une source (avec retry), en partageant le scraping avec les
+    recherches identiques en cours.
+
+    Les recherches concurrentes qui demandent la même source avec les mêmes
+    paramètres attendent un seul scraping, quel que soit leur nombre
+    d'offres : un scraping en cours qui en tire au moins `max_results` est
+    rejoint, sinon un scraping plus large est lancé. Chaque recherche garde
+    les `max_results` premières offres (les scrapers suivent l'ordre du
+    flux) ; filtres, tri et pagination lui restent propres. Le temps
+    d'attente de la source alimente `Server-Timing`.
     """
-    if not salary_str:
-        return None
+    key = scraper_call_key(source_name, kwargs)
+    if scraper_flights.in_flight(key, max_results):
+        scraper_coalesced.inc(source=source_name)
+
+    started = time.perf_counter()
+    try:
+        jobs = await scraper_flights.run(
+            key,
+            lambda: retry_scraper(
+                scraper_func, source_name, max_results=max_results, **kwargs
+            ),
+            size=max_results
+        )
+    finally:
+        record_timing(f"scrape-{source_name}", time.perf_counter() - started)
+    # Liste propre à la recherche (les offres, elles, ne sont pas modifiées)
+    return jobs[:max_results]
+
+
+async def iter_scrapers(
+    scraper_tasks: List[tuple[str, Awaitable[List[JobRecord]]]],
+    deadline_ms: Optional[int] = None
+) -> AsyncIterator[tuple[str, List[JobRecord], Optional[str]]]:
+    """
+    Exécute les scrapers en parallèle et produit chaque résultat dès qu'il
+    est disponible, avec un délai global optionnel.
+
+    Les sources qui n'ont pas terminé avant le délai sont annulées et
+    signalées en erreur.
 
-    # Nettoyer la chaîne
-    salary_clean = salary_str.replace(",", "").replace(" ", "").upper()
+    Args:
+        scraper_tasks: Couples (nom de la source, coroutine de scraping)
+        deadline_ms: Délai maximum en millisecondes (None = pas de limite)
 
-    # Chercher les nombres (supporter K pour milliers)
-    numbers = re.findall(r"(\d+(?:\.\d+)?)\s*K?", salary_clean)
-    if not numbers:
-        return None
+    Yields:
+        (nom de la source, offres, message d'erreur ou None), par ordre de fin
+    """
+    tasks = {
+        asyncio.create_task(coro): source_name
+        for source_name, coro in scraper_tasks
+    }
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + deadline_ms / 1000 if deadline_ms else None
+    pending = set(tasks)
+
+    try:
+        while pending:
+            timeout = max(deadline - loop.time(), 0) if deadline is not None else None
+            done, pending = await asyncio.wait(
+                pending, timeout=timeout, return_when=asyncio.FIRST_COMPLETED
+            )
+            if not done:
+                break
+            for task in done:
+                try:
+                    yield tasks[task], task.result(), None
+                except Exception as e:
+                    yield tasks[task], [], str(e)
+
+        for task in pending:
+            yield tasks[task], [], f"délai dépassé ({deadline_ms} ms)"
+    finally:
+        # Annuler les sources trop lentes (ou toutes si la requête est annulée)
+        for task in tasks:
+            if not task.done():
+                task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+
+async def run_scrapers(
+    scraper_tasks: List[tuple[str, Awaitable[List[JobRecord]]]],
+    deadline_ms: Optional[int] = None
+) -> tuple[List[JobRecord], List[str], Set[str]]:
+    """
+    Exécute les scrapers en parallèle, avec un délai global optionnel.
 
-    values = []
-    for num in numbers:
-        val = float(num)
-        if "K" in salary_clean:
-            val *= 1000
-        values.append(val)
+    Les sources qui n'ont pas terminé avant le délai sont annulées et
+    signalées dans les erreurs ; les résultats des sources terminées sont
+    conservés.
 
-    # Retourner la moyenne si range, sinon la valeur unique
-    if len(values) >= 2:
-        return int((values[0] + values[1]) / 2)
-    elif len(values) == 1:
-        return int(values[0])
-    return None
+    Args:
+        scraper_tasks: Couples (nom de la source, coroutine de scraping)
+        deadline_ms: Délai maximum en millisecondes (None = pas de limite)
+
+    Returns:
+        (offres agrégées dans l'ordre des sources, messages d'erreur,
+        sources en erreur ou hors délai)
+    """
+    results = {}
+    async for source_name, jobs, error in iter_scrapers(scraper_tasks, deadline_ms):
+        results[source_name] = (jobs, error)
+
+    all_jobs: List[JobRecord] = []
+    errors: List[str] = []
+    failed: Set[str] = set()
+    for source_name, _ in scraper_tasks:
+        jobs, error = results[source_name]
+        all_jobs.extend(jobs)
+        if error:
+            errors.append(f"{source_name}: {error}")
+            failed.add(source_name)
+
+    return all_jobs, errors, failed
 
 
 def filter_jobs(
-    jobs: List[JobOffer],
+    jobs: List[JobRecord],
     salary_min: Optional[int] = None,
     salary_max: Optional[int] = None,
     experience_level: Optional[str] = None
-) -> List[JobOffer]:
+) -> List[JobRecord]:
     """
     Filtre les offres selon les critères avancés.
     """
@@ -87,7 +268,7 @@ def filter_jobs(
     for job in jobs:
         # Filtre par salaire
         if salary_min or salary_max:
-            job_salary = parse_salary(job.salary)
+            job_salary = job.salary_value
             if job_salary is not None:
                 if salary_min and job_salary < salary_min:
                     continue
@@ -111,7 +292,7 @@ def filter_jobs(
     return filtered
 
 
-def sort_jobs(jobs: List[JobOffer], sort_by: str = "date") -> List[JobOffer]:
+def sort_jobs(jobs: List[JobRecord], sort_by: str = "date") -> List[JobRecord]:
     """
     Trie les offres selon le critère spécifié.
     """
@@ -125,21 +306,63 @@ def sort_jobs(jobs: List[JobOffer], sort_by: str = "date") -> List[JobOffer]:
     elif sort_by == "salary":
         # Trier par salaire (plus élevé en premier)
         def salary_key(job):
-            salary = parse_salary(job.salary)
+            salary = job.salary_value
             return salary if salary is not None else 0
         return sorted(jobs, key=salary_key, reverse=True)
     elif sort_by == "relevance":
-        # Pour la pertinence, on garde l'ordre original (déjà filtré par keywords)
+        # La pertinence (BM25) est calculée par l'index plein texte ;
+        # ici on garde l'ordre reçu
         return jobs
     else:
         return jobs
 
 
+async def search_index_jobs(
+    request: SearchRequest,
+    sources: List[str],
+    limit: int
+) -> tuple[List[JobRecord], bool]:
+    """
+    Répond à une recherche depuis l'index plein texte, sans scraper.
+
+    Les offres sont classées par pertinence BM25 ; seules les `limit`
+    premières retenues sont lues (au plus `SEARCH_INDEX_MAX_RESULTS`). La
+    localisation est filtrée comme le font les scrapers (RemoteOK n'est que
+    du remote), pendant la lecture de l'index.
+
+    Returns:
+        (offres, True si l'index n'en a pas d'autres à lire)
+    """
+    limit = min(limit, settings.search_index_max_results)
+    accept = None
+    if request.location:
+        location = request.location.lower()
+
+        def accept(job: JobRecord) -> bool:
+            return job.source in LOCATION_AGNOSTIC_SOURCES or location in job.location.lower()
+
+    jobs, exhausted = await search_index.asearch(
+        request.keywords, sources=sources, limit=limit, accept=accept
+    )
+    complete = exhausted or limit == settings.search_index_max_results
+    return jobs, complete
+
+
+def results_needed(page: int, limit: int) -> int:
+    """
+    Nombre d'offres à tirer (de chaque source) pour servir la page `page`.
+
+    Les pages jusqu'à celle demandée, plus une fenêtre de tri
+    (`SEARCH_SORT_WINDOW`) : les offres au-delà ne sont ni lues ni construites.
+    """
+    return page * limit + settings.search_sort_window
+
+
 def paginate_jobs(
-    jobs: List[JobOffer],
+    jobs: List[JobRecord],
     page: int = 1,
     limit: int = 20
-) -> tuple[List[JobOffer], int, bool, bool]:
+) -> tuple[List[JobRecord], int, bool, bool]:
     """
     Pagine les résultats.
     Retourne (jobs_page, total_pages, has_next, has_previous)
@@ -156,12 +379,261 @@ def paginate_jobs(
 
     return paginated, total_pages, has_next, has_previous
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Cycle de vie de l'application : ouvre le client HTTP partagé (et, si
+    configuré, préchauffe le pool de navigateurs et lance le crawler de fond)
+    au démarrage, puis libère les connexions et Chromium à l'arrêt.
+    """
+    await start_http_client([REMOTEOK_API_URL, JOBICY_URL, WTTJ_BASE_URL])
+    if settings.browser_pool_warmup:
+        try:
+            await browser_pool.start()
+        except Exception:
+            # Le pool sera relancé à la première recherche WTTJ
+            pass
+    crawler_task = None
+    if settings.crawler_enabled:
+        crawler_task = asyncio.create_task(crawler.run_forever())
+    try:
+        yield
+    finally:
+        if crawler_task is not None:
+            crawler_task.cancel()
+            await asyncio.gather(crawler_task, return_exceptions=True)
+        await browser_pool.close()
+        await close_http_client()
+        search_index.close()
+        cache_store.close()
+
+
+def build_scraper_tasks(
+    request: SearchRequest,
+    sources: List[str],
+    max_results: int
+) -> List[tuple[str, Awaitable[List[JobRecord]]]]:
+    """
+    Prépare les coroutines de scraping (avec retry et regroupement des
+    scrapings identiques concurrents) des sources demandées.
+
+    Chaque source s'arrête après `max_results` offres (voir `results_needed`).
+
+    Returns:
+        Couples (nom de la source, coroutine de scraping)
+    """
+    scraper_tasks = []
+
+    if "remoteok" in sources:
+        scraper_tasks.append(("remoteok", coalesced_scraper(
+            scrape_remoteok,
+            "remoteok",
+            keywords=request.keywords,
+            location=request.location,
+            contract_type=request.contract_type,
+            max_results=max_results
+        )))
+
+    if "welcometothejungle" in sources:
+        scraper_tasks.append(("welcometothejungle", coalesced_scraper(
+            scrape_welcometothejungle,
+            "welcometothejungle",
+            keywords=request.keywords,
+            location=request.location,
+            contract_type=request.contract_type,
+            remote=request.remote or False,
+            max_results=max_results
+        )))
+
+    if "jobicy" in sources:
+        scraper_tasks.append(("jobicy", coalesced_scraper(
+            scrape_jobicy,
+            "jobicy",
+            keywords=request.keywords,
+            location=request.location,
+            contract_type=request.contract_type,
+            remote=request.remote or False,
+            max_results=max_results
+        )))
+
+    return scraper_tasks
+
+
+def sources_exhausted(
+    jobs: List[JobRecord],
+    max_results: int,
+    failed_sources: Collection[str] = ()
+) -> bool:
+    """
+    Indique si aucune source n'a atteint son quota : elles n'ont pas d'autres offres.
+
+    Une source en erreur ou hors délai n'a rien renvoyé sans pour autant
+    être épuisée : sa présence suffit à rendre le jeu incomplet.
+    """
+    if failed_sources:
+        return False
+    return all(count < max_results for count in Counter(job.source for job in jobs).values())
+
+
+async def scrape_sources(
+    request: SearchRequest,
+    sources: List[str],
+    max_results: int
+) -> tuple[List[JobRecord], List[str], bool]:
+    """
+    Scrape en direct les sources demandées, au plus `max_results` offres
+    par source.
+
+    Returns:
+        (offres agrégées, messages d'erreur, True si les sources sont épuisées)
+    """
+    # Exécuter les scrapers en parallèle avec gestion des erreurs
+    all_jobs, errors, failed = await run_scrapers(
+        build_scraper_tasks(request, sources, max_results),
+        deadline_ms=request.deadline_ms
+    )
+    return all_jobs, errors, sources_exhausted(all_jobs, max_results, failed)
+
+
+async def index_scraped_jobs(jobs: List[JobRecord]) -> None:
+    """Alimente l'index plein texte avec les offres scrapées en direct."""
+    try:
+        await search_index.aupsert(jobs)
+    except sqlite3.Error:
+        # L'index est un complément : il ne doit pas faire échouer la recherche
+        pass
+
+
+async def finalize_results(
+    request: SearchRequest,
+    key: str,
+    all_jobs: List[JobRecord],
+    errors: List[str],
+    ranked: bool = False,
+    complete: bool = True,
+    pulled: int = 0
+) -> ResultSet:
+    """
+    Fusionne les doublons, filtre, trie et met en cache les offres agrégées.
+
+    Args:
+        request: Requête de recherche
+        key: Clé normalisée de la recherche
+        all_jobs: Offres de toutes les sources
+        errors: Erreurs des sources
+        ranked: Offres déjà classées par pertinence (recherche dans l'index)
+        complete: Les sources n'ont pas d'autres offres que `all_jobs`
+        pulled: Quota d'offres tirées (par source en direct)
+
+    Returns:
+        Jeu de résultats complet, enregistré dans le cache
+    """
+    sort_by = request.sort_by or "date"
+
+    # Fusionner les quasi-doublons entre sources (calcul CPU, hors boucle)
+    duplicates = 0
+    unique_jobs = all_jobs
+    if settings.dedup_enabled:
+        with timed_stage("dedup"):
+            unique_jobs, duplicates = await asyncio.to_thread(deduplicate_jobs, all_jobs)
+
+    # Appliquer les filtres avancés
+    with timed_stage("filter"):
+        filtered_jobs = filter_jobs(
+            unique_jobs,
+            salary_min=request.salary_min,
+            salary_max=request.salary_max,
+            experience_level=request.experience_level
+        )
+
+    # Trier les résultats
+    with timed_stage("sort"):
+        if sort_by == "relevance" and not ranked:
+            try:
+                sorted_jobs = await search_index.arank(request.keywords, filtered_jobs)
+            except sqlite3.Error:
+                sorted_jobs = filtered_jobs
+        else:
+            sorted_jobs = sort_jobs(filtered_jobs, sort_by=sort_by)
+    search_results.observe(len(sorted_jobs))
+
+    # Mettre en cache le jeu entier (avant pagination) : les pages suivantes
+    # et l'export ne font que le relire, tant qu'il couvre la page demandée
+    result_set = await result_cache.aput(
+        key,
+        sorted_jobs,
+        errors,
+        scraped_at=datetime.utcnow().isoformat() + "Z",
+        success=len(all_jobs) > 0 or len(errors) == 0,
+        duplicates=duplicates,
+        degraded_sources=circuit_breakers.degraded(request.sources or DEFAULT_SOURCES),
+        complete=complete,
+        pulled=pulled,
+        request=request.model_dump(mode="json", by_alias=True)
+    )
+
+    return result_set
+
+
+def build_search_response(
+    result_set: ResultSet,
+    page: int = 1,
+    limit: int = 20
+) -> SearchResponse:
+    """
+    Construit la réponse paginée d'un jeu de résultats.
+    """
+    paginated_jobs, total_pages, has_next, has_previous = paginate_jobs(
+        result_set.jobs, page=page, limit=limit
+    )
+
+    return SearchResponse(
+        success=result_set.success,
+        total_results=len(result_set.jobs),
+        # Seule la page renvoyée est convertie en modèle d'API
+        results=[job.to_offer() for job in paginated_jobs],
+        scraped_at=result_set.scraped_at,
+        errors=result_set.errors if result_set.errors else None,
+        page=page,
+        limit=limit,
+        total_pages=total_pages,
+        # Jeu tronqué : la page suivante tirera plus loin dans les sources
+        has_next=has_next or not result_set.complete,
+        has_previous=has_previous,
+        result_set_id=result_set.id,
+        duplicates_collapsed=result_set.duplicates,
+        degraded_sources=result_set.degraded_sources or None,
+        complete=result_set.complete
+    )
+
+
+def search_response(result_set: ResultSet, page: int = 1, limit: int = 20) -> Response:
+    """
+    Réponse HTTP d'une page de résultats.
+
+    La réponse est sérialisée directement : FastAPI ne revalide pas les
+    offres contre `response_model` (qui reste utilisé pour la documentation).
+    Si la requête est instrumentée, la durée de chaque étape est jointe dans
+    l'en-tête `Server-Timing`.
+    """
+    with timed_stage("serialize"):
+        response = build_search_response(result_set, page=page, limit=limit)
+        content = response.model_dump_json(by_alias=True)
+
+    headers = None
+    timing = current_timing.get()
+    if timing is not None:
+        headers = {"Server-Timing": timing.header()}
+    return Response(content=content, media_type="application/json", headers=headers)
+
+
 app = FastAPI(
     title="JobScraper API",
     description="API de scraping d'offres d'emploi depuis plusieurs sources",
     version="1.0.0",
     docs_url="/docs",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    lifespan=lifespan
 )
 
 # Configuration CORS pour le frontend
@@ -179,12 +651,19 @@ async def health_check():
     """
     Vérifie l'état de l'API.
 
+    Le statut passe à `degraded` tant qu'une source est écartée par son
+    disjoncteur (échecs répétés) ; l'état de chaque source déjà interrogée
+    est détaillé dans `sources`.
+
     Returns:
-        Status de l'API et timestamp
+        Status de l'API, timestamp et état des sources
     """
+    degraded = circuit_breakers.degraded()
     return HealthResponse(
-        status="ok",
-        timestamp=datetime.utcnow().isoformat() + "Z"
+        status="degraded" if degraded else "ok",
+        timestamp=datetime.utcnow().isoformat() + "Z",
+        degradedSources=degraded,
+        sources=circuit_breakers.snapshot()
     )
 
 
@@ -207,141 +686,291 @@ async def search_jobs(request: SearchRequest):
     - `sortBy`: Tri des résultats (date, salary, relevance)
     - `page`: Numéro de page (défaut: 1)
     - `limit`: Résultats par page (défaut: 20, max: 100)
+    - `deadlineMs`: Délai maximum en millisecondes ; les sources non terminées
+      sont annulées et signalées dans `errors`
+    - `mode`: `index` (défaut : recherche BM25 dans l'index local alimenté par
+      le crawler) ou `live` (scraping direct des sources)
+
+    La réponse contient un `resultSetId` : les pages suivantes peuvent être
+    demandées via `GET /api/search/{resultSetId}?page=N` sans re-scraper, et
+    le jeu exporté via `GET /api/export?resultSet={resultSetId}`.
+
+    Chaque source n'est lue que jusqu'aux offres nécessaires à la page
+    demandée, plus une fenêtre de tri (`SEARCH_SORT_WINDOW`) ; tant qu'un
+    jeu est tronqué, `hasNext` reste vrai et les pages plus lointaines
+    tirent de nouvelles offres des sources.
+
+    La réponse porte un en-tête `Server-Timing` (durée par source et par
+    étape du pipeline).
 
     Returns:
         Résultats paginés avec métadonnées
     """
-    global last_results
+    with request_timing():
+        return await run_search(request)
 
-    all_jobs: List[JobOffer] = []
-    errors: List[str] = []
 
-    # Déterminer les sources à scraper
-    sources = request.sources or ["remoteok", "jobicy"]
+async def run_search(request: SearchRequest) -> Response:
+    """Corps de `POST /api/search`, mesuré par `search_jobs`."""
+    page = request.page or 1
+    limit = request.limit or 20
+    needed = results_needed(page, limit)
 
-    # Créer les tâches de scraping avec retry
-    scraper_tasks = []
+    # Une recherche identique récente est resservie depuis le cache, si elle
+    # contient assez d'offres pour la page demandée
+    key = result_set_key(request)
+    result_set = await result_cache.aget_fresh(key)
+    if result_set is not None and result_set.covers(needed):
+        search_requests.inc(mode="cache")
+        return search_response(result_set, page=page, limit=limit)
 
-    if "remoteok" in sources:
-        scraper_tasks.append(("remoteok", retry_scraper(
-            scrape_remoteok,
-            "remoteok",
-            keywords=request.keywords,
-            location=request.location,
-            contract_type=request.contract_type
-        )))
+    pulled = max(needed, result_set.pulled * 2) if result_set is not None else needed
+    result_set = await compute_result_set(request, key, pulled)
+    return search_response(result_set, page=page, limit=limit)
 
-    if "welcometothejungle" in sources:
-        scraper_tasks.append(("welcometothejungle", retry_scraper(
-            scrape_welcometothejungle,
-            "welcometothejungle",
-            keywords=request.keywords,
-            location=request.location,
-            contract_type=request.contract_type,
-            remote=request.remote or False
-        )))
 
-    if "jobicy" in sources:
-        scraper_tasks.append(("jobicy", retry_scraper(
-            scrape_jobicy,
-            "jobicy",
-            keywords=request.keywords,
-            location=request.location,
-            contract_type=request.contract_type,
-            remote=request.remote or False
-        )))
+async def compute_result_set(request: SearchRequest, key: str, pulled: int) -> ResultSet:
+    """
+    Calcule (index ou scraping direct) et met en cache le jeu de résultats
+    d'une recherche, en tirant au plus `pulled` offres de chaque source.
+    """
+    # Déterminer les sources à scraper
+    sources = request.sources or DEFAULT_SOURCES
 
-    # Exécuter les scrapers en parallèle avec gestion des erreurs
-    for source_name, task in scraper_tasks:
+    use_index = request.mode == "index"
+    if use_index:
+        # Tant que le crawler n'a pas couvert récemment (deux intervalles de
+        # crawl) tout le flux de chaque source demandée, on scrape en direct
         try:
-            jobs = await task
+            use_index = set(sources) <= await search_index.acovered_sources(
+                max_age=CRAWL_MAX_AGE_INTERVALS * settings.crawler_interval
+            )
+        except sqlite3.Error:
+            use_index = False
+
+    search_requests.inc(mode="index" if use_index else "live")
+    if use_index:
+        # Recherche directe dans l'index, déjà classée par pertinence
+        with timed_stage("index"):
+            all_jobs, complete = await search_index_jobs(request, sources, pulled)
+        errors: List[str] = []
+    else:
+        with timed_stage("scrape"):
+            all_jobs, errors, complete = await scrape_sources(request, sources, pulled)
+        with timed_stage("index_update"):
+            await index_scraped_jobs(all_jobs)
+
+    return await finalize_results(
+        request, key, all_jobs, errors,
+        ranked=use_index, complete=complete, pulled=pulled
+    )
+
+
+def sse_event(event: str, data: Any) -> str:
+    """Formate un événement Server-Sent Events."""
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
+
+
+@app.get("/api/search/stream", tags=["Search"])
+async def search_jobs_stream(
+    keywords: str = Query(..., description="Mots-clés de recherche"),
+    location: Optional[str] = Query(None, description="Localisation souhaitée"),
+    sources: Optional[List[str]] = Query(None, description="Sources à interroger"),
+    contract_type: Optional[str] = Query(None, alias="contractType"),
+    remote: bool = Query(False),
+    salary_min: Optional[int] = Query(None, alias="salaryMin"),
+    salary_max: Optional[int] = Query(None, alias="salaryMax"),
+    experience_level: Optional[str] = Query(None, alias="experienceLevel"),
+    sort_by: str = Query("date", alias="sortBy"),
+    limit: int = Query(20, ge=1, le=1000),
+    deadline_ms: Optional[int] = Query(None, alias="deadlineMs", ge=1)
+):
+    """
+    Variante progressive de `POST /api/search` (Server-Sent Events).
+
+    Scrape les sources en direct et émet :
+    - un événement `source` par source, dès qu'elle a terminé, avec ses
+      offres déjà filtrées (`results`) ou son erreur (`error`) ;
+    - un événement final `done` contenant la réponse de recherche complète
+      (première page triée, totaux, erreurs, `resultSetId`).
+
+    Returns:
+        Flux `text/event-stream`
+    """
+    request = SearchRequest.model_validate({
+        "keywords": keywords,
+        "location": location,
+        "sources": sources or DEFAULT_SOURCES,
+        "contractType": contract_type,
+        "remote": remote,
+        "salaryMin": salary_min,
+        "salaryMax": salary_max,
+        "experienceLevel": experience_level,
+        "sortBy": sort_by,
+        "limit": limit,
+        "deadlineMs": deadline_ms,
+        "mode": "live"
+    })
+
+    search_requests.inc(mode="stream")
+
+    async def event_stream():
+        all_jobs: List[JobRecord] = []
+        errors: List[str] = []
+        failed: Set[str] = set()
+        pulled = results_needed(1, limit)
+        scraper_tasks = build_scraper_tasks(request, request.sources, pulled)
+
+        async for source_name, jobs, error in iter_scrapers(
+            scraper_tasks, deadline_ms=request.deadline_ms
+        ):
             all_jobs.extend(jobs)
-        except Exception as e:
-            error_msg = f"{source_name}: {str(e)}"
-            errors.append(error_msg)
+            if error:
+                errors.append(f"{source_name}: {error}")
+                failed.add(source_name)
+            batch = filter_jobs(
+                jobs,
+                salary_min=request.salary_min,
+                salary_max=request.salary_max,
+                experience_level=request.experience_level
+            )
+            yield sse_event("source", {
+                "source": source_name,
+                "count": len(batch),
+                "results": [job.to_dict(by_alias=True) for job in batch],
+                "error": error
+            })
+
+        await index_scraped_jobs(all_jobs)
+        result_set = await finalize_results(
+            request, result_set_key(request), all_jobs, errors,
+            complete=sources_exhausted(all_jobs, pulled, failed), pulled=pulled
+        )
+        response = build_search_response(result_set, page=1, limit=limit)
+        yield sse_event("done", response.model_dump(mode="json", by_alias=True))
 
-    # Appliquer les filtres avancés
-    filtered_jobs = filter_jobs(
-        all_jobs,
-        salary_min=request.salary_min,
-        salary_max=request.salary_max,
-        experience_level=request.experience_level
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
     )
 
-    # Trier les résultats
-    sorted_jobs = sort_jobs(filtered_jobs, sort_by=request.sort_by or "date")
 
-    # Sauvegarder tous les résultats pour l'export (avant pagination)
-    last_results = sorted_jobs
+@app.get("/api/search/{result_set_id}", response_model=SearchResponse, tags=["Search"])
+async def get_search_page(
+    result_set_id: str,
+    page: int = Query(1, ge=1, description="Numéro de page"),
+    limit: int = Query(20, ge=1, le=1000, description="Résultats par page")
+):
+    """
+    Retourne une page d'un jeu de résultats déjà calculé, sans re-scraper.
 
-    # Appliquer la pagination
-    page = request.page or 1
-    limit = request.limit or 20
-    paginated_jobs, total_pages, has_next, has_previous = paginate_jobs(
-        sorted_jobs, page=page, limit=limit
-    )
+    Si la page dépasse les offres tirées d'un jeu tronqué, les sources sont
+    relues plus loin (quota doublé au moins) : le jeu complété reçoit un
+    nouvel identifiant (`resultSetId` de la réponse), l'ancien reste lisible
+    jusqu'à son expiration.
 
-    scraped_at = datetime.utcnow().isoformat() + "Z"
+    Args:
+        result_set_id: Identifiant renvoyé par `POST /api/search` (`resultSetId`)
+        page: Numéro de page
+        limit: Résultats par page
 
-    return SearchResponse(
-        success=len(all_jobs) > 0 or len(errors) == 0,
-        total_results=len(sorted_jobs),
-        results=paginated_jobs,
-        scraped_at=scraped_at,
-        errors=errors if errors else None,
-        page=page,
-        limit=limit,
-        total_pages=total_pages,
-        has_next=has_next,
-        has_previous=has_previous
-    )
+    Returns:
+        Résultats paginés avec métadonnées
+    """
+    result_set = await result_cache.aget(result_set_id)
+    if result_set is None:
+        raise HTTPException(
+            status_code=404,
+            detail="Résultats expirés ou introuvables. Relancez la recherche."
+        )
+    needed = results_needed(page, limit)
+    if not result_set.covers(needed) and result_set.request is not None:
+        request = SearchRequest.model_validate(result_set.request)
+        result_set = await compute_result_set(
+            request, result_set_key(request), max(needed, result_set.pulled * 2)
+        )
+    return search_response(result_set, page=page, limit=limit)
+
+
+# Formats d'export : (sérialiseur, type MIME, extension)
+EXPORT_FORMATS = {
+    "csv": (iter_csv, "text/csv; charset=utf-8", "csv"),
+    "json": (iter_json, "application/json", "json"),
+    "ndjson": (iter_ndjson, "application/x-ndjson", "ndjson"),
+}
 
 
 @app.get("/api/export", tags=["Export"])
 async def export_results(
-    format: str = Query("csv", description="Format d'export: 'csv' ou 'json'")
+    request: Request,
+    result_set_id: str = Query(
+        ...,
+        alias="resultSet",
+        description="Identifiant du jeu de résultats (`resultSetId` de la recherche)"
+    ),
+    format: str = Query("csv", description="Format d'export: 'csv', 'json' ou 'ndjson'")
 ):
     """
-    Exporte les derniers résultats de recherche.
+    Exporte un jeu de résultats de recherche.
+
+    Le fichier est envoyé en streaming, offre par offre, et compressé en gzip
+    à la volée si le client l'accepte (`Accept-Encoding: gzip`).
 
     Args:
-        format: Format d'export souhaité ('csv' ou 'json')
+        result_set_id: Identifiant renvoyé par `POST /api/search`
+        format: Format d'export souhaité ('csv', 'json' ou 'ndjson')
 
     Returns:
         Fichier téléchargeable au format demandé
     """
-    global last_results
+    export_format = EXPORT_FORMATS.get(format.lower())
+    if export_format is None:
+        raise HTTPException(
+            status_code=400,
+            detail="Format non supporté. Utilisez 'csv', 'json' ou 'ndjson'."
+        )
+
+    result_set = await result_cache.aget(result_set_id)
 
-    if not last_results:
+    if result_set is None:
         raise HTTPException(
             status_code=404,
-            detail="Aucun résultat à exporter. Effectuez d'abord une recherche."
+            detail="Résultats expirés ou introuvables. Relancez la recherche."
         )
 
-    if format.lower() == "csv":
-        content = export_to_csv(last_results)
-        return Response(
-            content=content,
-            media_type="text/csv",
-            headers={
-                "Content-Disposition": "attachment; filename=job_offers.csv"
-            }
-        )
-    elif format.lower() == "json":
-        content = export_to_json(last_results)
-        return Response(
-            content=content,
-            media_type="application/json",
-            headers={
-                "Content-Disposition": "attachment; filename=job_offers.json"
-            }
-        )
-    else:
+    if not result_set.jobs:
         raise HTTPException(
-            status_code=400,
-            detail="Format non supporté. Utilisez 'csv' ou 'json'."
+            status_code=404,
+            detail="Aucun résultat à exporter. Effectuez d'abord une recherche."
         )
 
+    serializer, media_type, extension = export_format
+    body = encode_chunks(serializer(result_set.jobs))
+    headers = {
+        "Content-Disposition": f"attachment; filename=job_offers.{extension}",
+        "Vary": "Accept-Encoding"
+    }
+
+    if "gzip" in request.headers.get("accept-encoding", "").lower():
+        body = gzip_chunks(body)
+        headers["Content-Encoding"] = "gzip"
+
+    return StreamingResponse(body, media_type=media_type, headers=headers)
+
+
+@app.get("/api/metrics", tags=["Health"])
+async def metrics():
+    """
+    Métriques du processus au format texte Prometheus.
+
+    Histogrammes de durée par tentative de scraping (source, résultat) et
+    par étape du pipeline, nombre d'offres par source et par recherche,
+    compteurs de nouvelles tentatives, d'erreurs (par type) et de recherches
+    (par mode : cache, index, live, stream).
+    """
+    return Response(content=registry.render(), media_type=PROMETHEUS_CONTENT_TYPE)
+
 
 @app.get("/", tags=["Root"])
 async def root():
@@ -1,7 +1,59 @@
-from pydantic import BaseModel, Field
-from typing import Optional, List
+from pydantic import BaseModel, Field, FieldSerializationInfo, field_serializer, model_validator
+from typing import Any, Dict, Optional, List, Literal
 from datetime import datetime
 import uuid
+import re
+
+from app.services.html_text import clean_description
+
+SALARY_NUMBER_RE = re.compile(r"(\d+(?:\.\d+)?)(K?)")
+
+# Longueur du texte de description servi aux clients
+DESCRIPTION_MAX_CHARS = 500
+# Longueur du HTML brut de description conservé par offre
+DESCRIPTION_HTML_MAX_CHARS = 8000
+
+# Espace de noms des identifiants d'offres (uuid5 de source + URL)
+JOB_ID_NAMESPACE = uuid.UUID("6f1c1f52-3c36-4d5e-9a7e-0c8d3a3b9f10")
+
+
+def utcnow_iso() -> str:
+    """Horodatage UTC au format ISO 8601 (suffixe Z)."""
+    return datetime.utcnow().isoformat() + "Z"
+
+
+def job_id(source: str, url: str, title: str = "", company: str = "") -> str:
+    """
+    Identifiant stable d'une offre : la même offre garde le même id d'une
+    recherche, d'un cache ou d'un export à l'autre.
+
+    Le titre et l'entreprise ne servent que si l'URL est inconnue.
+    """
+    name = f"{source}|{url}" if url else f"{source}|{title}|{company}"
+    return str(uuid.uuid5(JOB_ID_NAMESPACE, name))
+
+
+def parse_salary_range(salary_str: Optional[str]) -> tuple[Optional[int], Optional[int]]:
+    """
+    Extrait (minimum, maximum) d'un salaire en texte libre.
+
+    Le suffixe "K" ne multiplie que le nombre qu'il suit. Retourne
+    (None, None) si aucun nombre n'est trouvé.
+    """
+    if not salary_str:
+        return None, None
+
+    salary_clean = salary_str.replace(",", "").replace(" ", "").upper()
+
+    values = [
+        int(float(number) * (1000 if suffix else 1))
+        for number, suffix in SALARY_NUMBER_RE.findall(salary_clean)
+    ]
+    if not values:
+        return None, None
+    if len(values) >= 2:
+        return values[0], values[1]
+    return values[0], values[0]
 
 
 class JobOffer(BaseModel):
@@ -11,11 +63,16 @@ class JobOffer(BaseModel):
     company: str
     location: str
     salary: Optional[str] = None
+    salary_min: Optional[int] = Field(None, alias="salaryMin")
+    salary_max: Optional[int] = Field(None, alias="salaryMax")
+    salary_currency: Optional[str] = Field(None, alias="salaryCurrency")
     contract_type: Optional[str] = Field(None, alias="contractType")
     experience_level: Optional[str] = Field(None, alias="experienceLevel")
+    # HTML brut de la source, converti en texte à la sérialisation
     description: Optional[str] = None
     url: str
     source: str
+    sources: Optional[List[str]] = None
     posted_at: Optional[str] = Field(None, alias="postedAt")
     scraped_at: str = Field(default_factory=lambda: datetime.utcnow().isoformat() + "Z", alias="scrapedAt")
     tags: Optional[List[str]] = None
@@ -26,6 +83,140 @@ class JobOffer(BaseModel):
             datetime: lambda v: v.isoformat() + "Z"
         }
 
+    @model_validator(mode="after")
+    def _parse_salary_text(self) -> "JobOffer":
+        """Structure une seule fois un salaire fourni uniquement en texte."""
+        if self.salary and self.salary_min is None and self.salary_max is None:
+            self.salary_min, self.salary_max = parse_salary_range(self.salary)
+        return self
+
+    @field_serializer("description")
+    def _serialize_description(
+        self, description: Optional[str], info: FieldSerializationInfo
+    ) -> Optional[str]:
+        """
+        Nettoie la description HTML au moment de la sérialisation.
+
+        Les scrapers conservent le HTML brut : seules les offres réellement
+        servies (page de résultats, export, flux) sont converties en texte.
+        Une sérialisation `round_trip` (stockage) garde le HTML brut.
+        """
+        if not description or info.round_trip:
+            return description
+        return clean_description(description, DESCRIPTION_MAX_CHARS) or None
+
+    @property
+    def salary_value(self) -> Optional[int]:
+        """Salaire annuel représentatif (moyenne de la fourchette)."""
+        if self.salary_min is not None and self.salary_max is not None:
+            return (self.salary_min + self.salary_max) // 2
+        if self.salary_min is not None:
+            return self.salary_min
+        return self.salary_max
+
+
+# Champs de JobOffer, dans l'ordre de sérialisation, et leurs alias
+JOB_FIELDS = tuple(JobOffer.model_fields)
+JOB_ALIASES = {
+    name: field.alias or name for name, field in JobOffer.model_fields.items()
+}
+_FIELD_BY_KEY = {**{name: name for name in JOB_FIELDS}, **{
+    alias: name for name, alias in JOB_ALIASES.items()
+}}
+
+
+class JobRecord:
+    """
+    Représentation interne compacte d'une offre d'emploi.
+
+    C'est elle qui circule dans le pipeline (scrapers, filtres, tri,
+    déduplication, caches, index, exports) ; elle n'est convertie en
+    `JobOffer` que pour la page renvoyée par l'API. L'identifiant est dérivé
+    de la source et de l'URL (voir `job_id`).
+    """
+
+    __slots__ = JOB_FIELDS
+
+    def __init__(
+        self,
+        title: str,
+        company: str,
+        location: str,
+        url: str,
+        source: str,
+        salary: Optional[str] = None,
+        salary_min: Optional[int] = None,
+        salary_max: Optional[int] = None,
+        salary_currency: Optional[str] = None,
+        contract_type: Optional[str] = None,
+        experience_level: Optional[str] = None,
+        description: Optional[str] = None,
+        sources: Optional[List[str]] = None,
+        posted_at: Optional[str] = None,
+        scraped_at: Optional[str] = None,
+        tags: Optional[List[str]] = None
+    ):
+        self.id = job_id(source, url, title, company)
+        self.title = title
+        self.company = company
+        self.location = location
+        self.salary = salary
+        if salary and salary_min is None and salary_max is None:
+            salary_min, salary_max = parse_salary_range(salary)
+        self.salary_min = salary_min
+        self.salary_max = salary_max
+        self.salary_currency = salary_currency
+        self.contract_type = contract_type
+        self.experience_level = experience_level
+        self.description = description
+        self.url = url
+        self.source = source
+        self.sources = sources
+        self.posted_at = posted_at
+        self.scraped_at = scraped_at or utcnow_iso()
+        self.tags = tags
+
+    # Même calcul que pour le modèle d'API
+    salary_value = JobOffer.salary_value
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "JobRecord":
+        """Reconstruit une offre sérialisée (noms de champs ou alias ; l'id est recalculé)."""
+        fields = {_FIELD_BY_KEY[key]: value for key, value in data.items() if key in _FIELD_BY_KEY}
+        fields.pop("id", None)
+        return cls(**fields)
+
+    def to_dict(self, by_alias: bool = False, raw: bool = False) -> Dict[str, Any]:
+        """
+        Sérialise l'offre comme `JobOffer.model_dump`.
+
+        Args:
+            by_alias: Clés camelCase de l'API
+            raw: Garder la description HTML brute (stockage) au lieu du texte
+        """
+        data = {
+            JOB_ALIASES[name] if by_alias else name: getattr(self, name)
+            for name in JOB_FIELDS
+        }
+        if not raw and self.description:
+            key = JOB_ALIASES["description"] if by_alias else "description"
+            data[key] = clean_description(self.description, DESCRIPTION_MAX_CHARS) or None
+        return data
+
+    def to_offer(self) -> JobOffer:
+        """Modèle d'API de l'offre (sans revalidation)."""
+        return JobOffer.model_construct(**{name: getattr(self, name) for name in JOB_FIELDS})
+
+    def replace(self, **changes: Any) -> "JobRecord":
+        """Copie de l'offre avec quelques champs modifiés."""
+        record = object.__new__(JobRecord)
+        for name in JOB_FIELDS:
+            setattr(record, name, changes.get(name, getattr(self, name)))
+        return record
+
+    def __repr__(self) -> str:
+        return f"JobRecord(id={self.id!r}, source={self.source!r}, title={self.title!r})"
+
 
 class SearchRequest(BaseModel):
     """Modèle pour une requête de recherche"""
@@ -40,10 +231,18 @@ class SearchRequest(BaseModel):
     sort_by: Optional[str] = Field(default="date", alias="sortBy")
     page: Optional[int] = Field(default=1, ge=1)
     limit: Optional[int] = Field(default=20, ge=1, le=1000)
+    deadline_ms: Optional[int] = Field(None, alias="deadlineMs", ge=1)
+    mode: Literal["index", "live"] = "index"
 
 
 class SearchResponse(BaseModel):
-    """Modèle pour la réponse de recherche"""
+    """
+    Modèle pour la réponse de recherche
+
+    Les sources ne sont lues que jusqu'aux offres nécessaires : tant que
+    `complete` est faux, `totalResults` et `totalPages` ne comptent que les
+    offres déjà tirées et sont des minimums.
+    """
     success: bool
     total_results: int = Field(alias="totalResults")
     results: List[JobOffer]
@@ -54,6 +253,22 @@ class SearchResponse(BaseModel):
     total_pages: int = Field(default=1, alias="totalPages")
     has_next: bool = Field(default=False, alias="hasNext")
     has_previous: bool = Field(default=False, alias="hasPrevious")
+    result_set_id: Optional[str] = Field(None, alias="resultSetId")
+    duplicates_collapsed: int = Field(default=0, alias="duplicatesCollapsed")
+    degraded_sources: Optional[List[str]] = Field(None, alias="degradedSources")
+    # Faux si les sources ont encore des offres non lues
+    complete: bool = True
+
+    class Config:
+        populate_by_name = True
+
+
+class SourceHealth(BaseModel):
+    """État du disjoncteur d'une source"""
+    state: Literal["closed", "open", "half_open"]
+    failures: int = 0
+    retry_in: float = Field(default=0.0, alias="retryIn")
+    last_error: Optional[str] = Field(None, alias="lastError")
 
     class Config:
         populate_by_name = True
@@ -63,3 +278,8 @@ class HealthResponse(BaseModel):
     """Modèle pour le health check"""
     status: str
     timestamp: str
+    degraded_sources: List[str] = Field(default_factory=list, alias="degradedSources")
+    sources: Dict[str, SourceHealth] = Field(default_factory=dict)
+
+    class Config:
+        populate_by_name = True
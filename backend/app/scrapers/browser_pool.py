@@ -0,0 +1,204 @@
+import asyncio
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, List
+from urllib.parse import urlsplit
+
+from app.core.config import settings
+
+try:
+    from playwright.async_api import Page, async_playwright
+    PLAYWRIGHT_AVAILABLE = True
+except ImportError:
+    PLAYWRIGHT_AVAILABLE = False
+
+USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
+VIEWPORT = {"width": 1280, "height": 800}
+
+# Ressources jamais lues par les scrapers : interceptées et abandonnées
+BLOCKED_RESOURCE_TYPES = {"image", "media", "font", "stylesheet", "texttrack", "eventsource"}
+# Mesure d'audience, publicité et outils de support
+TRACKER_DOMAINS = (
+    "google-analytics.com", "googletagmanager.com", "doubleclick.net",
+    "googlesyndication.com", "facebook.net", "facebook.com", "hotjar.com",
+    "segment.com", "segment.io", "intercom.io", "intercomcdn.com",
+    "datadoghq.com", "sentry.io", "linkedin.com", "licdn.com", "bing.com",
+    "criteo.com", "criteo.net", "tiktok.com", "axeptio.eu", "didomi.io",
+)
+
+
+def is_blocked_request(resource_type: str, url: str) -> bool:
+    """Indique si une requête de page peut être abandonnée sans perte."""
+    if resource_type in BLOCKED_RESOURCE_TYPES:
+        return True
+    host = urlsplit(url).hostname or ""
+    return any(host == domain or host.endswith("." + domain) for domain in TRACKER_DOMAINS)
+
+
+async def _block_heavy_resources(route) -> None:
+    request = route.request
+    if is_blocked_request(request.resource_type, request.url):
+        await route.abort()
+    else:
+        await route.continue_()
+
+
+class _PooledContext:
+    """Contexte navigateur du pool et son compteur de pages servies."""
+
+    __slots__ = ("context", "generation", "pages_served")
+
+    def __init__(self, context, generation: int):
+        self.context = context
+        self.generation = generation
+        self.pages_served = 0
+
+
+class BrowserPool:
+    """
+    Pool persistant de contextes Chromium pilotés par l'API async de Playwright.
+
+    Le navigateur est lancé une seule fois puis réutilisé : chaque recherche
+    ne coûte qu'une navigation. Les contextes sont recyclés après
+    `max_pages_per_context` pages, et le navigateur est relancé
+    automatiquement s'il a planté. Si `block_resources` est actif, les
+    contextes abandonnent images, médias, polices, feuilles de style et
+    traceurs : seuls le HTML et les scripts du site sont chargés.
+    """
+
+    def __init__(self, size: int, max_pages_per_context: int, block_resources: bool = True):
+        self.size = max(1, size)
+        self.max_pages_per_context = max(1, max_pages_per_context)
+        self.block_resources = block_resources
+        self._slots = asyncio.Semaphore(self.size)
+        self._lock = asyncio.Lock()
+        self._idle: List[_PooledContext] = []
+        self._playwright = None
+        self._browser = None
+        self._generation = 0
+
+    @property
+    def running(self) -> bool:
+        """Indique si le navigateur est lancé et connecté."""
+        return self._browser is not None and self._browser.is_connected()
+
+    async def start(self) -> None:
+        """
+        Lance le navigateur et préchauffe les contextes du pool.
+
+        Sans effet si le navigateur tourne déjà ; le relance s'il a planté.
+        """
+        async with self._lock:
+            if self.running:
+                return
+            if not PLAYWRIGHT_AVAILABLE:
+                raise RuntimeError("Playwright n'est pas installé")
+
+            await self._shutdown()
+            self._playwright = await async_playwright().start()
+            self._browser = await self._playwright.chromium.launch(headless=True)
+            self._generation += 1
+
+            for _ in range(self.size):
+                self._idle.append(await self._new_context())
+
+    async def close(self) -> None:
+        """Ferme tous les contextes, le navigateur et Playwright."""
+        async with self._lock:
+            await self._shutdown()
+
+    @asynccontextmanager
+    async def page(self) -> AsyncIterator["Page"]:
+        """
+        Emprunte une page dans un contexte du pool.
+
+        La page est fermée à la sortie et son contexte rendu au pool, ou
+        jeté s'il a servi trop de pages ou si une erreur Playwright l'a
+        laissé dans un état douteux.
+        """
+        async with self._slots:
+            pooled = await self._checkout()
+            healthy = True
+            page = None
+            try:
+                page = await pooled.context.new_page()
+                yield page
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                healthy = False
+                raise
+            finally:
+                pooled.pages_served += 1
+                if page is not None:
+                    try:
+                        await page.close()
+                    except Exception:
+                        healthy = False
+                await self._release(pooled, healthy)
+
+    async def _checkout(self) -> _PooledContext:
+        """Retourne un contexte chaud, en relançant le navigateur si besoin."""
+        if not self.running:
+            await self.start()
+
+        while self._idle:
+            pooled = self._idle.pop()
+            if pooled.generation == self._generation:
+                return pooled
+            await self._close_context(pooled)
+
+        return await self._new_context()
+
+    async def _release(self, pooled: _PooledContext, healthy: bool) -> None:
+        """Rend un contexte au pool ou le recycle."""
+        reusable = (
+            healthy
+            and self.running
+            and pooled.generation == self._generation
+            and pooled.pages_served < self.max_pages_per_context
+        )
+        if reusable:
+            self._idle.append(pooled)
+        else:
+            await self._close_context(pooled)
+
+    async def _new_context(self) -> _PooledContext:
+        context = await self._browser.new_context(
+            user_agent=USER_AGENT,
+            viewport=VIEWPORT
+        )
+        if self.block_resources:
+            await context.route("**/*", _block_heavy_resources)
+        return _PooledContext(context, self._generation)
+
+    async def _close_context(self, pooled: _PooledContext) -> None:
+        try:
+            await pooled.context.close()
+        except Exception:
+            pass
+
+    async def _shutdown(self) -> None:
+        idle, self._idle = self._idle, []
+        for pooled in idle:
+            await self._close_context(pooled)
+
+        if self._browser is not None:
+            try:
+                await self._browser.close()
+            except Exception:
+                pass
+            self._browser = None
+
+        if self._playwright is not None:
+            try:
+                await self._playwright.stop()
+            except Exception:
+                pass
+            self._playwright = None
+
+
+browser_pool = BrowserPool(
+    size=settings.browser_pool_size,
+    max_pages_per_context=settings.browser_context_max_pages,
+    block_resources=settings.browser_block_resources
+)
@@ -0,0 +1,84 @@
+import asyncio
+import json
+from typing import Optional
+
+import httpx
+
+
+class ScraperError(Exception):
+    """
+    Échec d'un scraper, rattaché à sa source.
+
+    `retryable` indique si une nouvelle tentative a des chances d'aboutir
+    (erreur transitoire) : `retry_scraper` ne relance que celles-là.
+    """
+
+    retryable = False
+
+    def __init__(self, source: str, message: str):
+        super().__init__(message)
+        self.source = source
+
+
+class ScraperHTTPError(ScraperError):
+    """Réponse HTTP en erreur de la source."""
+
+    def __init__(self, source: str, message: str, status_code: int):
+        super().__init__(source, message)
+        self.status_code = status_code
+        # 5xx et 429 sont transitoires ; un 4xx ne changera pas en réessayant
+        self.retryable = status_code >= 500 or status_code == 429
+
+
+class ScraperConnectionError(ScraperError):
+    """Connexion impossible ou interrompue."""
+
+    retryable = True
+
+
+class ScraperTimeoutError(ScraperError):
+    """
+    Délai dépassé.
+
+    Non relancé : la tentative a déjà consommé tout son délai, réessayer
+    ne ferait que le doubler.
+    """
+
+
+class ScraperParseError(ScraperError):
+    """Réponse illisible (JSON invalide, format inattendu)."""
+
+
+class CircuitOpenError(ScraperError):
+    """Source mise de côté par son disjoncteur après des échecs répétés."""
+
+
+def scraper_error(source: str, label: str, error: Exception) -> ScraperError:
+    """
+    Convertit une exception levée pendant un scraping en erreur typée.
+
+    Args:
+        source: Nom de la source
+        label: Nom affiché de la source dans les messages
+        error: Exception d'origine
+
+    Returns:
+        Erreur typée, avec un message lisible
+    """
+    if isinstance(error, ScraperError):
+        return error
+    if isinstance(error, httpx.HTTPStatusError):
+        status_code = error.response.status_code
+        return ScraperHTTPError(source, f"{label} API error: {status_code}", status_code)
+    if isinstance(error, (httpx.TimeoutException, asyncio.TimeoutError)):
+        return ScraperTimeoutError(source, f"{label} timeout")
+    if isinstance(error, httpx.RequestError):
+        return ScraperConnectionError(source, f"{label} connection error: {error}")
+    if isinstance(error, (json.JSONDecodeError, UnicodeDecodeError)):
+        return ScraperParseError(source, f"{label} invalid response: {error}")
+    return ScraperError(source, f"{label} scraping error: {error}")
+
+
+def is_retryable(error: Optional[BaseException]) -> bool:
+    """Indique si une erreur de scraping justifie une nouvelle tentative."""
+    return isinstance(error, ScraperError) and error.retryable
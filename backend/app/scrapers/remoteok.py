@@ -1,10 +1,12 @@
-import httpx
-import asyncio
+import json
 from typing import List, Optional
-from datetime import datetime
-import uuid
 
-from app.models import JobOffer
+from app.models import DESCRIPTION_HTML_MAX_CHARS, JobRecord, utcnow_iso
+from app.scrapers.errors import scraper_error
+from app.scrapers.stream import JobStream, take
+from app.services.feed_cache import feed_cache
+from app.services.json_stream import iter_array_items
+from app.services.keyword_matcher import compile_keywords
 
 REMOTEOK_API_URL = "https://remoteok.com/api"
 
@@ -15,107 +17,115 @@ HEADERS = {
 }
 
 
-async def scrape_remoteok(
+async def iter_remoteok(
     keywords: str,
     location: Optional[str] = None,
-    contract_type: Optional[str] = None,
-    max_results: int = 50
-) -> List[JobOffer]:
+    contract_type: Optional[str] = None
+) -> JobStream:
     """
-    Scrape les offres d'emploi depuis RemoteOK API.
+    Produit une à une les offres RemoteOK correspondant aux mots-clés.
+
+    Le flux s'arrête quand l'appelant cesse de tirer (voir `take`) : les
+    offres suivantes du flux ne sont ni filtrées ni construites.
 
     Args:
         keywords: Mots-clés de recherche
         location: Localisation (ignoré car RemoteOK = remote only)
         contract_type: Type de contrat
-        max_results: Nombre maximum de résultats
 
-    Returns:
-        Liste des offres d'emploi
+    Yields:
+        Offres d'emploi, dans l'ordre du flux (les plus récentes d'abord)
     """
-    jobs = []
-    keywords_lower = keywords.lower()
+    # Un seul horodatage pour toutes les offres du scraping
+    scraped_at = utcnow_iso()
+    matcher = compile_keywords(keywords)
 
     try:
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.get(REMOTEOK_API_URL, headers=HEADERS)
-            response.raise_for_status()
+        feed = await feed_cache.get("remoteok", REMOTEOK_API_URL, headers=HEADERS)
 
-            data = response.json()
+        # Le flux est lu offre par offre, sans être décodé en entier : seule
+        # l'offre courante est décodée, et seulement si elle peut correspondre
+        # aux mots-clés (descriptions HTML volumineuses)
+        for raw_job in iter_array_items(feed.body):
+            if not matcher.may_match(raw_job):
+                continue
+            job_data = json.loads(raw_job)
 
             # Le premier élément est un message légal, on le skip
-            if isinstance(data, list) and len(data) > 0:
-                job_listings = data[1:] if isinstance(data[0], dict) and "legal" in str(data[0]).lower() else data
-            else:
-                job_listings = data if isinstance(data, list) else []
-
-            for job_data in job_listings:
-                if not isinstance(job_data, dict):
-                    continue
-
-                # Filtrer par mots-clés
-                title = job_data.get("position", "")
-                company = job_data.get("company", "")
-                description = job_data.get("description", "")
-                tags = job_data.get("tags", [])
-
-                # Vérifier si les mots-clés correspondent
-                search_text = f"{title} {company} {description} {' '.join(tags)}".lower()
-                if keywords_lower not in search_text:
-                    # Vérifier chaque mot-clé individuellement
-                    keywords_list = keywords_lower.split()
-                    if not any(kw in search_text for kw in keywords_list):
-                        continue
-
-                # Extraire le salaire
-                salary = None
-                salary_min = job_data.get("salary_min")
-                salary_max = job_data.get("salary_max")
-                if salary_min and salary_max:
-                    salary = f"${salary_min:,}-${salary_max:,}"
-                elif salary_min:
-                    salary = f"${salary_min:,}+"
-                elif salary_max:
-                    salary = f"Up to ${salary_max:,}"
-
-                # Extraire la date de publication
-                posted_at = None
-                if job_data.get("date"):
-                    posted_at = job_data.get("date")
-
-                # Construire l'URL
-                slug = job_data.get("slug", "")
-                url = f"https://remoteok.com/remote-jobs/{slug}" if slug else job_data.get("url", "")
-
-                job = JobOffer(
-                    id=str(uuid.uuid4()),
-                    title=title or "Unknown Position",
-                    company=company or "Unknown Company",
-                    location="Remote",
-                    salary=salary,
-                    contract_type=contract_type or "Full-time",
-                    experience_level=None,
-                    description=description[:500] if description else None,
-                    url=url,
-                    source="remoteok",
-                    posted_at=posted_at,
-                    scraped_at=datetime.utcnow().isoformat() + "Z",
-                    tags=tags[:10] if tags else None
-                )
-
-                jobs.append(job)
-
-                if len(jobs) >= max_results:
-                    break
-
-            # Délai anti-ban
-            await asyncio.sleep(1)
-
-    except httpx.HTTPStatusError as e:
-        raise Exception(f"RemoteOK API error: {e.response.status_code}")
-    except httpx.RequestError as e:
-        raise Exception(f"RemoteOK connection error: {str(e)}")
+            if not isinstance(job_data, dict) or "legal" in job_data:
+                continue
+
+            # Filtrer par mots-clés
+            title = job_data.get("position", "")
+            company = job_data.get("company", "")
+            description = job_data.get("description", "")
+            tags = job_data.get("tags", [])
+
+            # Vérifier si les mots-clés correspondent
+            if not matcher.matches(title, company, description, *tags):
+                continue
+
+            # Extraire le salaire
+            salary = None
+            salary_min = job_data.get("salary_min") or None
+            salary_max = job_data.get("salary_max") or None
+            if salary_min and salary_max:
+                salary = f"${salary_min:,}-${salary_max:,}"
+            elif salary_min:
+                salary = f"${salary_min:,}+"
+            elif salary_max:
+                salary = f"Up to ${salary_max:,}"
+
+            # Extraire la date de publication
+            posted_at = None
+            if job_data.get("date"):
+                posted_at = job_data.get("date")
+
+            # Construire l'URL
+            slug = job_data.get("slug", "")
+            url = f"https://remoteok.com/remote-jobs/{slug}" if slug else job_data.get("url", "")
+
+            job = JobRecord(
+                title=title or "Unknown Position",
+                company=company or "Unknown Company",
+                location="Remote",
+                salary=salary,
+                salary_min=salary_min,
+                salary_max=salary_max,
+                salary_currency="USD" if salary_min or salary_max else None,
+                contract_type=contract_type or "Full-time",
+                experience_level=None,
+                # HTML brut : nettoyé seulement si l'offre est servie
+                description=description[:DESCRIPTION_HTML_MAX_CHARS] if description else None,
+                url=url,
+                source="remoteok",
+                posted_at=posted_at,
+                scraped_at=scraped_at,
+                tags=tags[:10] if tags else None
+            )
+
+            yield job
+
     except Exception as e:
-        raise Exception(f"RemoteOK scraping error: {str(e)}")
+        raise scraper_error("remoteok", "RemoteOK", e) from e
 
-    return jobs
+
+async def scrape_remoteok(
+    keywords: str,
+    location: Optional[str] = None,
+    contract_type: Optional[str] = None,
+    max_results: int = 50
+) -> List[JobRecord]:
+    """
+    Scrape les offres d'emploi depuis RemoteOK API.
+
+    Args:
+        keywords: Mots-clés de recherche
+        location: Localisation (ignoré car RemoteOK = remote only)
+        contract_type: Type de contrat
+        max_results: Nombre maximum de résultats
+
+    Returns:
+        Liste des offres d'emploi
+    """
+    return await take(iter_remoteok(keywords, location, contract_type), max_results)
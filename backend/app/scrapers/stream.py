@@ -0,0 +1,33 @@
+from typing import AsyncIterator, List
+
+from app.models import JobRecord
+
+# Flux d'offres d'un scraper, produites une à une
+JobStream = AsyncIterator[JobRecord]
+
+
+async def take(jobs: JobStream, limit: int) -> List[JobRecord]:
+    """
+    Tire au plus `limit` offres d'un flux, puis le ferme.
+
+    Le flux est fermé dès que la limite est atteinte : le scraper s'arrête
+    là (les offres suivantes ne sont ni lues ni construites) et libère ses
+    ressources (page du navigateur…).
+
+    Args:
+        jobs: Flux d'offres (générateur async d'un scraper)
+        limit: Nombre maximum d'offres
+
+    Returns:
+        Liste des offres tirées
+    """
+    results: List[JobRecord] = []
+    try:
+        if limit > 0:
+            async for job in jobs:
+                results.append(job)
+                if len(results) >= limit:
+                    break
+    finally:
+        await jobs.aclose()
+    return results
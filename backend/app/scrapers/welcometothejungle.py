@@ -1,169 +1,297 @@
 import asyncio
 from typing import List, Optional
-from datetime import datetime
 from urllib.parse import quote_plus
-import uuid
 import re
-import subprocess
-import json
-import sys
-import tempfile
-import os
 
-from app.models import JobOffer
+from app.core.config import settings
+from app.models import JobRecord, utcnow_iso
+from app.scrapers.browser_pool import browser_pool
+from app.scrapers.errors import ScraperTimeoutError, scraper_error
+from app.scrapers.stream import JobStream, take
+from app.scrapers.wttj_details import job_detail_enricher
+from app.services.keyword_matcher import compile_keywords
+from app.services.rate_limiter import rate_limiter
 
+WTTJ_BASE_URL = "https://www.welcometothejungle.com"
+JOB_LINK_SELECTOR = 'a[href*="/companies/"][href*="/jobs/"]'
 
-# Script de scraping à exécuter dans un processus séparé
-SCRAPER_SCRIPT = '''
-import sys
-import json
-from playwright.sync_api import sync_playwright
-import re
+# Défilement de la liste (chargement progressif des offres)
+MAX_SCROLLS = 10
+SCROLL_TIMEOUT_MS = 3000
+# Liens chargés (et enrichis) par lot dans `iter_welcometothejungle`
+BATCH_SIZE = 20
 
-def scrape(url, max_results):
-    jobs = []
+# Nombre de liens d'offres affichés au-delà de `count`
+MORE_LINKS_JS = f"count => document.querySelectorAll('{JOB_LINK_SELECTOR}').length > count"
+HREFS_JS = "links => links.map(link => link.getAttribute('href') || '')"
+
+
+async def _open_search(page, url: str) -> bool:
+    """
+    Charge la page de recherche jusqu'aux premiers liens d'offres.
+
+    La page n'est attendue que jusqu'au HTML (`domcontentloaded`) puis
+    jusqu'aux premiers liens d'offres, sans attendre la fin du trafic réseau.
+
+    Returns:
+        False si la recherche n'affiche aucune offre
+    """
+    await rate_limiter.acquire(url)
+    await page.goto(url, wait_until="domcontentloaded", timeout=30000)
     try:
-        with sync_playwright() as p:
-            browser = p.chromium.launch(headless=True)
-            context = browser.new_context(
-                user_agent="Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
-                viewport={"width": 1920, "height": 1080}
+        await page.wait_for_selector(JOB_LINK_SELECTOR, timeout=10000)
+    except Exception:
+        # Aucune offre affichée pour cette recherche
+        return False
+    return True
+
+
+async def _load_job_links(page, count: int) -> List[str]:
+    """
+    Défile la liste tant qu'elle affiche moins de `count` offres et que le
+    défilement en fait apparaître de nouvelles.
+
+    Args:
+        page: Page de recherche déjà ouverte (voir `_open_search`)
+        count: Nombre de liens d'offres distincts voulus
+
+    Returns:
+        Attributs href des liens d'offres affichés
+    """
+    hrefs = await page.eval_on_selector_all(JOB_LINK_SELECTOR, HREFS_JS)
+    for _ in range(MAX_SCROLLS):
+        if len(set(hrefs)) >= count:
+            break
+        await page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
+        try:
+            await page.wait_for_function(
+                MORE_LINKS_JS, arg=len(hrefs), timeout=SCROLL_TIMEOUT_MS
             )
-            page = context.new_page()
+        except Exception:
+            # Plus aucune offre ne se charge : fin de la liste
+            break
+        hrefs = await page.eval_on_selector_all(JOB_LINK_SELECTOR, HREFS_JS)
+    return hrefs
 
-            try:
-                page.goto(url, wait_until="networkidle", timeout=30000)
-                page.wait_for_selector('a[href*="/jobs/"]', timeout=10000)
 
-                for _ in range(3):
-                    page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
-                    page.wait_for_timeout(500)
+async def _extract_job_links(page, url: str, max_results: int) -> List[dict]:
+    """
+    Charge la page de recherche et extrait les liens d'offres.
 
-                links = page.query_selector_all('a[href*="/companies/"][href*="/jobs/"]')
+    La page n'est défilée que tant qu'il manque des offres.
 
-                seen = set()
-                for link in links:
-                    if len(jobs) >= max_results:
-                        break
+    Args:
+        page: Page Playwright empruntée au pool
+        url: URL de recherche Welcome to the Jungle
+        max_results: Nombre maximum de résultats
 
-                    href = link.get_attribute('href') or ""
-                    if not href or href in seen or "/companies/" not in href or "/jobs/" not in href:
-                        continue
+    Returns:
+        Liste de dicts {title, company, url}
+    """
+    if not await _open_search(page, url):
+        return []
+    return _parse_job_links(await _load_job_links(page, max_results), max_results)
 
-                    seen.add(href)
 
-                    title_match = re.search(r'/jobs/([^/?]+)', href)
-                    title = title_match.group(1).replace("-", " ").title() if title_match else "Offre"
+def _parse_job_links(hrefs: List[str], max_results: int) -> List[dict]:
+    """
+    Déduit titre, entreprise et URL absolue des liens d'offres.
 
-                    company_match = re.search(r'/companies/([^/]+)', href)
-                    company = company_match.group(1).replace("-", " ").title() if company_match else "Entreprise"
+    Args:
+        hrefs: Attributs href des liens de la page de résultats
+        max_results: Nombre maximum de résultats
 
-                    full_url = f"https://www.welcometothejungle.com{href}" if href.startswith("/") else href
+    Returns:
+        Liste de dicts {title, company, url}, sans doublons
+    """
+    jobs = []
+    seen = set()
+    for href in hrefs:
+        if len(jobs) >= max_results:
+            break
 
-                    jobs.append({
-                        "title": title[:200],
-                        "company": company[:100],
-                        "url": full_url
-                    })
+        if not href or href in seen or "/companies/" not in href or "/jobs/" not in href:
+            continue
 
-            except Exception:
-                pass
-            finally:
-                browser.close()
+        seen.add(href)
 
-    except Exception:
-        pass
+        title_match = re.search(r'/jobs/([^/?]+)', href)
+        title = title_match.group(1).replace("-", " ").title() if title_match else "Offre"
+
+        company_match = re.search(r'/companies/([^/]+)', href)
+        company = company_match.group(1).replace("-", " ").title() if company_match else "Entreprise"
+
+        full_url = f"{WTTJ_BASE_URL}{href}" if href.startswith("/") else href
+
+        jobs.append({
+            "title": title[:200],
+            "company": company[:100],
+            "url": full_url
+        })
 
     return jobs
 
-if __name__ == "__main__":
-    url = sys.argv[1]
-    max_results = int(sys.argv[2])
-    result = scrape(url, max_results)
-    print(json.dumps(result))
-'''
+
+def _search_url(
+    query: str,
+    location: Optional[str] = None,
+    remote: bool = False
+) -> str:
+    params = [f"query={quote_plus(query)}"]
+    if location:
+        params.append(f"aroundQuery={quote_plus(location)}")
+    if remote:
+        params.append("remote=true")
+    return f"{WTTJ_BASE_URL}/fr/jobs?{'&'.join(params)}"
 
 
-async def scrape_welcometothejungle(
+async def _build_jobs(
+    raw_jobs: List[dict],
+    location: Optional[str],
+    contract_type: Optional[str],
+    scraped_at: str
+) -> List[JobRecord]:
+    """Construit les offres d'un lot de liens, complétées par leur page de détail."""
+    details = {}
+    if settings.wttj_details_enabled:
+        details = await job_detail_enricher.enrich(
+            [raw_job["url"] for raw_job in raw_jobs],
+            timeout=settings.wttj_details_timeout
+        )
+
+    jobs = []
+    for raw_job in raw_jobs:
+        detail = details.get(raw_job["url"], {})
+        jobs.append(JobRecord(
+            title=detail.get("title") or raw_job.get("title", "Offre d'emploi"),
+            company=detail.get("company") or raw_job.get("company", "Entreprise"),
+            location=detail.get("location") or location or "France",
+            salary=detail.get("salary"),
+            salary_min=detail.get("salary_min"),
+            salary_max=detail.get("salary_max"),
+            salary_currency=detail.get("salary_currency"),
+            contract_type=detail.get("contract_type") or contract_type,
+            experience_level=detail.get("experience_level"),
+            description=detail.get("description"),
+            url=raw_job.get("url", ""),
+            source="welcometothejungle",
+            posted_at=detail.get("posted_at"),
+            scraped_at=scraped_at,
+            tags=None
+        ))
+    return jobs
+
+
+async def iter_welcometothejungle(
     keywords: str,
     location: Optional[str] = None,
     contract_type: Optional[str] = None,
     remote: bool = False,
-    max_results: int = 50
-) -> List[JobOffer]:
+    batch_size: int = BATCH_SIZE,
+    max_results: Optional[int] = None
+) -> JobStream:
     """
-    Scrape les offres d'emploi depuis Welcome to the Jungle avec Playwright.
+    Produit les offres Welcome to the Jungle par lots, au fil du défilement.
+
+    Chaque lot de `batch_size` nouveaux liens est complété par les pages de
+    détail (si l'enrichissement est actif) puis produit ; la liste n'est
+    défilée pour le lot suivant que si l'appelant continue de tirer. Le
+    dernier lot (fin de la liste ou `max_results` atteint) n'est enrichi
+    qu'une fois la page rendue au pool de navigateurs.
 
     Args:
         keywords: Mots-clés de recherche
         location: Localisation
         contract_type: Type de contrat
         remote: Uniquement les offres remote
-        max_results: Nombre maximum de résultats
+        batch_size: Nombre de liens chargés (et enrichis) par lot
+        max_results: Nombre maximum de liens lus (None = toute la liste)
 
-    Returns:
-        Liste des offres d'emploi
+    Yields:
+        Offres d'emploi, dans l'ordre de la liste du site
     """
-    # Construire l'URL de recherche
-    params = [f"query={quote_plus(keywords)}"]
-    if location:
-        params.append(f"aroundQuery={quote_plus(location)}")
-    if remote:
-        params.append("remote=true")
+    # Construire l'URL de recherche : le site ne comprend pas les opérateurs,
+    # on lui transmet les termes recherchés
+    matcher = compile_keywords(keywords)
+    url = _search_url(" ".join(matcher.terms) or keywords, location, remote)
 
-    url = f"https://www.welcometothejungle.com/fr/jobs?{'&'.join(params)}"
+    def kept(raw_jobs: List[dict]) -> List[dict]:
+        # Seuls le titre et l'entreprise (devinés depuis l'URL) sont connus
+        # ici : on n'écarte que les offres contenant un terme exclu
+        return [
+            raw_job for raw_job in raw_jobs
+            if not matcher.rejects(raw_job.get("title"), raw_job.get("company"))
+        ]
 
-    jobs = []
+    # Un seul horodatage pour toutes les offres du scraping
+    scraped_at = utcnow_iso()
+    last_batch: List[dict] = []
 
     try:
-        # Créer un fichier temporaire avec le script
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.py', delete=False, encoding='utf-8') as f:
-            f.write(SCRAPER_SCRIPT)
-            script_path = f.name
+        async with browser_pool.page() as page:
+            if not await asyncio.wait_for(
+                _open_search(page, url), timeout=settings.wttj_timeout
+            ):
+                return
 
-        try:
-            # Exécuter le script dans un processus séparé
-            result = subprocess.run(
-                [sys.executable, script_path, url, str(max_results)],
-                capture_output=True,
-                text=True,
-                timeout=60,
-                encoding='utf-8'
-            )
+            loaded = 0
+            while True:
+                wanted = loaded + batch_size
+                if max_results is not None:
+                    wanted = min(wanted, max_results)
+                hrefs = await asyncio.wait_for(
+                    _load_job_links(page, wanted), timeout=settings.wttj_timeout
+                )
+                raw_jobs = _parse_job_links(hrefs, wanted)[loaded:]
+                loaded += len(raw_jobs)
+                if loaded < wanted or loaded == max_results:
+                    last_batch = raw_jobs
+                    break
+                for job in await _build_jobs(kept(raw_jobs), location, contract_type, scraped_at):
+                    yield job
+
+        for job in await _build_jobs(kept(last_batch), location, contract_type, scraped_at):
+            yield job
 
-            if result.returncode == 0 and result.stdout.strip():
-                raw_jobs = json.loads(result.stdout.strip())
-
-                for raw_job in raw_jobs:
-                    job = JobOffer(
-                        id=str(uuid.uuid4()),
-                        title=raw_job.get("title", "Offre d'emploi"),
-                        company=raw_job.get("company", "Entreprise"),
-                        location=location or "France",
-                        salary=None,
-                        contract_type=contract_type,
-                        experience_level=None,
-                        description=None,
-                        url=raw_job.get("url", ""),
-                        source="welcometothejungle",
-                        posted_at=None,
-                        scraped_at=datetime.utcnow().isoformat() + "Z",
-                        tags=None
-                    )
-                    jobs.append(job)
-
-        finally:
-            # Supprimer le fichier temporaire
-            try:
-                os.unlink(script_path)
-            except Exception:
-                pass
-
-    except subprocess.TimeoutExpired:
-        raise Exception("Welcome to the Jungle scraping timeout")
-    except json.JSONDecodeError:
-        raise Exception("Welcome to the Jungle invalid response")
+    except asyncio.TimeoutError as e:
+        raise ScraperTimeoutError(
+            "welcometothejungle", "Welcome to the Jungle scraping timeout"
+        ) from e
     except Exception as e:
-        raise Exception(f"Welcome to the Jungle scraping error: {str(e)}")
+        raise scraper_error("welcometothejungle", "Welcome to the Jungle", e) from e
 
-    return jobs
+
+async def scrape_welcometothejungle(
+    keywords: str,
+    location: Optional[str] = None,
+    contract_type: Optional[str] = None,
+    remote: bool = False,
+    max_results: int = 50
+) -> List[JobRecord]:
+    """
+    Scrape les offres d'emploi depuis Welcome to the Jungle avec Playwright.
+
+    La page est rendue dans un contexte du pool de navigateurs partagé
+    (voir `browser_pool`), sans bloquer la boucle d'événements. Si
+    l'enrichissement est actif, les offres sont ensuite complétées depuis
+    leur page de détail (salaire, description, date, expérience, lieu),
+    lues en parallèle et mémorisées par URL.
+
+    Args:
+        keywords: Mots-clés de recherche
+        location: Localisation
+        contract_type: Type de contrat
+        remote: Uniquement les offres remote
+        max_results: Nombre maximum de résultats
+
+    Returns:
+        Liste des offres d'emploi
+    """
+    # Un seul lot, enrichi après avoir rendu la page au pool
+    return await take(
+        iter_welcometothejungle(
+            keywords, location, contract_type, remote,
+            batch_size=max(1, max_results), max_results=max_results
+        ),
+        max_results
+    )
@@ -0,0 +1,287 @@
+import asyncio
+import json
+import re
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, List, Optional
+
+import httpx
+
+from app.core.config import settings
+from app.core.http_client import get_http_client
+from app.models import DESCRIPTION_HTML_MAX_CHARS
+from app.services.cache_store import CacheStore, cache_store
+from app.services.rate_limiter import rate_limiter
+from app.services.single_flight import SingleFlight
+
+HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+    "Accept": "text/html,application/xhtml+xml",
+    "Accept-Language": "fr-FR,fr;q=0.9,en;q=0.8",
+}
+
+JSON_LD_RE = re.compile(
+    r"<script[^>]*type=[\"']application/ld\+json[\"'][^>]*>(.*?)</script>",
+    re.DOTALL | re.IGNORECASE
+)
+
+# employmentType (schema.org) → type de contrat affiché
+EMPLOYMENT_TYPES = {
+    "FULL_TIME": "CDI",
+    "PART_TIME": "Temps partiel",
+    "CONTRACTOR": "Freelance",
+    "TEMPORARY": "CDD",
+    "INTERN": "Stage",
+    "OTHER": None,
+}
+# Facteur d'annualisation des salaires (baseSalary.value.unitText)
+SALARY_UNITS = {"YEAR": 1, "MONTH": 12, "WEEK": 52, "DAY": 218, "HOUR": 1607}
+
+
+def _job_postings(data: Any) -> Iterable[dict]:
+    if isinstance(data, list):
+        for item in data:
+            yield from _job_postings(item)
+    elif isinstance(data, dict):
+        if data.get("@type") == "JobPosting":
+            yield data
+        yield from _job_postings(data.get("@graph"))
+
+
+def extract_job_posting(page_html: str) -> Optional[dict]:
+    """
+    Retourne l'objet JSON-LD `JobPosting` embarqué dans une page d'offre.
+
+    Args:
+        page_html: HTML de la page d'offre
+
+    Returns:
+        Objet JobPosting, ou None si la page n'en contient pas
+    """
+    for match in JSON_LD_RE.finditer(page_html):
+        try:
+            data = json.loads(match.group(1))
+        except ValueError:
+            continue
+        for posting in _job_postings(data):
+            return posting
+    return None
+
+
+def _name(value: Any) -> Optional[str]:
+    if isinstance(value, dict):
+        value = value.get("name")
+    return value.strip() if isinstance(value, str) and value.strip() else None
+
+
+def _location(posting: dict) -> Optional[str]:
+    locations = posting.get("jobLocation") or []
+    if isinstance(locations, dict):
+        locations = [locations]
+    cities = []
+    for location in locations:
+        address = location.get("address") if isinstance(location, dict) else None
+        city = address.get("addressLocality") if isinstance(address, dict) else None
+        if city and city not in cities:
+            cities.append(city)
+    if cities:
+        return ", ".join(cities)
+    if posting.get("jobLocationType") == "TELECOMMUTE":
+        return "Remote"
+    return None
+
+
+def _salary(posting: dict) -> Dict[str, Any]:
+    base = posting.get("baseSalary")
+    if not isinstance(base, dict):
+        return {}
+    value = base.get("value")
+    if not isinstance(value, dict):
+        value = {"value": value}
+    factor = SALARY_UNITS.get(str(value.get("unitText", "YEAR")).upper(), 1)
+    currency = base.get("currency") or "EUR"
+
+    def annual(amount: Any) -> Optional[int]:
+        try:
+            return int(float(amount) * factor) if amount not in (None, "") else None
+        except (TypeError, ValueError):
+            return None
+
+    salary_min = annual(value.get("minValue", value.get("value")))
+    salary_max = annual(value.get("maxValue"))
+    if salary_min is None and salary_max is None:
+        return {}
+    if salary_min and salary_max and salary_max != salary_min:
+        salary = f"{salary_min}-{salary_max} {currency}"
+    else:
+        salary = f"{salary_min or salary_max} {currency}"
+    return {
+        "salary": salary,
+        "salary_min": salary_min,
+        "salary_max": salary_max,
+        "salary_currency": currency,
+    }
+
+
+def _experience_level(posting: dict) -> Optional[str]:
+    requirements = posting.get("experienceRequirements")
+    months = requirements.get("monthsOfExperience") if isinstance(requirements, dict) else None
+    try:
+        months = float(months)
+    except (TypeError, ValueError):
+        return None
+    if months < 24:
+        return "Junior"
+    if months < 60:
+        return "Confirmé"
+    return "Senior"
+
+
+def posting_fields(posting: dict) -> Dict[str, Any]:
+    """
+    Champs d'offre (noms de `JobRecord`) tirés d'un JobPosting.
+
+    Seuls les champs présents dans la page sont renvoyés.
+    """
+    employment_type = posting.get("employmentType")
+    if isinstance(employment_type, list):
+        employment_type = employment_type[0] if employment_type else None
+    description = posting.get("description")
+
+    fields = {
+        "title": _name(posting.get("title")),
+        "company": _name(posting.get("hiringOrganization")),
+        "location": _location(posting),
+        "contract_type": EMPLOYMENT_TYPES.get(str(employment_type).upper()) if employment_type else None,
+        "experience_level": _experience_level(posting),
+        "description": description[:DESCRIPTION_HTML_MAX_CHARS] if isinstance(description, str) else None,
+        "posted_at": posting.get("datePosted"),
+        **_salary(posting),
+    }
+    return {name: value for name, value in fields.items() if value}
+
+
+class JobDetailEnricher:
+    """
+    Complète les offres WTTJ depuis leur page de détail.
+
+    Les pages d'offres embarquent un JSON-LD `JobPosting` : un simple GET
+    HTTP suffit, sans navigateur. Les pages sont téléchargées en parallèle
+    (au plus `concurrency` à la fois, au rythme du limiteur de débit), et
+    les champs extraits sont mémorisés par URL : une offre n'est lue
+    qu'une fois, même si plusieurs recherches la demandent en même temps.
+
+    Les échecs (page en erreur, sans JSON-LD ou sans champ utile) sont
+    mémorisés eux aussi, pendant `negative_ttl` secondes seulement : une
+    page cassée n'est pas relue à chaque recherche.
+    """
+
+    NAMESPACE = "wttj_details"
+
+    def __init__(
+        self,
+        concurrency: int,
+        ttl: float,
+        negative_ttl: float = 0.0,
+        max_entries: int = 5000,
+        store: Optional[CacheStore] = None
+    ):
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self.max_entries = max_entries
+        self.store = store
+        self._slots = asyncio.Semaphore(max(1, concurrency))
+        # URL → (date d'expiration, champs ; vides en cas d'échec)
+        self._entries: "OrderedDict[str, tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self._flights = SingleFlight()
+
+    async def enrich(self, urls: List[str], timeout: float) -> Dict[str, Dict[str, Any]]:
+        """
+        Champs des pages d'offres, par URL.
+
+        Les pages non lues avant `timeout` secondes (ou en erreur) sont
+        absentes du résultat : leurs offres gardent les champs de la liste.
+
+        Args:
+            urls: URLs des pages d'offres
+            timeout: Délai maximum pour l'ensemble des pages
+
+        Returns:
+            Dict {url: champs}
+        """
+        tasks = {
+            asyncio.ensure_future(self._flights.run(url, lambda url=url: self._details(url))): url
+            for url in dict.fromkeys(urls)
+        }
+        if not tasks:
+            return {}
+        try:
+            done, _ = await asyncio.wait(tasks, timeout=timeout)
+        finally:
+            pending = [task for task in tasks if not task.done()]
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+
+        details = {}
+        for task in done:
+            if not task.cancelled() and task.exception() is None and task.result():
+                details[tasks[task]] = task.result()
+        return details
+
+    async def _details(self, url: str) -> Optional[Dict[str, Any]]:
+        entry = self._entries.get(url)
+        if entry is not None and time.time() < entry[0]:
+            self._entries.move_to_end(url)
+            return entry[1] or None
+
+        if self.store is not None and self.store.shared:
+            try:
+                value = await self.store.aget(self.NAMESPACE, url)
+            except Exception:
+                value = None
+            if value is not None:
+                fields = json.loads(value)
+                self._remember(url, fields, self.ttl)
+                return fields
+
+        async with self._slots:
+            fields = await self._fetch(url)
+        if not fields:
+            if self.negative_ttl > 0:
+                self._remember(url, {}, self.negative_ttl)
+            return None
+
+        self._remember(url, fields, self.ttl)
+        if self.store is not None and self.store.shared:
+            try:
+                value = json.dumps(fields).encode("utf-8")
+                await self.store.aset(self.NAMESPACE, url, value, ttl=self.ttl)
+            except Exception:
+                pass
+        return fields
+
+    async def _fetch(self, url: str) -> Optional[Dict[str, Any]]:
+        await rate_limiter.acquire(url)
+        try:
+            response = await get_http_client().get(url, headers=HEADERS, follow_redirects=True)
+            response.raise_for_status()
+        except httpx.HTTPError:
+            # Page indisponible : l'offre reste telle que listée
+            return None
+        posting = extract_job_posting(response.text)
+        return posting_fields(posting) if posting is not None else None
+
+    def _remember(self, url: str, fields: Dict[str, Any], ttl: float) -> None:
+        self._entries[url] = (time.time() + ttl, fields)
+        self._entries.move_to_end(url)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+
+job_detail_enricher = JobDetailEnricher(
+    concurrency=settings.wttj_details_concurrency,
+    ttl=settings.wttj_details_ttl,
+    negative_ttl=settings.wttj_details_negative_ttl,
+    store=cache_store
+)
@@ -0,0 +1,290 @@
+import asyncio
+import os
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from typing import Dict, Optional, Tuple
+
+from app.core.config import settings
+
+# Dépendance optionnelle, seulement pour CACHE_BACKEND=redis
+try:
+    import redis
+    REDIS_AVAILABLE = True
+except ImportError:
+    REDIS_AVAILABLE = False
+
+
+class CacheStore(ABC):
+    """
+    Stockage clé → octets avec expiration, derrière les caches de l'API
+    (flux des sources, jeux de résultats pour la pagination et l'export).
+
+    Les clés sont rangées par espace de noms (`feeds`, `results`…).
+    `shared` indique si le stockage est partagé entre workers et nœuds :
+    les caches n'y sérialisent alors leurs entrées que dans ce cas.
+    Les méthodes synchrones peuvent bloquer (disque, réseau) ; les variantes
+    async les exécutent dans un thread quand c'est nécessaire.
+    """
+
+    shared = False
+    blocking = False
+
+    @abstractmethod
+    def get(self, namespace: str, key: str) -> Optional[bytes]:
+        """Valeur d'une clé, None si absente ou expirée."""
+
+    @abstractmethod
+    def set(
+        self,
+        namespace: str,
+        key: str,
+        value: bytes,
+        ttl: Optional[float] = None
+    ) -> None:
+        """Enregistre une valeur, expirée après `ttl` secondes (jamais si None)."""
+
+    @abstractmethod
+    def delete(self, namespace: str, key: str) -> None:
+        """Supprime une clé."""
+
+    @abstractmethod
+    def clear(self, namespace: str) -> None:
+        """Supprime toutes les clés d'un espace de noms."""
+
+    def close(self) -> None:
+        pass
+
+    async def aget(self, namespace: str, key: str) -> Optional[bytes]:
+        if not self.blocking:
+            return self.get(namespace, key)
+        return await asyncio.to_thread(self.get, namespace, key)
+
+    async def aset(
+        self,
+        namespace: str,
+        key: str,
+        value: bytes,
+        ttl: Optional[float] = None
+    ) -> None:
+        if not self.blocking:
+            return self.set(namespace, key, value, ttl)
+        await asyncio.to_thread(self.set, namespace, key, value, ttl)
+
+
+class MemoryStore(CacheStore):
+    """
+    Stockage en mémoire du processus (un seul worker).
+
+    `shared=True` le fait passer pour un stockage partagé, ce qui permet
+    d'exercer la sérialisation des caches sans serveur (tests, benchmarks).
+    """
+
+    def __init__(self, shared: bool = False):
+        self.shared = shared
+        self._entries: Dict[Tuple[str, str], Tuple[bytes, Optional[float]]] = {}
+
+    def get(self, namespace: str, key: str) -> Optional[bytes]:
+        entry = self._entries.get((namespace, key))
+        if entry is None:
+            return None
+        value, expires_at = entry
+        if expires_at is not None and time.time() >= expires_at:
+            del self._entries[(namespace, key)]
+            return None
+        return value
+
+    def set(
+        self,
+        namespace: str,
+        key: str,
+        value: bytes,
+        ttl: Optional[float] = None
+    ) -> None:
+        expires_at = time.time() + ttl if ttl is not None else None
+        self._entries[(namespace, key)] = (value, expires_at)
+        if len(self._entries) % 100 == 0:
+            self._purge()
+
+    def delete(self, namespace: str, key: str) -> None:
+        self._entries.pop((namespace, key), None)
+
+    def clear(self, namespace: str) -> None:
+        for entry_key in [k for k in self._entries if k[0] == namespace]:
+            del self._entries[entry_key]
+
+    def _purge(self) -> None:
+        now = time.time()
+        for entry_key, (_, expires_at) in list(self._entries.items()):
+            if expires_at is not None and now >= expires_at:
+                del self._entries[entry_key]
+
+
+SQLITE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS cache (
+    namespace TEXT NOT NULL,
+    key TEXT NOT NULL,
+    value BLOB NOT NULL,
+    expires_at REAL,
+    PRIMARY KEY (namespace, key)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS cache_expires ON cache(expires_at);
+"""
+
+
+class SQLiteStore(CacheStore):
+    """
+    Stockage dans un fichier SQLite en mode WAL, partagé par les workers
+    d'une machine (ou les conteneurs montant le même volume local).
+
+    Le mode WAL laisse les lectures concurrentes passer pendant une
+    écriture ; les entrées expirées sont purgées au fil des écritures.
+    """
+
+    shared = True
+    blocking = True
+
+    # Une purge des entrées expirées toutes les N écritures
+    PURGE_EVERY = 200
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._writes = 0
+
+    def _connection(self) -> sqlite3.Connection:
+        if self._conn is None:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            conn = sqlite3.connect(self.path, check_same_thread=False, timeout=10.0)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.executescript(SQLITE_SCHEMA)
+            self._conn = conn
+        return self._conn
+
+    def get(self, namespace: str, key: str) -> Optional[bytes]:
+        with self._lock:
+            row = self._connection().execute(
+                "SELECT value, expires_at FROM cache WHERE namespace = ? AND key = ?",
+                (namespace, key)
+            ).fetchone()
+        if row is None or (row[1] is not None and time.time() >= row[1]):
+            return None
+        return bytes(row[0])
+
+    def set(
+        self,
+        namespace: str,
+        key: str,
+        value: bytes,
+        ttl: Optional[float] = None
+    ) -> None:
+        now = time.time()
+        expires_at = now + ttl if ttl is not None else None
+        with self._lock:
+            conn = self._connection()
+            with conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO cache (namespace, key, value, expires_at) "
+                    "VALUES (?, ?, ?, ?)",
+                    (namespace, key, value, expires_at)
+                )
+                self._writes += 1
+                if self._writes % self.PURGE_EVERY == 0:
+                    conn.execute("DELETE FROM cache WHERE expires_at < ?", (now,))
+
+    def delete(self, namespace: str, key: str) -> None:
+        with self._lock:
+            conn = self._connection()
+            with conn:
+                conn.execute(
+                    "DELETE FROM cache WHERE namespace = ? AND key = ?", (namespace, key)
+                )
+
+    def clear(self, namespace: str) -> None:
+        with self._lock:
+            conn = self._connection()
+            with conn:
+                conn.execute("DELETE FROM cache WHERE namespace = ?", (namespace,))
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+class RedisStore(CacheStore):
+    """
+    Stockage Redis (ou tout serveur parlant le protocole Redis), partagé
+    par tous les workers et nœuds. L'expiration est confiée au serveur.
+
+    Nécessite le paquet optionnel `redis` (`pip install redis`), sauf si un
+    client compatible est fourni (`client`).
+    """
+
+    shared = True
+    blocking = True
+
+    def __init__(self, url: str, prefix: str = "jobscraper", client=None):
+        if client is None:
+            if not REDIS_AVAILABLE:
+                raise RuntimeError(
+                    "Le paquet redis n'est pas installé (pip install redis), "
+                    "requis par CACHE_BACKEND=redis"
+                )
+            client = redis.Redis.from_url(url)
+        self.prefix = prefix
+        self._client = client
+
+    def _key(self, namespace: str, key: str) -> str:
+        return f"{self.prefix}:{namespace}:{key}"
+
+    def get(self, namespace: str, key: str) -> Optional[bytes]:
+        return self._client.get(self._key(namespace, key))
+
+    def set(
+        self,
+        namespace: str,
+        key: str,
+        value: bytes,
+        ttl: Optional[float] = None
+    ) -> None:
+        px = max(int(ttl * 1000), 1) if ttl is not None else None
+        self._client.set(self._key(namespace, key), value, px=px)
+
+    def delete(self, namespace: str, key: str) -> None:
+        self._client.delete(self._key(namespace, key))
+
+    def clear(self, namespace: str) -> None:
+        keys = list(self._client.scan_iter(match=self._key(namespace, "*")))
+        if keys:
+            self._client.delete(*keys)
+
+    def close(self) -> None:
+        self._client.close()
+
+
+def create_cache_store(backend: str) -> CacheStore:
+    """
+    Construit le stockage configuré (`CACHE_BACKEND`).
+
+    Args:
+        backend: `memory`, `sqlite` (fichier `CACHE_SQLITE_PATH`) ou
+            `redis` (serveur `CACHE_REDIS_URL`)
+
+    Returns:
+        Stockage des caches du processus
+    """
+    if backend == "sqlite":
+        return SQLiteStore(settings.cache_sqlite_path)
+    if backend == "redis":
+        return RedisStore(settings.cache_redis_url)
+    return MemoryStore()
+
+
+cache_store = create_cache_store(settings.cache_backend)
@@ -0,0 +1,150 @@
+import argparse
+import asyncio
+import logging
+from typing import Callable, Dict, List, Optional
+
+from app.core.config import settings
+from app.core.http_client import close_http_client, start_http_client
+from app.models import JobRecord
+from app.scrapers.browser_pool import browser_pool
+from app.scrapers.jobicy import JOBICY_URL, scrape_jobicy
+from app.scrapers.remoteok import REMOTEOK_API_URL, scrape_remoteok
+from app.scrapers.welcometothejungle import scrape_welcometothejungle
+from app.services.search_index import JobIndex, search_index
+
+logger = logging.getLogger(__name__)
+
+SCRAPERS: Dict[str, Callable] = {
+    "remoteok": scrape_remoteok,
+    "jobicy": scrape_jobicy,
+    "welcometothejungle": scrape_welcometothejungle,
+}
+
+# Sources dont le scraping lit un flux entier, filtré ensuite localement :
+# crawlées sans mots-clés, leur index couvre toutes les recherches
+FULL_FEED_SOURCES = {"remoteok", "jobicy"}
+
+
+class Crawler:
+    """
+    Crawler incrémental qui rafraîchit périodiquement l'index local.
+
+    Les sources à flux (`FULL_FEED_SOURCES`) sont lues en entier, sans
+    mots-clés ; les autres sont interrogées avec des requêtes larges. Le
+    résultat est synchronisé dans l'index (offres nouvelles, modifiées,
+    disparues, par URL). Les recherches lisent ensuite l'index au lieu de
+    scraper en direct, pour les seules sources dont il couvre tout le flux.
+    """
+
+    def __init__(
+        self,
+        index: JobIndex,
+        sources: List[str],
+        queries: List[str],
+        interval: float,
+        max_results: int
+    ):
+        self.index = index
+        self.sources = sources
+        self.queries = queries
+        self.interval = interval
+        self.max_results = max_results
+
+    async def crawl_source(self, source: str) -> Dict[str, int]:
+        """
+        Crawle une source et synchronise l'index.
+
+        Si une requête échoue ou atteint `max_results` (d'autres offres ont
+        pu être laissées de côté), les offres trouvées sont quand même
+        indexées mais aucune n'est marquée disparue (crawl incomplet).
+
+        Returns:
+            Compteurs {"new", "updated", "unchanged", "removed"}
+        """
+        scraper = SCRAPERS[source]
+        jobs: Dict[str, JobRecord] = {}
+        complete = True
+        full_feed = source in FULL_FEED_SOURCES
+        queries = [""] if full_feed else self.queries
+
+        for query in queries:
+            try:
+                results = await scraper(keywords=query, max_results=self.max_results)
+            except Exception as e:
+                logger.warning("Crawl %s (%r) en échec : %s", source, query, e)
+                complete = False
+                continue
+            if len(results) >= self.max_results:
+                logger.warning(
+                    "Crawl %s (%r) plafonné à %d offres", source, query, self.max_results
+                )
+                complete = False
+            for job in results:
+                jobs.setdefault(job.url, job)
+
+        return await self.index.async_sync_source(
+            source, list(jobs.values()), complete, full_feed
+        )
+
+    async def run_once(self) -> Dict[str, Dict[str, int]]:
+        """Crawle toutes les sources en parallèle."""
+        results = await asyncio.gather(
+            *(self.crawl_source(source) for source in self.sources),
+            return_exceptions=True
+        )
+
+        report = {}
+        for source, result in zip(self.sources, results):
+            if isinstance(result, Exception):
+                logger.warning("Crawl %s interrompu : %s", source, result)
+                continue
+            report[source] = result
+            logger.info("Crawl %s : %s", source, result)
+        return report
+
+    async def run_forever(self) -> None:
+        """Boucle de rafraîchissement, jusqu'à annulation de la tâche."""
+        while True:
+            try:
+                await self.run_once()
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.exception("Crawl en échec")
+            await asyncio.sleep(self.interval)
+
+
+crawler = Crawler(
+    index=search_index,
+    sources=settings.crawler_sources,
+    queries=settings.crawler_queries,
+    interval=settings.crawler_interval,
+    max_results=settings.crawler_max_results
+)
+
+
+async def _main(once: bool) -> None:
+    await start_http_client([REMOTEOK_API_URL, JOBICY_URL])
+    try:
+        if once:
+            await crawler.run_once()
+        else:
+            await crawler.run_forever()
+    finally:
+        await browser_pool.close()
+        await close_http_client()
+        search_index.close()
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """Point d'entrée autonome : `python -m app.services.crawler [--once]`."""
+    parser = argparse.ArgumentParser(description="Crawler JobScraper")
+    parser.add_argument("--once", action="store_true", help="Un seul passage puis arrêt")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
+    asyncio.run(_main(args.once))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,221 @@
+import hashlib
+import re
+import unicodedata
+from typing import Dict, List, Optional, Tuple
+
+from app.models import JobRecord
+
+SIMHASH_BITS = 64
+FULL_MASK = (1 << SIMHASH_BITS) - 1
+# 4 bandes de 16 bits : deux empreintes à distance <= 7 ont au moins une
+# bande à distance <= 1 (principe des tiroirs). Chaque bande est cherchée
+# telle quelle et avec chacun de ses bits inversé ; des bandes larges gardent
+# les seaux presque vides même sur des dizaines de milliers d'offres
+BANDS = 4
+BAND_BITS = SIMHASH_BITS // BANDS
+MAX_DISTANCE = 7
+
+# Longueur de description prise en compte dans l'empreinte
+DESCRIPTION_CHARS = 1000
+# Poids du titre et de l'entreprise face aux mots de la description
+HEAD_WEIGHT = 4
+
+TAG_RE = re.compile(r"<[^>]+>")
+WORD_RE = re.compile(r"[a-z0-9]+")
+
+
+def normalize_text(text: str) -> List[str]:
+    """Minuscules, sans accents ni balises HTML, découpé en mots."""
+    text = TAG_RE.sub(" ", text)
+    if not text.isascii():
+        # Un texte ASCII n'a aucun accent : la décomposition est inutile
+        text = unicodedata.normalize("NFKD", text)
+        text = "".join(c for c in text if not unicodedata.combining(c))
+    return WORD_RE.findall(text.lower())
+
+
+def _features(job: JobRecord) -> List[str]:
+    # Titre et entreprise : mots et bigrammes, répétés pour peser face à la
+    # description, dont on ne garde que les mots distincts
+    head = normalize_text(f"{job.title} {job.company}")
+    head += [f"{a} {b}" for a, b in zip(head, head[1:])]
+    body = dict.fromkeys(normalize_text((job.description or "")[:DESCRIPTION_CHARS]))
+    return head * HEAD_WEIGHT + list(body)
+
+
+# Compteurs de bits de SimHash : un hash de caractéristique est « étalé » en
+# 64 voies de 16 bits (une par bit), si bien qu'additionner des hashs étalés
+# additionne les 64 compteurs d'un coup, dans l'arithmétique entière en C.
+# 16 bits suffisent : le nombre de caractéristiques d'une offre est borné
+# par DESCRIPTION_CHARS
+LANE_BITS = 16
+LANE_DIGITS = LANE_BITS // 4
+# 1 dans chaque voie
+LANES_ONE = sum(1 << (LANE_BITS * lane) for lane in range(SIMHASH_BITS))
+LANE_HIGH_BIT = LANE_BITS - 1
+# Octet `value` placé en position `index` (poids faible = 0), déjà étalé
+_SPREAD_TABLES = [
+    [
+        sum(((value >> bit) & 1) << (LANE_BITS * (8 * index + bit)) for bit in range(8))
+        for value in range(256)
+    ]
+    for index in range(SIMHASH_BITS // 8)
+]
+
+
+def _feature_spread(feature: str) -> int:
+    """Hash 64 bits (blake2b) d'une caractéristique, étalé en 64 voies."""
+    digest = hashlib.blake2b(feature.encode("utf-8"), digest_size=8).digest()
+    t = _SPREAD_TABLES
+    # Le condensé est lu en gros-boutiste : son premier octet est le poids fort
+    return (
+        t[7][digest[0]] | t[6][digest[1]] | t[5][digest[2]] | t[4][digest[3]]
+        | t[3][digest[4]] | t[2][digest[5]] | t[1][digest[6]] | t[0][digest[7]]
+    )
+
+
+def simhash(features: List[str], cache: Optional[Dict[str, int]] = None) -> int:
+    """
+    Empreinte SimHash 64 bits d'une liste de caractéristiques.
+
+    Les hashs des caractéristiques sont étalés (une voie de compteur par
+    bit) puis simplement additionnés ; un biais ajouté à chaque voie fait
+    passer son bit de poids fort à 1 exactement quand le compteur dépasse la
+    moitié du nombre de hashs, ce qui donne les bits de l'empreinte.
+
+    Args:
+        features: Caractéristiques (mots, bigrammes)
+        cache: Hashs étalés déjà calculés, partagés entre plusieurs empreintes
+    """
+    if cache is None:
+        cache = {}
+
+    spread = []
+    for feature in features:
+        value = cache.get(feature)
+        if value is None:
+            value = cache[feature] = _feature_spread(feature)
+        spread.append(value)
+
+    # Un bit vaut 1 si son compteur dépasse la moitié du nombre de hashs
+    threshold = len(features) // 2
+    bias = (1 << LANE_HIGH_BIT) - 1 - threshold
+    counters = sum(spread) + bias * LANES_ONE
+    high_bits = counters >> LANE_HIGH_BIT & LANES_ONE
+    # Chaque voie vaut maintenant 0 ou 1 : son dernier chiffre hexadécimal
+    # est le bit correspondant de l'empreinte
+    lanes = format(high_bits, f"0{SIMHASH_BITS * LANE_DIGITS}x")
+    return int(lanes[LANE_DIGITS - 1::LANE_DIGITS], 2)
+
+
+def _richness(job: JobRecord) -> Tuple[int, int]:
+    filled = sum(
+        1 for value in (
+            job.salary, job.salary_min, job.salary_max, job.contract_type,
+            job.experience_level, job.description, job.posted_at, job.tags
+        )
+        if value
+    )
+    return filled, len(job.description or "")
+
+
+def cluster_fingerprints(
+    fingerprints: List[int],
+    sources: Optional[List[str]] = None
+) -> List[int]:
+    """
+    Regroupe les empreintes à distance de Hamming <= MAX_DISTANCE.
+
+    Les candidats sont trouvés par bandes (LSH) en temps quasi linéaire,
+    puis confirmés par distance de Hamming ; les groupes sont fermés par
+    transitivité.
+
+    Args:
+        fingerprints: Empreintes SimHash
+        sources: Source de chaque empreinte ; si fournie, deux groupes ne
+            sont fusionnés que s'ils n'ont aucune source en commun
+
+    Returns:
+        Pour chaque empreinte, l'indice représentant son groupe
+    """
+    # Union-find sur les indices des empreintes, avec les sources de chaque
+    # groupe (tenues par sa racine)
+    parent = list(range(len(fingerprints)))
+    group_sources = [{source} for source in sources] if sources is not None else None
+
+    def find(i: int) -> int:
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    buckets: Dict[Tuple[int, int], List[int]] = {}
+    mask = (1 << BAND_BITS) - 1
+    flips = [1 << bit for bit in range(BAND_BITS)]
+    for i, fingerprint in enumerate(fingerprints):
+        for band in range(BANDS):
+            value = fingerprint >> (band * BAND_BITS) & mask
+            for probe in (value, *(value ^ flip for flip in flips)):
+                for j in buckets.get((band, probe), ()):
+                    root_i, root_j = find(i), find(j)
+                    if root_i == root_j:
+                        continue
+                    if bin(fingerprint ^ fingerprints[j]).count("1") > MAX_DISTANCE:
+                        continue
+                    if group_sources is not None:
+                        if group_sources[root_i] & group_sources[root_j]:
+                            continue
+                        group_sources[root_j] |= group_sources[root_i]
+                    parent[root_i] = root_j
+            buckets.setdefault((band, value), []).append(i)
+
+    return [find(i) for i in range(len(fingerprints))]
+
+
+def deduplicate_jobs(jobs: List[JobRecord]) -> Tuple[List[JobRecord], int]:
+    """
+    Fusionne les quasi-doublons (même offre publiée sur plusieurs sources).
+
+    Seules des offres de sources différentes sont fusionnées : deux offres
+    proches d'une même source (même poste dans deux villes, par exemple)
+    sont des offres distinctes.
+
+    Chaque offre reçoit une empreinte SimHash de son titre, entreprise et
+    description normalisés ; les offres proches sont regroupées par
+    `cluster_fingerprints`. Dans chaque groupe, l'offre la plus complète
+    est conservée et `sources` liste toutes les sources fusionnées.
+
+    Args:
+        jobs: Offres agrégées de toutes les sources
+
+    Returns:
+        (offres dédupliquées dans l'ordre d'origine, nombre de doublons fusionnés)
+    """
+    if len(jobs) < 2:
+        return list(jobs), 0
+
+    cache: Dict[str, int] = {}
+    roots = cluster_fingerprints(
+        [simhash(_features(job), cache) for job in jobs],
+        [job.source for job in jobs]
+    )
+
+    groups: Dict[int, List[int]] = {}
+    for i, root in enumerate(roots):
+        groups.setdefault(root, []).append(i)
+
+    kept: List[Tuple[int, JobRecord]] = []
+    for members in groups.values():
+        if len(members) == 1:
+            kept.append((members[0], jobs[members[0]]))
+            continue
+        best = max(members, key=lambda i: _richness(jobs[i]))
+        sources = sorted({
+            source
+            for i in members
+            for source in (jobs[i].sources or [jobs[i].source])
+        })
+        kept.append((min(members), jobs[best].replace(sources=sources)))
+
+    kept.sort(key=lambda item: item[0])
+    return [job for _, job in kept], len(jobs) - len(kept)
@@ -1,50 +1,133 @@
 import csv
 import json
-import io
-from typing import List
-from app.models import JobOffer
+import zlib
+from typing import Iterable, Iterator, List
+from app.models import JobRecord
 
+CSV_FIELDNAMES = [
+    "id", "title", "company", "location", "salary",
+    "salary_min", "salary_max", "salary_currency",
+    "contract_type", "experience_level", "description",
+    "url", "source", "posted_at", "scraped_at", "tags"
+]
 
-def export_to_csv(jobs: List[JobOffer]) -> str:
-    """
-    Exporte les offres d'emploi au format CSV.
+# Taille cible des morceaux envoyés au client
+CHUNK_SIZE = 64 * 1024
 
-    Args:
-        jobs: Liste des offres d'emploi
 
-    Returns:
-        Contenu CSV en string
+class _RowBuffer:
+    """Tampon minimal pour récupérer les lignes écrites par csv.writer."""
+
+    def __init__(self):
+        self.parts: List[str] = []
+
+    def write(self, data: str) -> None:
+        self.parts.append(data)
+
+    def flush(self) -> str:
+        data = "".join(self.parts)
+        self.parts.clear()
+        return data
+
+
+def iter_csv(jobs: Iterable[JobRecord]) -> Iterator[str]:
     """
-    output = io.StringIO()
+    Sérialise les offres en CSV, ligne par ligne.
 
-    fieldnames = [
-        "id", "title", "company", "location", "salary",
-        "contract_type", "experience_level", "description",
-        "url", "source", "posted_at", "scraped_at", "tags"
-    ]
+    Args:
+        jobs: Offres d'emploi
 
-    writer = csv.DictWriter(output, fieldnames=fieldnames, extrasaction='ignore')
+    Yields:
+        En-tête puis une ligne CSV par offre
+    """
+    buffer = _RowBuffer()
+    writer = csv.DictWriter(buffer, fieldnames=CSV_FIELDNAMES, extrasaction='ignore')
     writer.writeheader()
+    yield buffer.flush()
 
     for job in jobs:
-        job_dict = job.model_dump(by_alias=False)
+        job_dict = job.to_dict()
         # Convertir les tags en string
         if job_dict.get("tags"):
             job_dict["tags"] = ", ".join(job_dict["tags"])
         writer.writerow(job_dict)
+        yield buffer.flush()
+
+
+def iter_json(jobs: Iterable[JobRecord]) -> Iterator[str]:
+    """
+    Sérialise les offres en tableau JSON indenté, offre par offre.
+
+    Le document produit est identique à `json.dumps(..., indent=2)`.
+
+    Args:
+        jobs: Offres d'emploi
+
+    Yields:
+        Morceaux du document JSON
+    """
+    first = True
+    for job in jobs:
+        item = json.dumps(job.to_dict(by_alias=True), indent=2, ensure_ascii=False)
+        item = item.replace("\n", "\n  ")
+        yield ("[\n  " if first else ",\n  ") + item
+        first = False
+    yield "[]" if first else "\n]"
+
+
+def iter_ndjson(jobs: Iterable[JobRecord]) -> Iterator[str]:
+    """
+    Sérialise les offres en NDJSON (un objet JSON par ligne).
+
+    Args:
+        jobs: Offres d'emploi
+
+    Yields:
+        Une ligne JSON par offre
+    """
+    for job in jobs:
+        yield json.dumps(job.to_dict(by_alias=True), ensure_ascii=False) + "\n"
+
+
+def encode_chunks(chunks: Iterable[str], chunk_size: int = CHUNK_SIZE) -> Iterator[bytes]:
+    """
+    Encode en UTF-8 et regroupe les morceaux pour limiter le nombre d'écritures.
+
+    Args:
+        chunks: Morceaux de texte
+        chunk_size: Taille minimale (en octets) d'un morceau émis
 
-    return output.getvalue()
+    Yields:
+        Morceaux encodés
+    """
+    pending: List[bytes] = []
+    size = 0
+    for chunk in chunks:
+        data = chunk.encode("utf-8")
+        pending.append(data)
+        size += len(data)
+        if size >= chunk_size:
+            yield b"".join(pending)
+            pending.clear()
+            size = 0
+    if pending:
+        yield b"".join(pending)
 
 
-def export_to_json(jobs: List[JobOffer]) -> str:
+def gzip_chunks(chunks: Iterable[bytes], level: int = 6) -> Iterator[bytes]:
     """
-    Exporte les offres d'emploi au format JSON.
+    Compresse un flux d'octets au format gzip, à la volée.
 
     Args:
-        jobs: Liste des offres d'emploi
+        chunks: Morceaux d'octets
+        level: Niveau de compression zlib
 
-    Returns:
-        Contenu JSON en string
+    Yields:
+        Morceaux compressés
     """
-    jobs_data = [job.model_dump(by_alias=True) for job in jobs]
-    return json.dumps(jobs_data, indent=2, ensure_ascii=False)
+    compressor = zlib.compressobj(level, zlib.DEFLATED, 31)
+    for chunk in chunks:
+        data = compressor.compress(chunk)
+        if data:
+            yield data
+    yield compressor.flush()
@@ -0,0 +1,175 @@
+import asyncio
+import json
+import time
+from typing import Any, Dict, Optional
+
+from app.core.config import settings
+from app.core.http_client import get_http_client
+from app.services.cache_store import CacheStore, cache_store
+from app.services.rate_limiter import rate_limiter
+
+
+class FeedEntry:
+    """Flux brut d'une source, avec ses validateurs HTTP."""
+
+    __slots__ = ("body", "etag", "last_modified", "fetched_at", "_data")
+
+    def __init__(
+        self,
+        body: bytes,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+        fetched_at: Optional[float] = None
+    ):
+        self.body = body
+        self.etag = etag
+        self.last_modified = last_modified
+        self.fetched_at = fetched_at if fetched_at is not None else time.time()
+        self._data = None
+
+    def json(self) -> Any:
+        """Retourne le flux décodé (décodé une seule fois, partagé en lecture)."""
+        if self._data is None:
+            self._data = json.loads(self.body)
+        return self._data
+
+
+class FeedCache:
+    """
+    Cache TTL des flux complets des sources (RemoteOK, Jobicy).
+
+    Toutes les recherches faites pendant le TTL sont servies par un seul
+    téléchargement. À expiration, le flux est revalidé avec
+    ETag / If-Modified-Since : un 304 prolonge l'entrée sans retélécharger.
+    Avec un stockage partagé (`cache_store`), chaque flux y est aussi écrit :
+    un flux téléchargé par un worker sert tous les autres, et un worker
+    redémarré part avec un cache chaud.
+    """
+
+    NAMESPACE = "feeds"
+
+    def __init__(self, ttl: float, store: CacheStore):
+        self.ttl = ttl
+        self.store = store
+        self._entries: Dict[str, FeedEntry] = {}
+        self._locks: Dict[str, asyncio.Lock] = {}
+
+    def _is_fresh(self, entry: Optional[FeedEntry]) -> bool:
+        return entry is not None and time.time() - entry.fetched_at < self.ttl
+
+    async def get(
+        self,
+        source: str,
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None
+    ) -> FeedEntry:
+        """
+        Retourne le flux d'une source, depuis le cache si possible.
+
+        Args:
+            source: Nom de la source (clé du cache)
+            url: URL du flux
+            params: Paramètres de la requête
+            headers: En-têtes de la requête
+
+        Returns:
+            Entrée du cache contenant le flux brut
+
+        Raises:
+            httpx.HTTPStatusError: Réponse en erreur de la source
+            httpx.RequestError: Erreur de connexion
+        """
+        entry = self._entries.get(source)
+        if self._is_fresh(entry):
+            return entry
+
+        # Une seule requête amont par source, même sous forte concurrence
+        lock = self._locks.setdefault(source, asyncio.Lock())
+        async with lock:
+            entry = await self._lookup(source)
+            if self._is_fresh(entry):
+                return entry
+
+            request_headers = dict(headers or {})
+            if entry is not None:
+                if entry.etag:
+                    request_headers["If-None-Match"] = entry.etag
+                if entry.last_modified:
+                    request_headers["If-Modified-Since"] = entry.last_modified
+
+            await rate_limiter.acquire(url)
+            client = get_http_client()
+            response = await client.get(url, params=params, headers=request_headers)
+
+            if response.status_code == 304 and entry is not None:
+                entry.fetched_at = time.time()
+            else:
+                response.raise_for_status()
+                entry = FeedEntry(
+                    body=response.content,
+                    etag=response.headers.get("ETag"),
+                    last_modified=response.headers.get("Last-Modified")
+                )
+                self._entries[source] = entry
+
+            await self._save(source, entry)
+            return entry
+
+    def clear(self) -> None:
+        """Vide le cache, mémoire du processus et stockage."""
+        self._entries.clear()
+        self.store.clear(self.NAMESPACE)
+
+    async def _lookup(self, source: str) -> Optional[FeedEntry]:
+        """Entrée la plus récente entre la mémoire du processus et le stockage."""
+        entry = self._entries.get(source)
+        if self._is_fresh(entry) or not self.store.shared:
+            return entry
+        try:
+            stored = decode_entry(await self.store.aget(self.NAMESPACE, source))
+        except Exception:
+            # Stockage indisponible : on retombe sur la mémoire du processus
+            stored = None
+        if stored is not None and (entry is None or stored.fetched_at > entry.fetched_at):
+            self._entries[source] = entry = stored
+        return entry
+
+    async def _save(self, source: str, entry: FeedEntry) -> None:
+        if not self.store.shared:
+            return
+        try:
+            await self.store.aset(self.NAMESPACE, source, encode_entry(entry))
+        except Exception:
+            # Le partage n'est qu'une optimisation : le flux reste servi
+            pass
+
+
+def encode_entry(entry: FeedEntry) -> bytes:
+    """Sérialise une entrée : métadonnées JSON, saut de ligne, flux brut."""
+    meta = {
+        "etag": entry.etag,
+        "last_modified": entry.last_modified,
+        "fetched_at": entry.fetched_at
+    }
+    return json.dumps(meta).encode("utf-8") + b"\n" + entry.body
+
+
+def decode_entry(value: Optional[bytes]) -> Optional[FeedEntry]:
+    """Relit une entrée sérialisée par `encode_entry` (None si illisible)."""
+    if not value:
+        return None
+    header, _, body = value.partition(b"\n")
+    try:
+        meta = json.loads(header)
+    except ValueError:
+        return None
+    return FeedEntry(
+        body=body,
+        etag=meta.get("etag"),
+        last_modified=meta.get("last_modified"),
+        fetched_at=meta.get("fetched_at", 0.0)
+    )
+
+
+feed_cache = FeedCache(ttl=settings.feed_cache_ttl, store=cache_store)
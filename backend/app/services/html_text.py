@@ -0,0 +1,102 @@
+import html
+import re
+from functools import lru_cache
+from typing import List, Optional
+
+# Balises, commentaires, doctype et instructions ; un `<` qui n'ouvre pas
+# une balise (« a < b ») reste du texte
+MARKUP_RE = re.compile(
+    r"<(/?)([a-zA-Z][a-zA-Z0-9]*)(?:[^>\"']|\"[^\"]*\"|'[^']*')*>"
+    r"|<!--.*?-->|<![^>]*>|<\?[^>]*>",
+    re.DOTALL
+)
+# Début de balise coupé par une troncature du HTML
+TRUNCATED_TAG_RE = re.compile(r"<(?:/?[a-zA-Z]|!)[^>]*$|</?$")
+
+# Balises dont le contenu n'est pas du texte
+SKIPPED_TAGS = {"script", "style", "head", "template", "noscript", "svg"}
+# Balises qui séparent des blocs de texte
+BLOCK_TAGS = {
+    "address", "article", "aside", "blockquote", "br", "dd", "div", "dl", "dt",
+    "fieldset", "figcaption", "figure", "footer", "form", "h1", "h2", "h3",
+    "h4", "h5", "h6", "header", "hr", "li", "main", "nav", "ol", "p", "pre",
+    "section", "table", "td", "th", "tr", "ul",
+}
+
+
+def html_to_text(markup: str, max_chars: Optional[int] = None) -> str:
+    """
+    Extrait le texte d'un fragment HTML, sans construire d'arbre DOM.
+
+    Le fragment est parcouru balise par balise : le texte entre deux
+    balises est décodé (entités HTML) et ses espaces normalisés, les
+    balises de bloc deviennent des retours à la ligne et le contenu des
+    scripts/styles est ignoré. Le parcours s'arrête dès que `max_chars`
+    caractères de texte ont été produits.
+
+    Args:
+        markup: Fragment HTML (éventuellement tronqué)
+        max_chars: Longueur maximale du texte produit
+
+    Returns:
+        Texte brut
+    """
+    parts: List[str] = []
+    length = 0
+    separator = ""
+    skipping: Optional[str] = None
+    position = 0
+
+    def add_text(raw: str) -> None:
+        nonlocal length, separator
+        if "&" in raw:
+            raw = html.unescape(raw)
+        words = raw.split()
+        if not words:
+            if raw and not separator:
+                separator = " "
+            return
+        if parts and (separator or raw[0].isspace()):
+            parts.append(separator or " ")
+            length += 1
+        text = " ".join(words)
+        parts.append(text)
+        length += len(text)
+        separator = " " if raw[-1].isspace() else ""
+
+    for match in MARKUP_RE.finditer(markup):
+        if skipping is None and match.start() > position:
+            add_text(markup[position:match.start()])
+            if max_chars is not None and length >= max_chars:
+                break
+        position = match.end()
+
+        name = match.group(2)
+        if name is None:
+            continue
+        name = name.lower()
+        closing = bool(match.group(1))
+        if skipping is not None:
+            if closing and name == skipping:
+                skipping = None
+        elif name in SKIPPED_TAGS and not closing:
+            skipping = name
+        elif name in BLOCK_TAGS:
+            separator = "\n"
+    else:
+        if skipping is None and position < len(markup):
+            add_text(TRUNCATED_TAG_RE.sub("", markup[position:]))
+
+    text = "".join(parts)
+    return text[:max_chars].rstrip() if max_chars is not None else text
+
+
+@lru_cache(maxsize=4096)
+def clean_description(markup: str, max_chars: int) -> str:
+    """
+    Texte d'une description HTML, mémorisé.
+
+    Une même offre est sérialisée à chaque page servie ou export : le
+    nettoyage n'est fait qu'une fois par description.
+    """
+    return html_to_text(markup, max_chars)
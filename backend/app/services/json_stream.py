@@ -0,0 +1,119 @@
+import json
+import re
+from typing import Iterator
+
+# Lecture incrémentale d'un tableau JSON (flux des sources) : les éléments
+# sont délimités sur les octets bruts, sans décoder le flux ; chacun n'est
+# décodé que si l'appelant le retient.
+
+STRING = rb'"[^"\\]*(?:\\.[^"\\]*)*"'
+# Contenu sans imbrication : caractères hors structure et chaînes
+FLAT = rb'(?:[^{}\[\]"]|' + STRING + rb')*'
+# Objet JSON d'au plus deux niveaux (tags, lieux…), reconnu d'un seul tenant
+# par le moteur d'expressions régulières ; les alternatives commencent par
+# des caractères distincts, sans retour arrière coûteux en cas d'échec
+SHALLOW_OBJECT_RE = re.compile(
+    rb'\{(?:[^{}\[\]"]|' + STRING + rb'|\[' + FLAT + rb'\]|\{' + FLAT + rb'\})*\}',
+    re.DOTALL
+)
+WHITESPACE_RE = re.compile(rb"[ \t\r\n]*")
+# Reste d'une chaîne après son guillemet ouvrant, guillemet fermant inclus
+STRING_TAIL_RE = re.compile(rb'[^"\\]*(?:\\.[^"\\]*)*"', re.DOTALL)
+# Nombre, true, false ou null
+SCALAR_RE = re.compile(rb"[^\s,\]}]+")
+# Prochain caractère qui change la profondeur dans une valeur imbriquée
+NESTED_RE = re.compile(rb'[\[\]{}"]')
+
+QUOTE, OPEN_OBJECT, OPEN_ARRAY = ord('"'), ord("{"), ord("[")
+
+
+def iter_array_items(data: bytes) -> Iterator[bytes]:
+    """
+    Produit un à un les éléments d'un tableau JSON, encore encodés.
+
+    Le flux brut reste entier en mémoire (le cache de flux en garde les
+    octets) ; seul l'élément courant en est copié, et aucun objet Python
+    n'est construit pour les éléments que l'appelant écarte : le surcoût
+    du décodage ne dépend que de l'élément courant.
+
+    Un flux qui n'est pas un tableau (réponse d'erreur de la source) ne
+    produit rien ; une erreur de syntaxe n'est détectée qu'en atteignant
+    l'élément fautif.
+
+    Args:
+        data: Flux brut (UTF-8)
+
+    Yields:
+        Octets de chaque élément, à décoder avec `json.loads`
+
+    Raises:
+        json.JSONDecodeError: Flux JSON invalide
+    """
+    pos = _skip_whitespace(data, 0)
+    if data[pos:pos + 1] != b"[":
+        return
+    pos = _skip_whitespace(data, pos + 1)
+    if data[pos:pos + 1] == b"]":
+        return
+
+    while True:
+        end = _value_end(data, pos)
+        yield data[pos:end]
+        pos = _skip_whitespace(data, end)
+        separator = data[pos:pos + 1]
+        if separator == b"]":
+            return
+        if separator != b",":
+            raise _syntax_error("',' ou ']' attendu", pos)
+        pos = _skip_whitespace(data, pos + 1)
+
+
+def _syntax_error(message: str, pos: int) -> json.JSONDecodeError:
+    # Même exception que `json.loads` (la position est celle de l'octet fautif)
+    return json.JSONDecodeError(message, "", pos)
+
+
+def _skip_whitespace(data: bytes, pos: int) -> int:
+    return WHITESPACE_RE.match(data, pos).end()
+
+
+def _string_end(data: bytes, pos: int) -> int:
+    match = STRING_TAIL_RE.match(data, pos + 1)
+    if match is None:
+        raise _syntax_error("chaîne non terminée", pos)
+    return match.end()
+
+
+def _value_end(data: bytes, pos: int) -> int:
+    """Position qui suit la valeur JSON commençant à `pos`."""
+    if pos >= len(data):
+        raise _syntax_error("flux JSON tronqué", pos)
+    first = data[pos]
+    if first == QUOTE:
+        return _string_end(data, pos)
+    if first not in (OPEN_OBJECT, OPEN_ARRAY):
+        match = SCALAR_RE.match(data, pos)
+        if match is None:
+            raise _syntax_error("valeur attendue", pos)
+        return match.end()
+
+    if first == OPEN_OBJECT:
+        match = SHALLOW_OBJECT_RE.match(data, pos)
+        if match is not None:
+            return match.end()
+
+    # Imbrication plus profonde (ou flux invalide) : suivi de la profondeur
+    depth = 0
+    while True:
+        match = NESTED_RE.search(data, pos)
+        if match is None:
+            raise _syntax_error("flux JSON tronqué", len(data))
+        pos = match.start()
+        char = data[pos]
+        if char == QUOTE:
+            pos = _string_end(data, pos)
+            continue
+        depth += 1 if char in (OPEN_OBJECT, OPEN_ARRAY) else -1
+        pos += 1
+        if depth == 0:
+            return pos
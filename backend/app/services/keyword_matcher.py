@@ -0,0 +1,354 @@
+import re
+from functools import lru_cache
+from typing import Callable, List, Optional, Tuple
+
+# Opérateurs reconnus (en majuscules uniquement, pour ne pas confondre avec
+# les mots « and », « or »… d'une recherche en texte libre)
+OPERATORS = {"AND", "OR", "NOT"}
+
+TOKEN_RE = re.compile(r'"([^"]*)"?|[()]|[^\s()"]+')
+WORD_CHAR_RE = re.compile(r"\w")
+
+# Les champs d'une offre sont assemblés avec un séparateur qui n'est ni un
+# caractère de mot ni un espace : aucun terme ni phrase ne peut le traverser
+FIELD_SEPARATOR = "\x00"
+
+# Premiers mots de terme dont JSON n'échappe aucun caractère : absents des
+# octets encodés d'un champ, ils sont absents de son texte décodé
+RAW_SAFE_RE = re.compile(r"[a-z0-9_.+#-]+")
+
+Predicate = Callable[[str], bool]
+# Évaluation sur octets encodés : False (ne peut pas correspondre) ou None
+# (indéterminé), True seulement sous un NOT
+RawPredicate = Callable[[bytes], Optional[bool]]
+
+
+def _normalize_term(term: str) -> str:
+    return " ".join(term.lower().split())
+
+
+def _term_regex(term: str) -> str:
+    """
+    Expression régulière d'un terme (mot ou phrase), bornée aux mots.
+
+    Les bornes ne s'appliquent qu'aux extrémités alphanumériques : `java` ne
+    correspond pas à `javascript`, mais `c++` ou `.net` restent utilisables.
+    Le motif commence par le texte littéral (borne gauche vérifiée après
+    coup par un lookbehind) pour que le moteur `re` puisse sauter directement
+    aux occurrences au lieu de tester chaque position du texte.
+    """
+    words = [re.escape(word) for word in term.split()]
+    if WORD_CHAR_RE.match(term[0]):
+        words[0] = rf"{words[0]}(?<!\w{words[0]})"
+    regex = r"\s+".join(words)
+    if WORD_CHAR_RE.match(term[-1]):
+        regex += r"(?!\w)"
+    return regex
+
+
+class _Parser:
+    """
+    Analyseur descendant de la syntaxe de recherche.
+
+    Priorités : NOT (ou `-terme`) > AND > OR ; deux termes juxtaposés sont
+    liés par OR, sauf un terme exclu qui restreint alors toute la requête.
+    La syntaxe est tolérante : parenthèses non fermées ou opérateurs
+    orphelins sont ignorés plutôt que de faire échouer la recherche.
+    """
+
+    def __init__(self, keywords: str):
+        self.tokens: List[Tuple[str, str]] = []
+        for match in TOKEN_RE.finditer(keywords):
+            text = match.group(0)
+            if text.startswith('"'):
+                phrase = _normalize_term(match.group(1))
+                if phrase:
+                    self.tokens.append(("term", phrase))
+            elif text in ("(", ")"):
+                self.tokens.append((text, text))
+            elif text in OPERATORS:
+                self.tokens.append((text, text))
+            elif text == "-":
+                self.tokens.append(("NOT", text))
+            elif text.startswith("-"):
+                self.tokens.append(("NOT", "-"))
+                self.tokens.append(("term", _normalize_term(text[1:])))
+            else:
+                self.tokens.append(("term", _normalize_term(text)))
+        self.position = 0
+
+    def _peek(self) -> Optional[str]:
+        if self.position < len(self.tokens):
+            return self.tokens[self.position][0]
+        return None
+
+    def _next(self) -> Tuple[str, str]:
+        token = self.tokens[self.position]
+        self.position += 1
+        return token
+
+    def parse(self):
+        nodes = []
+        while self._peek() is not None:
+            node = self._or()
+            if node is not None:
+                nodes.append(node)
+            elif self._peek() is not None:
+                self._next()  # « ) » ou opérateur orphelin
+        return _combine("or", nodes)
+
+    def _or(self):
+        nodes = []
+        excluded = []
+        explicit_or = False
+        while self._peek() not in (None, ")"):
+            if self._peek() == "OR":
+                self._next()
+                explicit_or = True
+                continue
+            node = self._and()
+            if node is None:
+                break
+            # Un terme exclu juxtaposé (`python -senior`) restreint toute la
+            # requête, au lieu d'élargir la disjonction
+            if node[0] == "not" and nodes and not explicit_or:
+                excluded.append(node)
+            else:
+                nodes.append(node)
+            explicit_or = False
+        disjunction = _combine("or", nodes)
+        if disjunction is not None:
+            excluded.insert(0, disjunction)
+        return _combine("and", excluded)
+
+    def _and(self):
+        nodes = []
+        node = self._not()
+        if node is not None:
+            nodes.append(node)
+        while self._peek() == "AND":
+            self._next()
+            node = self._not()
+            if node is not None:
+                nodes.append(node)
+        return _combine("and", nodes)
+
+    def _not(self):
+        if self._peek() == "NOT":
+            self._next()
+            node = self._not()
+            return ("not", node) if node is not None else None
+        return self._atom()
+
+    def _atom(self):
+        kind = self._peek()
+        if kind == "term":
+            return ("term", self._next()[1])
+        if kind == "(":
+            self._next()
+            node = self._or()
+            if self._peek() == ")":
+                self._next()
+            return node
+        if kind in ("AND", "OR"):
+            self._next()  # opérateur sans opérande gauche
+            return self._atom()
+        return None
+
+
+def _combine(kind: str, nodes: list):
+    if not nodes:
+        return None
+    if len(nodes) == 1:
+        return nodes[0]
+    flat = []
+    for node in nodes:
+        # (a AND b) AND c == a AND b AND c
+        flat.extend(node[1] if node[0] == kind else [node])
+    return (kind, flat)
+
+
+class KeywordMatcher:
+    """
+    Requête de mots-clés compilée, réutilisable sur toutes les offres d'un flux.
+
+    Syntaxe : mots et "phrases exactes", combinés par OR (implicite entre
+    deux termes), AND et NOT (ou `-terme`), avec parenthèses. La
+    correspondance ignore la casse et respecte les limites de mots.
+
+    Les champs sont assemblés et passés en minuscules une seule fois par
+    offre, puis chaque terme est cherché par `str.find` avant d'être
+    confirmé par une expression régulière ; l'expression booléenne est
+    évaluée en court-circuit.
+    """
+
+    __slots__ = (
+        "keywords", "terms", "excluded", "_predicate", "_excluded", "_screen"
+    )
+
+    def __init__(self, keywords: str):
+        self.keywords = keywords
+        tree = _Parser(keywords).parse()
+
+        positive: List[str] = []
+        negated: List[str] = []
+        self._collect(tree, False, positive, negated)
+        # Termes recherchés (hors termes exclus), sans doublons
+        self.terms: List[str] = list(dict.fromkeys(positive))
+        # Termes exclus de toute la requête (`python -senior`)
+        self.excluded: List[str] = [
+            child[1][1]
+            for child in (tree[1] if tree is not None and tree[0] == "and" else [tree])
+            if child is not None and child[0] == "not" and child[1][0] == "term"
+        ]
+        self._predicate = self._compile(tree)
+        self._excluded = self._compile(
+            ("or", [("term", term) for term in self.excluded])
+        ) if self.excluded else None
+        self._screen = self._compile_screen(tree)
+
+    @classmethod
+    def _collect(cls, node, negative: bool, positive: List[str], negated: List[str]) -> None:
+        if node is None:
+            return
+        kind = node[0]
+        if kind == "term":
+            (negated if negative else positive).append(node[1])
+        elif kind == "not":
+            cls._collect(node[1], not negative, positive, negated)
+        else:
+            for child in node[1]:
+                cls._collect(child, negative, positive, negated)
+
+    def _compile(self, node) -> Optional[Predicate]:
+        if node is None:
+            return None
+        kind = node[0]
+        if kind == "term":
+            return _term_predicate(node[1])
+        if kind == "not":
+            child = self._compile(node[1])
+            return lambda text: not child(text)
+        children = [self._compile(child) for child in node[1]]
+        if kind == "and":
+            def conjunction(text: str) -> bool:
+                for child in children:
+                    if not child(text):
+                        return False
+                return True
+            return conjunction
+
+        def disjunction(text: str) -> bool:
+            for child in children:
+                if child(text):
+                    return True
+            return False
+        return disjunction
+
+    def _compile_screen(self, node) -> Optional[RawPredicate]:
+        if node is None:
+            return None
+        kind = node[0]
+        if kind == "term":
+            return _term_screen(node[1])
+        if kind == "not":
+            child = self._compile_screen(node[1])
+
+            def negation(raw: bytes) -> Optional[bool]:
+                value = child(raw)
+                return None if value is None else not value
+            return negation
+        children = [self._compile_screen(child) for child in node[1]]
+        # Logique à trois valeurs : une seule valeur décisive suffit
+        decisive = kind == "or"
+
+        def combination(raw: bytes) -> Optional[bool]:
+            result: Optional[bool] = not decisive
+            for child in children:
+                value = child(raw)
+                if value is decisive:
+                    return decisive
+                if value is None:
+                    result = None
+            return result
+        return combination
+
+    def matches(self, *fields: Optional[str]) -> bool:
+        """
+        Indique si l'offre décrite par ces champs correspond à la requête.
+
+        Les champs (titre, entreprise, description, tags…) sont examinés
+        ensemble ; une requête vide accepte tout.
+        """
+        if self._predicate is None:
+            return True
+        return self._predicate(_join_fields(fields))
+
+    def rejects(self, *fields: Optional[str]) -> bool:
+        """
+        Indique si ces champs contiennent un terme exclu de toute la requête.
+
+        Utile quand seule une partie de l'offre est connue (titre d'une page
+        de résultats) : l'offre n'est écartée que si elle ne peut pas
+        correspondre, quel que soit le reste de son contenu.
+        """
+        if self._excluded is None:
+            return False
+        return self._excluded(_join_fields(fields))
+
+    def may_match(self, raw: bytes) -> bool:
+        """
+        Indique si des champs encore encodés en JSON (octets bruts d'un
+        flux) peuvent correspondre à la requête, sans les décoder.
+
+        Seuls les termes dont le premier mot ne contient que des caractères
+        que JSON n'échappe jamais (lettres et chiffres ASCII, `_.+#-`) sont
+        décidables : absents des octets, ils sont absents du texte. False
+        signifie que `matches` échouerait sur les champs décodés ; True
+        qu'il faut les décoder pour le savoir.
+        """
+        if self._screen is None:
+            return True
+        return self._screen(raw.lower()) is not False
+
+    def __repr__(self) -> str:
+        return f"KeywordMatcher({self.keywords!r})"
+
+
+def _join_fields(fields: Tuple[Optional[str], ...]) -> str:
+    return FIELD_SEPARATOR.join([field for field in fields if field]).lower()
+
+
+def _term_predicate(term: str) -> Predicate:
+    # str.find (recherche rapide en C) écarte les offres sans le premier mot
+    # du terme ; l'expression régulière ne vérifie qu'à partir de l'occurrence
+    literal = term.split()[0]
+    search = re.compile(_term_regex(term)).search
+
+    def predicate(text: str) -> bool:
+        position = text.find(literal)
+        return position >= 0 and search(text, position) is not None
+
+    return predicate
+
+
+def _term_screen(term: str) -> RawPredicate:
+    literal = term.split()[0]
+    if not RAW_SAFE_RE.fullmatch(literal):
+        return lambda raw: None
+    encoded = literal.encode("ascii")
+    return lambda raw: None if encoded in raw else False
+
+
+@lru_cache(maxsize=256)
+def compile_keywords(keywords: str) -> KeywordMatcher:
+    """
+    Compile (une seule fois) les mots-clés d'une recherche.
+
+    Args:
+        keywords: Mots-clés saisis, voir `KeywordMatcher` pour la syntaxe
+
+    Returns:
+        Matcher partagé par tous les scrapers pour ces mots-clés
+    """
+    return KeywordMatcher(keywords)
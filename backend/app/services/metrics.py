@@ -0,0 +1,284 @@
+import bisect
+import threading
+import time
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+# Bornes des histogrammes de durée (secondes) : de la milliseconde (tri,
+# pagination) à la minute (timeout WTTJ)
+DURATION_BUCKETS = (
+    0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0
+)
+# Bornes des histogrammes de nombre d'offres
+COUNT_BUCKETS = (0, 1, 5, 10, 25, 50, 100, 250, 500, 1000, 5000)
+
+LabelValues = Tuple[str, ...]
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str]) -> str:
+    if not names:
+        return ""
+    pairs = ",".join(f'{name}="{_escape(value)}"' for name, value in zip(names, values))
+    return "{" + pairs + "}"
+
+
+class _Metric(ABC):
+    """Base commune : nom, aide et séries indexées par valeurs d'étiquettes."""
+
+    kind = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        # Les étapes CPU (déduplication, index) tournent dans des threads
+        self._lock = threading.Lock()
+
+    def _key(self, labels: Dict[str, str]) -> LabelValues:
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    def render(self) -> List[str]:
+        lines = [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} {self.kind}",
+        ]
+        with self._lock:
+            lines.extend(self._samples())
+        return lines
+
+    @abstractmethod
+    def _samples(self) -> List[str]:
+        """Lignes des séries, appelé sous le verrou."""
+
+
+class Counter(_Metric):
+    """Compteur monotone."""
+
+    kind = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        super().__init__(name, documentation, labelnames)
+        self._values: Dict[LabelValues, float] = {}
+
+    def inc(self, amount: float = 1.0, **labels: str) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def value(self, **labels: str) -> float:
+        return self._values.get(self._key(labels), 0.0)
+
+    def _samples(self) -> List[str]:
+        return [
+            f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(value)}"
+            for key, value in sorted(self._values.items())
+        ]
+
+
+class Histogram(_Metric):
+    """Histogramme à bornes fixes (buckets cumulés, somme et nombre)."""
+
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DURATION_BUCKETS
+    ):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        # Par série : [compteurs par bucket (+Inf en dernier), somme]
+        self._series: Dict[LabelValues, Tuple[List[int], List[float]]] = {}
+
+    def observe(self, value: float, **labels: str) -> None:
+        key = self._key(labels)
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                series = self._series[key] = ([0] * (len(self.buckets) + 1), [0.0])
+            series[0][index] += 1
+            series[1][0] += value
+
+    def count(self, **labels: str) -> int:
+        series = self._series.get(self._key(labels))
+        return sum(series[0]) if series else 0
+
+    def _samples(self) -> List[str]:
+        lines = []
+        bucket_labels = self.labelnames + ("le",)
+        for key, (counts, total) in sorted(self._series.items()):
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float("inf"),), counts):
+                cumulative += count
+                labels = _format_labels(bucket_labels, key + (_format_value(bound),))
+                lines.append(f"{self.name}_bucket{labels} {cumulative}")
+            labels = _format_labels(self.labelnames, key)
+            lines.append(f"{self.name}_sum{labels} {_format_value(total[0])}")
+            lines.append(f"{self.name}_count{labels} {cumulative}")
+        return lines
+
+
+class MetricsRegistry:
+    """Ensemble des métriques du processus, exposées au format texte Prometheus."""
+
+    def __init__(self):
+        self._metrics: List[_Metric] = []
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        return self._register(Counter(name, documentation, labelnames))
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DURATION_BUCKETS
+    ) -> Histogram:
+        return self._register(Histogram(name, documentation, labelnames, buckets))
+
+    def _register(self, metric):
+        self._metrics.append(metric)
+        return metric
+
+    def render(self) -> str:
+        """Exposition au format texte Prometheus (version 0.0.4)."""
+        lines: List[str] = []
+        for metric in self._metrics:
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+class ServerTiming:
+    """
+    Durées des étapes d'une requête, pour l'en-tête `Server-Timing`.
+
+    Les étapes répétées (une par source, ou plusieurs tentatives) sont
+    additionnées sous le même nom.
+    """
+
+    __slots__ = ("started", "_durations")
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self._durations: Dict[str, float] = {}
+
+    def add(self, name: str, seconds: float) -> None:
+        self._durations[name] = self._durations.get(name, 0.0) + seconds
+
+    def header(self) -> str:
+        """Valeur de l'en-tête, durées en millisecondes, total en dernier."""
+        entries = dict(self._durations)
+        entries["total"] = time.perf_counter() - self.started
+        return ", ".join(
+            f"{name};dur={seconds * 1000:.1f}" for name, seconds in entries.items()
+        )
+
+
+# Starlette complète avec « ; charset=utf-8 »
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4"
+
+registry = MetricsRegistry()
+
+scraper_attempt_duration = registry.histogram(
+    "jobscraper_scraper_attempt_duration_seconds",
+    "Durée de chaque tentative de scraping, par source et résultat",
+    ("source", "outcome")
+)
+scraper_retries = registry.counter(
+    "jobscraper_scraper_retries_total",
+    "Nouvelles tentatives après l'échec d'un scraper",
+    ("source",)
+)
+scraper_coalesced = registry.counter(
+    "jobscraper_scraper_coalesced_total",
+    "Scrapings évités en rejoignant un scraping identique en cours",
+    ("source",)
+)
+scraper_errors = registry.counter(
+    "jobscraper_scraper_errors_total",
+    "Échecs de tentatives de scraping, par source et type d'erreur",
+    ("source", "error_type")
+)
+retry_budget_exhausted = registry.counter(
+    "jobscraper_retry_budget_exhausted_total",
+    "Nouvelles tentatives refusées faute de budget de retries",
+    ("source",)
+)
+scraper_results = registry.histogram(
+    "jobscraper_scraper_results",
+    "Nombre d'offres renvoyées par un scraping réussi",
+    ("source",),
+    buckets=COUNT_BUCKETS
+)
+rate_limit_wait = registry.histogram(
+    "jobscraper_rate_limit_wait_seconds",
+    "Attente imposée par le limiteur de débit avant une requête amont",
+    ("host",)
+)
+stage_duration = registry.histogram(
+    "jobscraper_stage_duration_seconds",
+    "Durée des étapes du pipeline de recherche",
+    ("stage",)
+)
+search_requests = registry.counter(
+    "jobscraper_search_requests_total",
+    "Recherches servies, par mode effectif (cache, index, live, stream)",
+    ("mode",)
+)
+search_results = registry.histogram(
+    "jobscraper_search_results",
+    "Nombre d'offres d'un jeu de résultats après fusion et filtres",
+    buckets=COUNT_BUCKETS
+)
+
+# Mesures de la requête en cours (None hors d'une requête instrumentée)
+current_timing: ContextVar[Optional[ServerTiming]] = ContextVar(
+    "current_timing", default=None
+)
+
+
+def record_timing(name: str, seconds: float) -> None:
+    """Ajoute une durée à l'en-tête `Server-Timing` de la requête en cours."""
+    timing = current_timing.get()
+    if timing is not None:
+        timing.add(name, seconds)
+
+
+@contextmanager
+def timed_stage(stage: str) -> Iterator[None]:
+    """Mesure une étape du pipeline (histogramme + `Server-Timing`)."""
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        elapsed = time.perf_counter() - started
+        stage_duration.observe(elapsed, stage=stage)
+        record_timing(stage, elapsed)
+
+
+@contextmanager
+def request_timing() -> Iterator[ServerTiming]:
+    """Active la collecte `Server-Timing` pour la requête en cours."""
+    timing = ServerTiming()
+    token = current_timing.set(timing)
+    try:
+        yield timing
+    finally:
+        current_timing.reset(token)
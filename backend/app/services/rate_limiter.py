@@ -0,0 +1,91 @@
+import asyncio
+import time
+from typing import Dict, Optional
+from urllib.parse import urlsplit
+
+from app.core.config import settings
+from app.services.metrics import rate_limit_wait
+
+
+class TokenBucket:
+    """
+    Seau à jetons : `rate` requêtes par seconde en régime établi, avec des
+    rafales de `capacity` requêtes.
+
+    Chaque appel réserve son jeton immédiatement (le solde peut devenir
+    négatif) puis attend son tour : les appelants concurrents sont servis
+    dans l'ordre, sans verrou.
+    """
+
+    __slots__ = ("rate", "capacity", "tokens", "updated_at")
+
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = max(1.0, capacity)
+        self.tokens = self.capacity
+        self.updated_at = time.monotonic()
+
+    def reserve(self) -> float:
+        """Réserve un jeton et retourne l'attente nécessaire (en secondes)."""
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+        self.updated_at = now
+        self.tokens -= 1
+        return -self.tokens / self.rate if self.tokens < 0 else 0.0
+
+    def refund(self) -> None:
+        """Rend un jeton réservé mais non utilisé."""
+        self.tokens = min(self.capacity, self.tokens + 1)
+
+
+class HostRateLimiter:
+    """
+    Limiteur de débit du processus, un seau à jetons par hôte amont.
+
+    Une requête isolée part sans attendre ; seules les rafales au-delà de
+    `burst` requêtes sont espacées d'un intervalle `delay` par hôte (ou de
+    l'intervalle propre à l'hôte dans `host_delays`).
+    """
+
+    def __init__(self, delay: float, burst: int, host_delays: Optional[Dict[str, float]] = None):
+        self.delay = delay
+        self.burst = burst
+        self.host_delays = host_delays or {}
+        self._buckets: Dict[str, TokenBucket] = {}
+
+    def _bucket(self, host: str) -> Optional[TokenBucket]:
+        bucket = self._buckets.get(host)
+        if bucket is None:
+            delay = self.host_delays.get(host, self.delay)
+            if delay <= 0:
+                return None
+            bucket = self._buckets[host] = TokenBucket(1.0 / delay, self.burst)
+        return bucket
+
+    async def acquire(self, url: str) -> None:
+        """
+        Attend le droit d'envoyer une requête vers l'hôte de `url`.
+
+        Args:
+            url: URL (ou hôte) de la requête à venir
+        """
+        host = urlsplit(url).hostname or url
+        bucket = self._bucket(host)
+        if bucket is None:
+            return
+        wait = bucket.reserve()
+        rate_limit_wait.observe(wait, host=host)
+        if wait <= 0:
+            return
+        try:
+            await asyncio.sleep(wait)
+        except asyncio.CancelledError:
+            bucket.refund()
+            raise
+
+
+rate_limiter = HostRateLimiter(
+    delay=settings.scraper_delay,
+    burst=settings.scraper_burst,
+    host_delays=settings.scraper_host_delays
+)
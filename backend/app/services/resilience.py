@@ -0,0 +1,166 @@
+import time
+from collections import deque
+from typing import Deque, Dict, List, Optional
+
+from app.core.config import settings
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """
+    Disjoncteur d'une source.
+
+    Après `failure_threshold` scrapings consécutifs en échec, la source est
+    écartée (ouvert) pendant `cooldown` secondes. Passé ce délai, un seul
+    scraping d'essai est laissé passer (semi-ouvert) : s'il réussit la
+    source est rétablie, sinon elle est de nouveau écartée.
+    """
+
+    __slots__ = (
+        "source", "failure_threshold", "cooldown", "failures", "opened_at",
+        "last_error", "_trial_running"
+    )
+
+    def __init__(self, source: str, failure_threshold: int, cooldown: float):
+        self.source = source
+        self.failure_threshold = max(1, failure_threshold)
+        self.cooldown = cooldown
+        self.failures = 0
+        self.opened_at: Optional[float] = None
+        self.last_error: Optional[str] = None
+        self._trial_running = False
+
+    @property
+    def state(self) -> str:
+        if self.opened_at is None:
+            return CLOSED
+        if time.monotonic() - self.opened_at < self.cooldown:
+            return OPEN
+        return HALF_OPEN
+
+    @property
+    def retry_in(self) -> float:
+        """Secondes avant le prochain scraping d'essai (0 si la source est rétablie)."""
+        if self.opened_at is None:
+            return 0.0
+        return max(self.cooldown - (time.monotonic() - self.opened_at), 0.0)
+
+    def allow(self) -> bool:
+        """Indique si un scraping peut être lancé maintenant (et réserve l'essai)."""
+        state = self.state
+        if state == CLOSED:
+            return True
+        if state == HALF_OPEN and not self._trial_running:
+            self._trial_running = True
+            return True
+        return False
+
+    def record_success(self) -> None:
+        self.failures = 0
+        self.opened_at = None
+        self.last_error = None
+        self._trial_running = False
+
+    def record_failure(self, error: Optional[BaseException] = None) -> None:
+        self.failures += 1
+        if error is not None:
+            self.last_error = str(error)
+        if self._trial_running or self.failures >= self.failure_threshold:
+            self.opened_at = time.monotonic()
+        self._trial_running = False
+
+    def release(self) -> None:
+        """Libère l'essai réservé sans conclure (scraping annulé)."""
+        self._trial_running = False
+
+    def snapshot(self) -> dict:
+        return {
+            "state": self.state,
+            "failures": self.failures,
+            "retryIn": round(self.retry_in, 1),
+            "lastError": self.last_error,
+        }
+
+
+class CircuitBreakers:
+    """Disjoncteurs de toutes les sources, créés à la demande."""
+
+    def __init__(self, failure_threshold: int, cooldown: float):
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+        self._breakers: Dict[str, CircuitBreaker] = {}
+
+    def get(self, source: str) -> CircuitBreaker:
+        breaker = self._breakers.get(source)
+        if breaker is None:
+            breaker = self._breakers[source] = CircuitBreaker(
+                source, self.failure_threshold, self.cooldown
+            )
+        return breaker
+
+    def degraded(self, sources: Optional[List[str]] = None) -> List[str]:
+        """Sources actuellement écartées (disjoncteur ouvert ou en essai)."""
+        names = sources if sources is not None else sorted(self._breakers)
+        return [
+            source for source in names
+            if source in self._breakers and self._breakers[source].state != CLOSED
+        ]
+
+    def snapshot(self) -> Dict[str, dict]:
+        return {source: self._breakers[source].snapshot() for source in sorted(self._breakers)}
+
+    def reset(self) -> None:
+        self._breakers.clear()
+
+
+class RetryBudget:
+    """
+    Budget de nouvelles tentatives partagé par toutes les sources.
+
+    Sur une fenêtre glissante de `window` secondes, les nouvelles tentatives
+    sont limitées à `ratio` fois le nombre de scrapings lancés, plus un
+    minimum de `min_per_second` par seconde. Quand une source amont tombe,
+    les retries ne peuvent donc pas multiplier la charge (ni la latence de
+    toutes les recherches).
+    """
+
+    def __init__(self, ratio: float, min_per_second: float, window: float = 10.0):
+        self.ratio = ratio
+        self.min_per_second = min_per_second
+        self.window = window
+        self._calls: Deque[float] = deque()
+        self._retries: Deque[float] = deque()
+
+    def _purge(self, now: float) -> None:
+        horizon = now - self.window
+        for events in (self._calls, self._retries):
+            while events and events[0] < horizon:
+                events.popleft()
+
+    def record_call(self) -> None:
+        """Enregistre un scraping (première tentative)."""
+        self._calls.append(time.monotonic())
+
+    def try_acquire(self) -> bool:
+        """Consomme une nouvelle tentative si le budget le permet."""
+        now = time.monotonic()
+        self._purge(now)
+        allowed = self.min_per_second * self.window + self.ratio * len(self._calls)
+        if len(self._retries) + 1 > allowed:
+            return False
+        self._retries.append(now)
+        return True
+
+
+circuit_breakers = CircuitBreakers(
+    failure_threshold=settings.circuit_breaker_threshold,
+    cooldown=settings.circuit_breaker_cooldown
+)
+
+retry_budget = RetryBudget(
+    ratio=settings.retry_budget_ratio,
+    min_per_second=settings.retry_budget_min_per_second
+)
@@ -0,0 +1,353 @@
+import asyncio
+import hashlib
+import json
+import time
+import uuid
+from collections import OrderedDict
+from typing import Dict, List, Optional
+
+from app.core.config import settings
+from app.models import JobRecord, SearchRequest
+from app.services.cache_store import CacheStore, cache_store
+
+DEFAULT_SOURCES = ["remoteok", "jobicy"]
+
+
+def _normalize(value: Optional[str], lower: bool = True) -> Optional[str]:
+    if value is None:
+        return None
+    value = " ".join(value.split())
+    return (value.lower() if lower else value) or None
+
+
+def result_set_key(request: SearchRequest) -> str:
+    """
+    Construit la clé normalisée d'une recherche.
+
+    Seuls les critères qui changent le jeu de résultats comptent : la page,
+    la taille de page et le délai n'en font pas partie. Les mots-clés gardent
+    leur casse : seuls AND, OR et NOT en majuscules sont des opérateurs.
+    """
+    key = {
+        "keywords": _normalize(request.keywords, lower=False),
+        "location": _normalize(request.location),
+        "sources": sorted(set(request.sources or DEFAULT_SOURCES)),
+        "contract_type": _normalize(request.contract_type),
+        "remote": bool(request.remote),
+        "salary_min": request.salary_min,
+        "salary_max": request.salary_max,
+        "experience_level": _normalize(request.experience_level),
+        "sort_by": request.sort_by or "date",
+        "mode": request.mode,
+    }
+    return json.dumps(key, sort_keys=True, ensure_ascii=False)
+
+
+def new_result_set_id() -> str:
+    """
+    Identifiant public d'un jeu de résultats, unique à chaque calcul.
+
+    Deux clients (ou deux calculs) d'une même recherche obtiennent des jeux
+    distincts : la pagination et l'export d'un jeu ne changent jamais de
+    contenu sous leurs pieds.
+    """
+    return uuid.uuid4().hex
+
+
+def _key_digest(key: str) -> str:
+    return hashlib.sha1(key.encode("utf-8")).hexdigest()
+
+
+class ResultSet:
+    """Résultats fusionnés, filtrés et triés d'une recherche."""
+
+    __slots__ = (
+        "id", "jobs", "errors", "scraped_at", "success", "duplicates",
+        "degraded_sources", "complete", "pulled", "request", "key",
+        "created_at", "last_access"
+    )
+
+    def __init__(
+        self,
+        id: str,
+        jobs: List[JobRecord],
+        errors: List[str],
+        scraped_at: str,
+        success: bool = True,
+        duplicates: int = 0,
+        degraded_sources: Optional[List[str]] = None,
+        complete: bool = True,
+        pulled: int = 0,
+        request: Optional[dict] = None,
+        key: Optional[str] = None,
+        created_at: Optional[float] = None
+    ):
+        self.id = id
+        self.jobs = jobs
+        self.errors = errors
+        self.scraped_at = scraped_at
+        self.success = success
+        self.duplicates = duplicates
+        # Sources écartées par leur disjoncteur au moment de la recherche
+        self.degraded_sources = degraded_sources or []
+        # Jeu tronqué : au moins une source avait encore des offres au-delà
+        # des `pulled` tirées ; la requête d'origine permet d'en tirer plus
+        # pour les pages suivantes
+        self.complete = complete
+        self.pulled = pulled
+        self.request = request
+        # Clé normalisée de la recherche qui a produit le jeu
+        self.key = key
+        # Horloge murale : l'âge d'un jeu relu depuis le stockage partagé
+        # (écrit par un autre worker) reste comparable
+        self.created_at = created_at if created_at is not None else time.time()
+        self.last_access = time.monotonic()
+
+    def covers(self, needed: int) -> bool:
+        """Indique si le jeu contient assez d'offres pour en servir `needed`."""
+        return self.complete or len(self.jobs) >= needed
+
+    def to_bytes(self) -> bytes:
+        """Sérialise le jeu de résultats pour le stockage partagé."""
+        return json.dumps({
+            "id": self.id,
+            "jobs": [job.to_dict(raw=True) for job in self.jobs],
+            "errors": self.errors,
+            "scraped_at": self.scraped_at,
+            "success": self.success,
+            "duplicates": self.duplicates,
+            "degraded_sources": self.degraded_sources,
+            "complete": self.complete,
+            "pulled": self.pulled,
+            "request": self.request,
+            "key": self.key,
+            "created_at": self.created_at,
+        }, ensure_ascii=False).encode("utf-8")
+
+    @classmethod
+    def from_bytes(cls, value: bytes) -> "ResultSet":
+        """Relit un jeu de résultats sérialisé par `to_bytes`."""
+        data = json.loads(value)
+        return cls(
+            data["id"],
+            [JobRecord.from_dict(job) for job in data["jobs"]],
+            data["errors"],
+            data["scraped_at"],
+            success=data["success"],
+            duplicates=data["duplicates"],
+            degraded_sources=data["degraded_sources"],
+            complete=data.get("complete", True),
+            pulled=data.get("pulled", 0),
+            request=data.get("request"),
+            key=data.get("key"),
+            created_at=data["created_at"]
+        )
+
+
+class ResultSetCache:
+    """
+    Cache LRU des jeux de résultats, borné en nombre d'entrées, en nombre
+    total d'offres (plafond mémoire) et en durée d'inactivité.
+
+    Chaque jeu calculé reçoit un identifiant unique ; la clé normalisée de
+    la recherche ne sert qu'à retrouver le dernier jeu calculé pour elle.
+    Une recherche identique faite pendant le TTL est resservie depuis ce
+    jeu ; la pagination et l'export relisent le jeu désigné par son
+    identifiant, qu'un nouveau calcul de la même recherche ne remplace pas.
+
+    Avec un stockage partagé (`cache_store`), chaque jeu y est aussi écrit,
+    avec l'index clé → identifiant :
+    les variantes async (`aget`, `aget_fresh`, `aput`) retrouvent alors un
+    jeu calculé par un autre worker, pour la pagination, l'export ou une
+    recherche identique. Les méthodes synchrones ne voient que la mémoire
+    du processus.
+    """
+
+    NAMESPACE = "results"
+    # Clé de recherche → identifiant du dernier jeu calculé
+    INDEX_NAMESPACE = "results_index"
+
+    def __init__(
+        self,
+        ttl: float,
+        max_entries: int,
+        max_jobs: int,
+        idle_ttl: float,
+        store: Optional[CacheStore] = None
+    ):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.max_jobs = max_jobs
+        self.idle_ttl = idle_ttl
+        self.store = store
+        self._entries: "OrderedDict[str, ResultSet]" = OrderedDict()
+        self._latest: Dict[str, str] = {}
+        self._total_jobs = 0
+
+    def get(self, id: str) -> Optional[ResultSet]:
+        """Retourne un jeu de résultats par son identifiant."""
+        self._purge_idle()
+        result_set = self._entries.get(id)
+        if result_set is not None:
+            result_set.last_access = time.monotonic()
+            self._entries.move_to_end(id)
+        return result_set
+
+    def get_fresh(self, key: str) -> Optional[ResultSet]:
+        """
+        Retourne le jeu de résultats d'une recherche s'il est encore frais.
+
+        Les jeux partiels (sources en erreur ou hors délai) ne sont pas
+        resservis pour une nouvelle recherche, seulement pour leur pagination.
+        """
+        id = self._latest.get(key)
+        return self._fresh(self.get(id)) if id is not None else None
+
+    def _fresh(self, result_set: Optional[ResultSet]) -> Optional[ResultSet]:
+        if result_set is None or result_set.errors:
+            return None
+        if time.time() - result_set.created_at >= self.ttl:
+            return None
+        return result_set
+
+    def put(
+        self,
+        key: str,
+        jobs: List[JobRecord],
+        errors: List[str],
+        scraped_at: str,
+        success: bool = True,
+        duplicates: int = 0,
+        degraded_sources: Optional[List[str]] = None,
+        complete: bool = True,
+        pulled: int = 0,
+        request: Optional[dict] = None
+    ) -> ResultSet:
+        """Enregistre un nouveau jeu de résultats (nouvel identifiant) pour une recherche."""
+        result_set = ResultSet(
+            new_result_set_id(), jobs, errors, scraped_at, success, duplicates,
+            degraded_sources, complete, pulled, request, key
+        )
+        self._insert(result_set)
+        self._latest[key] = result_set.id
+        return result_set
+
+    async def aget(self, id: str) -> Optional[ResultSet]:
+        """Comme `get`, en cherchant aussi dans le stockage partagé."""
+        result_set = self.get(id)
+        if result_set is not None or not self._shared:
+            return result_set
+        try:
+            value = await self.store.aget(self.NAMESPACE, id)
+            if value is None:
+                return None
+            result_set = await asyncio.to_thread(ResultSet.from_bytes, value)
+        except Exception:
+            # Stockage indisponible ou entrée illisible : jeu introuvable
+            return None
+        self._insert(result_set)
+        return result_set
+
+    async def aget_fresh(self, key: str) -> Optional[ResultSet]:
+        """Comme `get_fresh`, en cherchant aussi dans le stockage partagé."""
+        result_set = self.get_fresh(key)
+        if result_set is not None or not self._shared:
+            return result_set
+        # Dernier jeu calculé pour cette recherche, par n'importe quel worker
+        try:
+            value = await self.store.aget(self.INDEX_NAMESPACE, _key_digest(key))
+        except Exception:
+            value = None
+        if value is None:
+            return None
+        return self._fresh(await self.aget(value.decode("utf-8")))
+
+    async def aput(
+        self,
+        key: str,
+        jobs: List[JobRecord],
+        errors: List[str],
+        scraped_at: str,
+        success: bool = True,
+        duplicates: int = 0,
+        degraded_sources: Optional[List[str]] = None,
+        complete: bool = True,
+        pulled: int = 0,
+        request: Optional[dict] = None
+    ) -> ResultSet:
+        """Comme `put`, en écrivant aussi le jeu dans le stockage partagé."""
+        result_set = self.put(
+            key, jobs, errors, scraped_at, success, duplicates, degraded_sources,
+            complete, pulled, request
+        )
+        if self._shared:
+            try:
+                value = await asyncio.to_thread(result_set.to_bytes)
+                await self.store.aset(
+                    self.NAMESPACE, result_set.id, value, ttl=max(self.ttl, self.idle_ttl)
+                )
+                await self.store.aset(
+                    self.INDEX_NAMESPACE, _key_digest(key),
+                    result_set.id.encode("utf-8"), ttl=self.ttl
+                )
+            except Exception:
+                # Le jeu reste servi par ce worker
+                pass
+        return result_set
+
+    def clear(self) -> None:
+        """Vide le cache, mémoire du processus et stockage."""
+        self._entries.clear()
+        self._latest.clear()
+        self._total_jobs = 0
+        if self.store is not None:
+            self.store.clear(self.NAMESPACE)
+            self.store.clear(self.INDEX_NAMESPACE)
+
+    @property
+    def _shared(self) -> bool:
+        return self.store is not None and self.store.shared
+
+    def _insert(self, result_set: ResultSet) -> None:
+        self._remove(result_set.id)
+        self._entries[result_set.id] = result_set
+        self._total_jobs += len(result_set.jobs)
+        self._purge_idle()
+        self._evict()
+
+    def _remove(self, id: str) -> None:
+        previous = self._entries.pop(id, None)
+        if previous is not None:
+            self._forget(previous)
+
+    def _purge_idle(self) -> None:
+        # Les entrées sont ordonnées par dernier accès : les inactives en tête
+        now = time.monotonic()
+        while self._entries:
+            id, oldest = next(iter(self._entries.items()))
+            if now - oldest.last_access < self.idle_ttl:
+                break
+            self._remove(id)
+
+    def _evict(self) -> None:
+        # Toujours garder la dernière entrée, même si elle dépasse le plafond
+        while len(self._entries) > 1 and (
+            len(self._entries) > self.max_entries
+            or self._total_jobs > self.max_jobs
+        ):
+            _, evicted = self._entries.popitem(last=False)
+            self._forget(evicted)
+
+    def _forget(self, result_set: ResultSet) -> None:
+        self._total_jobs -= len(result_set.jobs)
+        if self._latest.get(result_set.key) == result_set.id:
+            del self._latest[result_set.key]
+
+
+result_cache = ResultSetCache(
+    ttl=settings.result_cache_ttl,
+    max_entries=settings.result_cache_max_entries,
+    max_jobs=settings.result_cache_max_jobs,
+    idle_ttl=settings.result_cache_idle_ttl,
+    store=cache_store
+)
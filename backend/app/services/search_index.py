@@ -0,0 +1,420 @@
+import asyncio
+import hashlib
+import json
+import os
+import re
+import sqlite3
+import threading
+from datetime import datetime, timedelta
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+from app.core.config import settings
+from app.models import JobRecord
+from app.services.html_text import html_to_text
+from app.services.keyword_matcher import KeywordMatcher, compile_keywords
+
+# Poids BM25 des colonnes : title, company, description, tags
+BM25_WEIGHTS = (10.0, 5.0, 1.0, 3.0)
+# Candidats FTS5 lus à la fois, avant confirmation par le matcher
+SEARCH_BATCH_SIZE = 200
+
+RANK_BATCH_SIZE = 500
+
+TOKEN_RE = re.compile(r"\w+", re.UNICODE)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    rowid INTEGER PRIMARY KEY,
+    job_key TEXT NOT NULL UNIQUE,
+    source TEXT NOT NULL,
+    posted_at TEXT,
+    scraped_at TEXT,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS jobs_source ON jobs(source);
+CREATE VIRTUAL TABLE IF NOT EXISTS jobs_fts USING fts5(
+    title, company, description, tags,
+    tokenize = 'unicode61 remove_diacritics 2'
+);
+CREATE TABLE IF NOT EXISTS crawl_state (
+    source TEXT PRIMARY KEY,
+    crawled_at TEXT NOT NULL,
+    new INTEGER NOT NULL,
+    updated INTEGER NOT NULL,
+    removed INTEGER NOT NULL,
+    full_feed INTEGER NOT NULL DEFAULT 0
+);
+"""
+
+# Colonnes de suivi des changements, ajoutées aux index existants
+TRACKING_COLUMNS = {
+    "content_hash": "TEXT",
+    "first_seen": "TEXT",
+    "last_seen": "TEXT",
+    "removed_at": "TEXT",
+}
+
+
+def job_key(job: JobRecord) -> str:
+    """Clé d'unicité d'une offre dans l'index (source + URL)."""
+    return f"{job.source}|{job.url}"
+
+
+def content_hash(job: JobRecord) -> str:
+    """Empreinte du contenu d'une offre (hors identifiant et date de scraping)."""
+    data = job.to_dict(raw=True)
+    del data["id"], data["scraped_at"]
+    return hashlib.sha1(
+        json.dumps(data, sort_keys=True, ensure_ascii=False).encode("utf-8")
+    ).hexdigest()
+
+
+def _utcnow() -> str:
+    return datetime.utcnow().isoformat() + "Z"
+
+
+def build_fts_query(keywords: str) -> Optional[str]:
+    """
+    Traduit des mots-clés en requête FTS5.
+
+    Une offre est candidate si elle contient au moins un des termes
+    recherchés (mots ou phrases, voir `compile_keywords`) ; chaque terme est
+    cité pour neutraliser la syntaxe FTS5. Les opérateurs AND/NOT sont
+    appliqués ensuite par le matcher partagé avec les scrapers.
+    """
+    terms = [
+        " ".join(TOKEN_RE.findall(term))
+        for term in compile_keywords(keywords).terms
+    ]
+    terms = [term for term in terms if term]
+    if not terms:
+        return None
+    return " OR ".join(f'"{term}"' for term in dict.fromkeys(terms))
+
+
+def matches_job(matcher: KeywordMatcher, job: JobRecord) -> bool:
+    """Applique le matcher aux champs recherchables d'une offre."""
+    return matcher.matches(job.title, job.company, job.description, *(job.tags or []))
+
+
+class JobIndex:
+    """
+    Index plein texte des offres scrapées (SQLite FTS5, classement BM25).
+
+    Chaque offre produite par les scrapers y est ajoutée ou mise à jour
+    (clé source + URL), ce qui permet de répondre aux recherches par mots-clés
+    et de trier par pertinence sans parcourir toutes les offres.
+    L'index sert aussi de stockage au crawler : une empreinte de contenu
+    distingue les offres nouvelles, modifiées et disparues.
+    Les méthodes synchrones sont protégées par un verrou ; les variantes
+    async les exécutent dans un thread pour ne pas bloquer la boucle.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+
+    def _connection(self) -> sqlite3.Connection:
+        if self._conn is None:
+            if self.path != ":memory:":
+                directory = os.path.dirname(self.path)
+                if directory:
+                    os.makedirs(directory, exist_ok=True)
+            conn = sqlite3.connect(self.path, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.executescript(SCHEMA)
+            self._migrate(conn)
+            self._conn = conn
+        return self._conn
+
+    @staticmethod
+    def _migrate(conn: sqlite3.Connection) -> None:
+        existing = {row[1] for row in conn.execute("PRAGMA table_info(jobs)")}
+        for column, column_type in TRACKING_COLUMNS.items():
+            if column not in existing:
+                conn.execute(f"ALTER TABLE jobs ADD COLUMN {column} {column_type}")
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS jobs_active ON jobs(source, removed_at, last_seen)"
+        )
+        crawl_columns = {row[1] for row in conn.execute("PRAGMA table_info(crawl_state)")}
+        if "full_feed" not in crawl_columns:
+            conn.execute(
+                "ALTER TABLE crawl_state ADD COLUMN full_feed INTEGER NOT NULL DEFAULT 0"
+            )
+        conn.commit()
+
+    def upsert(
+        self,
+        jobs: Iterable[JobRecord],
+        seen_at: Optional[str] = None
+    ) -> Dict[str, int]:
+        """
+        Ajoute ou met à jour des offres dans l'index.
+
+        Une offre inchangée (même empreinte) n'est pas réindexée ; une offre
+        marquée disparue qui réapparaît est réactivée.
+
+        Args:
+            jobs: Offres à indexer
+            seen_at: Horodatage de passage (maintenant par défaut)
+
+        Returns:
+            Compteurs {"new", "updated", "unchanged"}
+        """
+        seen_at = seen_at or _utcnow()
+        stats = {"new": 0, "updated": 0, "unchanged": 0}
+        with self._lock:
+            conn = self._connection()
+            with conn:
+                for job in jobs:
+                    self._upsert_one(conn, job, seen_at, stats)
+        return stats
+
+    def _upsert_one(
+        self,
+        conn: sqlite3.Connection,
+        job: JobRecord,
+        seen_at: str,
+        stats: Dict[str, int]
+    ) -> None:
+        key = job_key(job)
+        digest = content_hash(job)
+        row = conn.execute(
+            "SELECT rowid, content_hash, removed_at FROM jobs WHERE job_key = ?", (key,)
+        ).fetchone()
+
+        if row is not None and row[1] == digest:
+            conn.execute(
+                "UPDATE jobs SET last_seen = ?, removed_at = NULL WHERE rowid = ?",
+                (seen_at, row[0])
+            )
+            stats["new" if row[2] else "unchanged"] += 1
+            return
+
+        data = json.dumps(job.to_dict(by_alias=True, raw=True), ensure_ascii=False)
+        if row is None:
+            rowid = conn.execute(
+                "INSERT INTO jobs (job_key, source, posted_at, scraped_at, data, "
+                "content_hash, first_seen, last_seen) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (key, job.source, job.posted_at, job.scraped_at, data,
+                 digest, seen_at, seen_at)
+            ).lastrowid
+            stats["new"] += 1
+        else:
+            rowid = row[0]
+            conn.execute(
+                "UPDATE jobs SET posted_at = ?, scraped_at = ?, data = ?, "
+                "content_hash = ?, last_seen = ?, removed_at = NULL WHERE rowid = ?",
+                (job.posted_at, job.scraped_at, data, digest, seen_at, rowid)
+            )
+            conn.execute("DELETE FROM jobs_fts WHERE rowid = ?", (rowid,))
+            stats["new" if row[2] else "updated"] += 1
+
+        conn.execute(
+            "INSERT INTO jobs_fts (rowid, title, company, description, tags) "
+            "VALUES (?, ?, ?, ?, ?)",
+            (
+                rowid, job.title, job.company, html_to_text(job.description or ""),
+                " ".join(job.tags or [])
+            )
+        )
+
+    def sync_source(
+        self,
+        source: str,
+        jobs: Iterable[JobRecord],
+        complete: bool = True,
+        full_feed: bool = False
+    ) -> Dict[str, int]:
+        """
+        Synchronise l'index avec le résultat complet d'un crawl d'une source.
+
+        Les offres de la source absentes du crawl sont marquées disparues
+        (et exclues des recherches), seulement si le crawl est complet.
+        Un crawl complet du flux entier (`full_feed`, sans mots-clés) rend
+        la source servie par l'index (voir `covered_sources`).
+
+        Returns:
+            Compteurs {"new", "updated", "unchanged", "removed"}
+        """
+        seen_at = _utcnow()
+        stats = {"new": 0, "updated": 0, "unchanged": 0, "removed": 0}
+        with self._lock:
+            conn = self._connection()
+            with conn:
+                for job in jobs:
+                    self._upsert_one(conn, job, seen_at, stats)
+                if complete:
+                    stats["removed"] = conn.execute(
+                        "UPDATE jobs SET removed_at = ? WHERE source = ? "
+                        "AND removed_at IS NULL AND (last_seen IS NULL OR last_seen < ?)",
+                        (seen_at, source, seen_at)
+                    ).rowcount
+                conn.execute(
+                    "INSERT OR REPLACE INTO crawl_state "
+                    "(source, crawled_at, new, updated, removed, full_feed) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    (
+                        source, seen_at, stats["new"], stats["updated"], stats["removed"],
+                        int(complete and full_feed)
+                    )
+                )
+        return stats
+
+    def covered_sources(self, max_age: Optional[float] = None) -> Set[str]:
+        """
+        Sources dont le dernier crawl a couvert tout le flux, il y a moins
+        de `max_age` secondes.
+
+        L'index d'une telle source contient tout ce qu'un scraping direct
+        pourrait trouver, quels que soient les mots-clés ; les autres
+        sources (crawlées par requêtes larges, crawl plafonné, en échec ou
+        trop ancien) sont scrapées en direct.
+        """
+        sql = "SELECT source FROM crawl_state WHERE full_feed = 1"
+        params: list = []
+        if max_age is not None:
+            # Horodatages ISO de même format : l'ordre des chaînes est chronologique
+            cutoff = datetime.utcnow() - timedelta(seconds=max_age)
+            sql += " AND crawled_at >= ?"
+            params.append(cutoff.isoformat() + "Z")
+        with self._lock:
+            rows = self._connection().execute(sql, params).fetchall()
+        return {source for (source,) in rows}
+
+    def search(
+        self,
+        keywords: str,
+        sources: Optional[List[str]] = None,
+        limit: int = 1000,
+        accept: Optional[Callable[[JobRecord], bool]] = None
+    ) -> Tuple[List[JobRecord], bool]:
+        """
+        Recherche des offres par mots-clés, classées par pertinence BM25.
+
+        Les candidats FTS5 sont lus par lots et confirmés un à un, jusqu'à
+        `limit` offres retenues ou épuisement des candidats : un filtre qui
+        écarte les premiers candidats ne réduit pas le nombre de résultats.
+
+        Args:
+            keywords: Mots-clés de recherche
+            sources: Sources à inclure (toutes si None)
+            limit: Nombre maximum de résultats
+            accept: Filtre supplémentaire (localisation…)
+
+        Returns:
+            (offres de la plus à la moins pertinente, True si tous les
+            candidats ont été lus)
+        """
+        fts_query = build_fts_query(keywords)
+        if fts_query is None:
+            return [], True
+
+        sql = (
+            "SELECT jobs.data FROM jobs_fts JOIN jobs ON jobs.rowid = jobs_fts.rowid "
+            "WHERE jobs_fts MATCH ? AND jobs.removed_at IS NULL"
+        )
+        params: list = [fts_query]
+        if sources:
+            sql += f" AND jobs.source IN ({', '.join('?' * len(sources))})"
+            params.extend(sources)
+        sql += f" ORDER BY bm25(jobs_fts, {', '.join(map(str, BM25_WEIGHTS))})"
+
+        # FTS5 ne voit que des candidats : sa tokenisation perd la ponctuation
+        # (`c++` et `c#` y deviennent `c`) et les accents, et il ignore
+        # AND/NOT. Le matcher des scrapers tranche, pour des résultats
+        # identiques à une recherche en direct
+        matcher = compile_keywords(keywords)
+        jobs: List[JobRecord] = []
+        if limit <= 0:
+            return jobs, False
+        with self._lock:
+            cursor = self._connection().execute(sql, params)
+            try:
+                while True:
+                    rows = cursor.fetchmany(SEARCH_BATCH_SIZE)
+                    if not rows:
+                        return jobs, True
+                    for index, (data,) in enumerate(rows):
+                        job = JobRecord.from_dict(json.loads(data))
+                        if not matches_job(matcher, job) or (accept and not accept(job)):
+                            continue
+                        jobs.append(job)
+                        if len(jobs) >= limit:
+                            # Candidats restants dans ce lot ou les suivants
+                            exhausted = index == len(rows) - 1 and cursor.fetchone() is None
+                            return jobs, exhausted
+            finally:
+                cursor.close()
+
+    def rank(self, keywords: str, jobs: List[JobRecord]) -> List[JobRecord]:
+        """
+        Trie des offres par pertinence BM25 pour les mots-clés donnés.
+
+        Les offres absentes de l'index ou sans correspondance sont placées
+        à la fin, dans leur ordre d'origine.
+        """
+        fts_query = build_fts_query(keywords)
+        if fts_query is None or not jobs:
+            return list(jobs)
+
+        keys = list(dict.fromkeys(job_key(job) for job in jobs))
+        scores: Dict[str, float] = {}
+        with self._lock:
+            conn = self._connection()
+            # Ne scorer que les offres demandées, par lots (limite de paramètres SQLite)
+            for start in range(0, len(keys), RANK_BATCH_SIZE):
+                batch = keys[start:start + RANK_BATCH_SIZE]
+                sql = (
+                    f"SELECT jobs.job_key, bm25(jobs_fts, {', '.join(map(str, BM25_WEIGHTS))}) "
+                    "FROM jobs_fts JOIN jobs ON jobs.rowid = jobs_fts.rowid "
+                    f"WHERE jobs_fts MATCH ? AND jobs.job_key IN ({', '.join('?' * len(batch))})"
+                )
+                scores.update(conn.execute(sql, (fts_query, *batch)).fetchall())
+
+        # bm25() renvoie un score négatif : plus il est petit, plus c'est
+        # pertinent ; le tri stable conserve l'ordre d'origine à égalité
+        return sorted(jobs, key=lambda job: scores.get(job_key(job), float("inf")))
+
+    def count(self) -> int:
+        """Nombre d'offres indexées."""
+        with self._lock:
+            return self._connection().execute("SELECT COUNT(*) FROM jobs").fetchone()[0]
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    async def aupsert(self, jobs: List[JobRecord]) -> Dict[str, int]:
+        return await asyncio.to_thread(self.upsert, jobs)
+
+    async def async_sync_source(
+        self,
+        source: str,
+        jobs: List[JobRecord],
+        complete: bool = True,
+        full_feed: bool = False
+    ) -> Dict[str, int]:
+        return await asyncio.to_thread(self.sync_source, source, jobs, complete, full_feed)
+
+    async def acovered_sources(self, max_age: Optional[float] = None) -> Set[str]:
+        return await asyncio.to_thread(self.covered_sources, max_age)
+
+    async def asearch(
+        self,
+        keywords: str,
+        sources: Optional[List[str]] = None,
+        limit: int = 1000,
+        accept: Optional[Callable[[JobRecord], bool]] = None
+    ) -> Tuple[List[JobRecord], bool]:
+        return await asyncio.to_thread(self.search, keywords, sources, limit, accept)
+
+    async def arank(self, keywords: str, jobs: List[JobRecord]) -> List[JobRecord]:
+        return await asyncio.to_thread(self.rank, keywords, jobs)
+
+
+search_index = JobIndex(settings.search_index_path)
@@ -0,0 +1,87 @@
+import asyncio
+from typing import Awaitable, Callable, Dict, Hashable, TypeVar
+
+T = TypeVar("T")
+
+
+class _Flight:
+    """Appel en cours, quantité qu'il produit et nombre d'appelants qui l'attendent."""
+
+    __slots__ = ("task", "size", "waiters")
+
+    def __init__(self, task: asyncio.Task, size: int):
+        self.task = task
+        self.size = size
+        self.waiters = 0
+
+
+class SingleFlight:
+    """
+    Regroupe les appels identiques concurrents : tant qu'un appel pour une
+    clé est en cours, les suivants attendent son résultat au lieu d'en
+    lancer un nouveau.
+
+    Chaque appelant peut être annulé (délai de sa recherche) sans affecter
+    les autres ; l'appel partagé n'est annulé que si plus personne ne
+    l'attend. Rien n'est mémorisé une fois l'appel terminé.
+
+    Un appel peut annoncer la quantité qu'il produit (`size`, nombre
+    d'offres tirées…) : un appelant n'en rejoint un autre que s'il en
+    demande autant ou moins ; sinon il lance un appel plus large, que
+    rejoignent les appelants suivants.
+    """
+
+    def __init__(self):
+        self._flights: Dict[Hashable, _Flight] = {}
+
+    def in_flight(self, key: Hashable, size: int = 0) -> bool:
+        """Indique si un appel en cours pour cette clé produit au moins `size`."""
+        flight = self._flights.get(key)
+        return flight is not None and flight.size >= size
+
+    async def run(
+        self,
+        key: Hashable,
+        factory: Callable[[], Awaitable[T]],
+        size: int = 0
+    ) -> T:
+        """
+        Exécute `factory()` pour cette clé, ou rejoint l'appel déjà en cours.
+
+        Args:
+            key: Clé normalisée de l'appel
+            factory: Fonction qui crée la coroutine à exécuter
+            size: Quantité nécessaire à l'appelant (et produite par `factory`)
+
+        Returns:
+            Résultat de l'appel partagé (ou son exception)
+        """
+        flight = self._flights.get(key)
+        if flight is None or flight.size < size:
+            # L'appel plus étroit déjà en cours continue pour ses appelants
+            flight = _Flight(asyncio.ensure_future(factory()), size)
+            self._flights[key] = flight
+            flight.task.add_done_callback(lambda task: self._done(key, flight, task))
+
+        flight.waiters += 1
+        try:
+            return await asyncio.shield(flight.task)
+        finally:
+            flight.waiters -= 1
+            if flight.waiters == 0 and not flight.task.done():
+                flight.task.cancel()
+                self._forget(key, flight)
+
+    def _done(self, key: Hashable, flight: _Flight, task: asyncio.Task) -> None:
+        self._forget(key, flight)
+        if not task.cancelled():
+            # Erreur consommée même si tous les appelants sont partis
+            task.exception()
+
+    def _forget(self, key: Hashable, flight: _Flight) -> None:
+        if self._flights.get(key) is flight:
+            del self._flights[key]
+
+
+# Scrapings en cours, par source et paramètres de recherche
+scraper_flights = SingleFlight()
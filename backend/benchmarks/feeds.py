@@ -0,0 +1,170 @@
+"""
+Flux amont enregistrés, rejoués hors ligne à la taille voulue.
+
+Les fixtures de `benchmarks/fixtures/` sont des réponses réelles (ou
+conformes au format réel) de RemoteOK, Jobicy et Welcome to the Jungle ;
+`python -m benchmarks.suite record` les remplace par un nouvel
+enregistrement. Pour mesurer à 10k ou 100k offres, les offres enregistrées
+servent de gabarits : chaque copie reçoit une URL, un titre, une entreprise
+et une description distincts, pour que déduplication, caches et index
+travaillent comme sur un vrai flux.
+"""
+import copy
+import json
+import os
+import random
+from typing import Dict, List, Tuple
+
+import httpx
+
+from app.scrapers.jobicy import JOBICY_URL
+from app.scrapers.remoteok import REMOTEOK_API_URL
+
+FIXTURES_DIR = os.path.join(os.path.dirname(__file__), "fixtures")
+
+SENIORITY = ["", "Junior ", "Senior ", "Lead ", "Staff ", "Principal "]
+COMPANY_SUFFIXES = ["Labs", "Group", "Tech", "Systems", "Studio", "Cloud", "AI", "Works"]
+SENTENCES = [
+    "You will work closely with product managers and designers.",
+    "Our stack includes Python, PostgreSQL, Redis and Kubernetes.",
+    "We value written communication and asynchronous collaboration.",
+    "You have shipped features used by millions of people.",
+    "Experience with TypeScript and modern frontend tooling is appreciated.",
+    "We offer equity, a learning budget and a home office stipend.",
+    "The team is distributed across Europe and the Americas.",
+    "You care about testing, observability and clean architecture.",
+    "Knowledge of machine learning pipelines is a strong plus.",
+    "Our customers are small businesses around the world.",
+    "You will mentor junior engineers and review their code.",
+    "We hold a company retreat twice a year.",
+    "The position is open to candidates in any time zone.",
+    "You enjoy debugging production issues and improving reliability.",
+    "Previous startup experience is welcome but not required.",
+    "We are an equal opportunity employer.",
+]
+
+
+def fixture_path(name: str) -> str:
+    return os.path.join(FIXTURES_DIR, name)
+
+
+def load_fixture(name: str) -> bytes:
+    with open(fixture_path(name), "rb") as f:
+        return f.read()
+
+
+def _vocabulary(rng: random.Random, size: int = 3000) -> List[str]:
+    letters = "abcdefghijklmnopqrstuvwxyz"
+    return ["".join(rng.choices(letters, k=rng.randint(3, 10))) for _ in range(size)]
+
+
+def _extra_text(rng: random.Random, vocabulary: List[str], index: int) -> str:
+    # Texte propre à chaque offre, pour qu'elles ne soient pas des quasi-doublons
+    sentences = " ".join(rng.sample(SENTENCES, 3))
+    words = " ".join(rng.choices(vocabulary, k=40))
+    return f"<p>{sentences}</p><p>{words}</p><p>Ref. {index}</p>"
+
+
+def _company(rng: random.Random, vocabulary: List[str]) -> str:
+    return f"{rng.choice(vocabulary).title()} {rng.choice(COMPANY_SUFFIXES)}"
+
+
+def scale_remoteok(size: int, seed: int = 1) -> bytes:
+    """Flux RemoteOK (message légal + `size` offres) au format de l'API."""
+    rng = random.Random(seed)
+    vocabulary = _vocabulary(rng)
+    recorded = json.loads(load_fixture("remoteok.json"))
+    legal = [item for item in recorded if "legal" in item]
+    templates = [item for item in recorded if "legal" not in item]
+
+    jobs = []
+    for index in range(size):
+        job = copy.copy(templates[index % len(templates)])
+        slug = f"{job['slug']}-{index}"
+        job.update({
+            "slug": slug,
+            "id": str(index),
+            "epoch": job["epoch"] - index * 60,
+            "position": rng.choice(SENIORITY) + job["position"],
+            "company": _company(rng, vocabulary),
+            "description": job["description"] + _extra_text(rng, vocabulary, index),
+            "url": f"https://remoteok.com/remote-jobs/{slug}",
+        })
+        jobs.append(job)
+    return json.dumps(legal + jobs).encode("utf-8")
+
+
+def scale_jobicy(size: int, seed: int = 2) -> bytes:
+    """Flux Jobicy de `size` offres au format de l'API."""
+    rng = random.Random(seed)
+    vocabulary = _vocabulary(rng)
+    recorded = json.loads(load_fixture("jobicy.json"))
+    templates = recorded["jobs"]
+
+    jobs = []
+    for index in range(size):
+        job = copy.copy(templates[index % len(templates)])
+        slug = f"{job['jobSlug']}-{index}"
+        job.update({
+            "id": index,
+            "jobSlug": slug,
+            "url": f"https://jobicy.com/jobs/{slug}",
+            "jobTitle": rng.choice(SENIORITY) + job["jobTitle"],
+            "companyName": _company(rng, vocabulary),
+            "jobDescription": job["jobDescription"] + _extra_text(rng, vocabulary, index),
+        })
+        jobs.append(job)
+    return json.dumps({**recorded, "jobCount": size, "jobs": jobs}).encode("utf-8")
+
+
+def scale_wttj(size: int) -> Tuple[str, List[str]]:
+    """
+    Page de résultats WTTJ contenant `size` cartes d'offres.
+
+    Returns:
+        (HTML de la page, liens d'offres qu'un navigateur y trouverait)
+    """
+    page = load_fixture("wttj_search.html").decode("utf-8")
+    start = page.index("<li")
+    end = page.rindex("</li>") + len("</li>")
+    cards = page[start:end].split("</li>")
+    cards = [card + "</li>" for card in cards if card.strip()]
+
+    items = []
+    hrefs = []
+    for index in range(size):
+        card = cards[index % len(cards)]
+        href_start = card.index('href="') + len('href="')
+        href = card[href_start:card.index('"', href_start)]
+        unique_href = f"{href}-{index}"
+        items.append(card.replace(href, unique_href))
+        hrefs.append(unique_href)
+    return page[:start] + "\n".join(items) + page[end:], hrefs
+
+
+def split_size(size: int) -> Tuple[int, int]:
+    """Répartit `size` offres entre RemoteOK et Jobicy."""
+    return size - size // 2, size // 2
+
+
+def feed_bodies(size: int) -> Dict[str, bytes]:
+    """Corps des flux RemoteOK et Jobicy, par hôte, pour `size` offres au total."""
+    remoteok_size, jobicy_size = split_size(size)
+    return {
+        httpx.URL(REMOTEOK_API_URL).host: scale_remoteok(remoteok_size),
+        httpx.URL(JOBICY_URL).host: scale_jobicy(jobicy_size),
+    }
+
+
+def mock_transport(bodies: Dict[str, bytes]) -> httpx.MockTransport:
+    """Transport httpx qui sert les flux enregistrés au lieu du réseau."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        body = bodies.get(request.url.host)
+        if body is None:
+            return httpx.Response(404)
+        return httpx.Response(
+            200, content=body, headers={"Content-Type": "application/json"}
+        )
+
+    return httpx.MockTransport(handler)
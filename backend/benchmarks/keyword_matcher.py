@@ -0,0 +1,132 @@
+"""
+Micro-benchmark du matcher de mots-clés, à l'échelle d'un flux complet.
+
+Compare le coût par offre du matcher compilé (`compile_keywords`) aux
+anciennes vérifications des scrapers (concaténation + recherche de
+sous-chaînes), sur un flux synthétique au format RemoteOK.
+
+Usage : `python -m benchmarks.keyword_matcher [--jobs 10000] [--repeat 5]`
+"""
+import argparse
+import random
+import time
+from typing import Callable, Dict, List
+
+from app.services.keyword_matcher import compile_keywords
+
+VOCABULARY = (
+    "python django flask fastapi java javascript typescript react node go rust "
+    "kotlin swift senior junior lead engineer developer designer product data "
+    "analyst scientist machine learning cloud aws gcp azure devops backend "
+    "frontend fullstack mobile remote team company culture salary benefits "
+    "experience years building scalable systems customers growth startup"
+).split()
+
+QUERIES = [
+    "python",
+    "react developer",
+    '"machine learning" OR "data scientist"',
+    "python AND (django OR fastapi) -junior",
+]
+
+
+def make_feed(n_jobs: int, seed: int = 42) -> List[Dict]:
+    """
+    Flux synthétique : titres courts, descriptions de ~300 mots (surtout du
+    remplissage, avec quelques mots du vocabulaire métier), tags.
+    """
+    rng = random.Random(seed)
+    filler = [
+        "".join(rng.choices("abcdefghijklmnopqrstuvwxyz", k=rng.randint(2, 9)))
+        for _ in range(2000)
+    ]
+
+    def words(k: int) -> str:
+        return " ".join(
+            rng.choice(VOCABULARY) if rng.random() < 0.02 else rng.choice(filler)
+            for _ in range(k)
+        )
+
+    return [
+        {
+            "position": " ".join(rng.choices(VOCABULARY, k=3)).title(),
+            "company": f"Company {i}",
+            "description": f"<p>{words(150)}</p><p>{words(150)}</p>",
+            "tags": rng.sample(VOCABULARY, 5),
+        }
+        for i in range(n_jobs)
+    ]
+
+
+def legacy_remoteok(keywords: str) -> Callable[[Dict], bool]:
+    keywords_lower = keywords.lower()
+
+    def check(job: Dict) -> bool:
+        search_text = (
+            f"{job['position']} {job['company']} {job['description']} "
+            f"{' '.join(job['tags'])}"
+        ).lower()
+        if keywords_lower not in search_text:
+            keywords_list = keywords_lower.split()
+            return any(kw in search_text for kw in keywords_list)
+        return True
+
+    return check
+
+
+def legacy_jobicy(keywords: str) -> Callable[[Dict], bool]:
+    keywords_lower = keywords.lower().split()
+
+    def check(job: Dict) -> bool:
+        search_text = f"{job['position']} {job['company']} {job['description']}".lower()
+        return any(kw in search_text for kw in keywords_lower)
+
+    return check
+
+
+def compiled(keywords: str) -> Callable[[Dict], bool]:
+    matcher = compile_keywords(keywords)
+
+    def check(job: Dict) -> bool:
+        return matcher.matches(
+            job["position"], job["company"], job["description"], *job["tags"]
+        )
+
+    return check
+
+
+def measure(check: Callable[[Dict], bool], feed: List[Dict], repeat: int):
+    """Meilleur temps sur `repeat` passages : (µs par offre, offres retenues)."""
+    best = float("inf")
+    matched = 0
+    for _ in range(repeat):
+        start = time.perf_counter()
+        matched = sum(1 for job in feed if check(job))
+        best = min(best, time.perf_counter() - start)
+    return best / len(feed) * 1e6, matched
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark du matcher de mots-clés")
+    parser.add_argument("--jobs", type=int, default=10000, help="Taille du flux")
+    parser.add_argument("--repeat", type=int, default=5, help="Passages par mesure")
+    args = parser.parse_args()
+
+    feed = make_feed(args.jobs)
+    implementations = {
+        "legacy remoteok": legacy_remoteok,
+        "legacy jobicy": legacy_jobicy,
+        "compiled": compiled,
+    }
+
+    print(f"{args.jobs} offres, meilleur de {args.repeat} passages\n")
+    print(f"{'requête':<45} {'implémentation':<16} {'µs/offre':>9} {'retenues':>9}")
+    for query in QUERIES:
+        for name, factory in implementations.items():
+            per_job, matched = measure(factory(query), feed, args.repeat)
+            print(f"{query:<45} {name:<16} {per_job:>9.2f} {matched:>9}")
+        print()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,454 @@
+"""
+Suite de benchmarks hors ligne de la recherche.
+
+Rejoue les flux enregistrés (`benchmarks/fixtures/`) via `httpx.MockTransport`
+et mesure, pour 100 / 10k / 100k offres, le temps (médiane et minimum sur
+plusieurs passages) et le pic mémoire (tracemalloc) de `search_jobs` de bout
+en bout et de chaque étape isolément : téléchargement, décodage JSON
+(complet, ou offre par offre pour RemoteOK), filtrage par mots-clés, construction des offres, déduplication,
+`filter_jobs`, `sort_jobs`, `paginate_jobs` et sérialisation des exports.
+
+Usage (depuis `backend/`) :
+
+    python -m benchmarks.suite run [--sizes 100 10000 100000] [--repeat 3]
+    python -m benchmarks.suite compare base.json new.json [--threshold 10]
+    python -m benchmarks.suite record
+
+`run` écrit ses résultats en JSON dans `benchmarks/results/` ; `compare`
+affiche l'écart entre deux fichiers et signale les régressions.
+"""
+import os
+import tempfile
+
+# Configuration isolée, fixée avant l'import de l'application : index
+# temporaire, pas de crawler ni de cache partagé, pas de limitation de
+# débit (les flux sont rejoués localement)
+_WORK_DIR = tempfile.mkdtemp(prefix="jobscraper-bench-")
+os.environ["SEARCH_INDEX_PATH"] = os.path.join(_WORK_DIR, "index.sqlite3")
+os.environ["CRAWLER_ENABLED"] = "false"
+os.environ["CACHE_BACKEND"] = "memory"
+os.environ["SCRAPER_DELAY"] = "0"
+
+import argparse  # noqa: E402
+import asyncio  # noqa: E402
+import json  # noqa: E402
+import platform  # noqa: E402
+import statistics  # noqa: E402
+import subprocess  # noqa: E402
+import sys  # noqa: E402
+import time  # noqa: E402
+import tracemalloc  # noqa: E402
+from datetime import datetime  # noqa: E402
+from typing import Any, Callable, Dict, List, Optional  # noqa: E402
+
+import httpx  # noqa: E402
+
+from app.core.http_client import get_http_client, set_http_client  # noqa: E402
+from app.main import (  # noqa: E402
+    filter_jobs, paginate_jobs, search_jobs, sort_jobs
+)
+from app.models import SearchRequest  # noqa: E402
+from app.scrapers import jobicy, remoteok  # noqa: E402
+from app.scrapers.browser_pool import PLAYWRIGHT_AVAILABLE, browser_pool  # noqa: E402
+from app.scrapers.welcometothejungle import (  # noqa: E402
+    WTTJ_BASE_URL, _extract_job_links, _parse_job_links
+)
+from app.services.dedup import deduplicate_jobs  # noqa: E402
+from app.services.export_service import (  # noqa: E402
+    encode_chunks, iter_csv, iter_json, iter_ndjson
+)
+from app.services.feed_cache import feed_cache  # noqa: E402
+from app.services.html_text import clean_description  # noqa: E402
+from app.services.json_stream import iter_array_items  # noqa: E402
+from app.services.keyword_matcher import compile_keywords  # noqa: E402
+from app.services.result_cache import result_cache  # noqa: E402
+from app.services.search_index import search_index  # noqa: E402
+from benchmarks import feeds  # noqa: E402
+
+DEFAULT_SIZES = [100, 10000, 100000]
+RESULTS_DIR = os.path.join(os.path.dirname(__file__), "results")
+
+# Requête sélective, représentative d'une recherche utilisateur
+QUERY = 'python OR react OR "machine learning"'
+
+
+class Context:
+    """Données préparées pour une taille de flux."""
+
+    def __init__(self, size: int, loop: asyncio.AbstractEventLoop):
+        self.size = size
+        self.loop = loop
+        self.bodies = feeds.feed_bodies(size)
+        self.remoteok_size, self.jobicy_size = feeds.split_size(size)
+        self.parsed = {host: json.loads(body) for host, body in self.bodies.items()}
+        self.wttj_html, self.wttj_hrefs = feeds.scale_wttj(size)
+
+        set_http_client(httpx.AsyncClient(transport=feeds.mock_transport(self.bodies)))
+        feed_cache.clear()
+        # Offres de tout le flux (requête vide) : entrée des étapes en aval
+        self.records = loop.run_until_complete(scrape_all("", self))
+
+    def close(self) -> None:
+        self.loop.run_until_complete(get_http_client().aclose())
+        set_http_client(None)
+
+
+async def scrape_all(keywords: str, ctx: Context) -> list:
+    remoteok_jobs, jobicy_jobs = await asyncio.gather(
+        remoteok.scrape_remoteok(keywords=keywords, max_results=ctx.remoteok_size),
+        jobicy.scrape_jobicy(keywords=keywords, max_results=ctx.jobicy_size),
+    )
+    return remoteok_jobs + jobicy_jobs
+
+
+# Étapes : chacune prépare et renvoie la fonction mesurée (synchrone ou
+# coroutine), ou None si elle ne peut pas tourner dans cet environnement
+
+def stage_fetch(ctx: Context):
+    async def run():
+        feed_cache.clear()
+        await asyncio.gather(
+            feed_cache.get("remoteok", remoteok.REMOTEOK_API_URL, headers=remoteok.HEADERS),
+            feed_cache.get(
+                "jobicy", jobicy.JOBICY_URL,
+                params={"count": jobicy.JOBICY_MAX_COUNT}, headers=jobicy.HEADERS
+            ),
+        )
+    return run
+
+
+def stage_parse(ctx: Context):
+    bodies = list(ctx.bodies.values())
+    return lambda: [json.loads(body) for body in bodies]
+
+
+def stage_parse_stream(ctx: Context):
+    # Lecture offre par offre du flux RemoteOK, filtrée avant décodage
+    body = ctx.bodies[httpx.URL(remoteok.REMOTEOK_API_URL).host]
+    matcher = compile_keywords(QUERY)
+
+    def run():
+        for raw_job in iter_array_items(body):
+            if matcher.may_match(raw_job):
+                json.loads(raw_job)
+    return run
+
+
+def stage_keyword_match(ctx: Context):
+    matcher = compile_keywords(QUERY)
+    remoteok_jobs = [job for job in list(ctx.parsed.values())[0] if "legal" not in job]
+    jobicy_jobs = list(ctx.parsed.values())[1]["jobs"]
+
+    def run():
+        for job in remoteok_jobs:
+            matcher.matches(job["position"], job["company"], job["description"], *job["tags"])
+        for job in jobicy_jobs:
+            matcher.matches(
+                job["jobTitle"], job["companyName"], job["jobDescription"], *job["jobIndustry"]
+            )
+    return run
+
+
+def stage_scrape(ctx: Context):
+    # Flux déjà en cache : filtrage + construction des offres
+    return lambda: scrape_all(QUERY, ctx)
+
+
+def stage_wttj_parse(ctx: Context):
+    return lambda: _parse_job_links(ctx.wttj_hrefs, ctx.size)
+
+
+def stage_dedup(ctx: Context):
+    return lambda: deduplicate_jobs(ctx.records)
+
+
+def stage_filter_jobs(ctx: Context):
+    return lambda: filter_jobs(ctx.records, salary_min=60000, experience_level="senior")
+
+
+def stage_sort_jobs_date(ctx: Context):
+    return lambda: sort_jobs(ctx.records, sort_by="date")
+
+
+def stage_sort_jobs_salary(ctx: Context):
+    return lambda: sort_jobs(ctx.records, sort_by="salary")
+
+
+def stage_paginate_jobs(ctx: Context):
+    return lambda: paginate_jobs(ctx.records, page=2, limit=20)
+
+
+def _export_stage(serializer: Callable):
+    def stage(ctx: Context):
+        def run():
+            # Descriptions nettoyées à froid à chaque passage
+            clean_description.cache_clear()
+            for _ in encode_chunks(serializer(ctx.records)):
+                pass
+        return run
+    return stage
+
+
+def stage_search_jobs(ctx: Context):
+    request = SearchRequest.model_validate({
+        "keywords": QUERY, "sources": ["remoteok", "jobicy"], "mode": "live"
+    })
+
+    async def run():
+        feed_cache.clear()
+        result_cache.clear()
+        await search_jobs(request)
+    return run
+
+
+def stage_wttj_render(ctx: Context):
+    if not PLAYWRIGHT_AVAILABLE:
+        return None
+    html = ctx.wttj_html
+
+    async def serve_fixture(route):
+        if route.request.url.startswith(f"{WTTJ_BASE_URL}/fr/jobs"):
+            await route.fulfill(status=200, content_type="text/html", body=html)
+        else:
+            await route.abort()
+
+    async def run():
+        async with browser_pool.page() as page:
+            await page.route("**/*", serve_fixture)
+            try:
+                await _extract_job_links(page, f"{WTTJ_BASE_URL}/fr/jobs?query=python", ctx.size)
+            finally:
+                await page.unroute("**/*", serve_fixture)
+
+    try:
+        ctx.loop.run_until_complete(browser_pool.start())
+    except Exception:
+        return None
+    return run
+
+
+STAGES: Dict[str, Callable[[Context], Any]] = {
+    "fetch": stage_fetch,
+    "parse": stage_parse,
+    "parse_stream": stage_parse_stream,
+    "keyword_match": stage_keyword_match,
+    "scrape": stage_scrape,
+    "wttj_parse": stage_wttj_parse,
+    "dedup": stage_dedup,
+    "filter_jobs": stage_filter_jobs,
+    "sort_jobs_date": stage_sort_jobs_date,
+    "sort_jobs_salary": stage_sort_jobs_salary,
+    "paginate_jobs": stage_paginate_jobs,
+    "export_csv": _export_stage(iter_csv),
+    "export_json": _export_stage(iter_json),
+    "export_ndjson": _export_stage(iter_ndjson),
+    "search_jobs": stage_search_jobs,
+    "wttj_render": stage_wttj_render,
+}
+
+
+def measure(
+    func: Callable[[], Any],
+    loop: asyncio.AbstractEventLoop,
+    repeat: int
+) -> Dict[str, Any]:
+    """Temps (médiane, minimum) sur `repeat` passages, puis pic mémoire sur un passage."""
+
+    def call():
+        result = func()
+        if asyncio.iscoroutine(result):
+            loop.run_until_complete(result)
+
+    call()  # échauffement
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        call()
+        timings.append(time.perf_counter() - start)
+
+    tracemalloc.start()
+    try:
+        call()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return {
+        "repeat": repeat,
+        "median_s": statistics.median(timings),
+        "min_s": min(timings),
+        "peak_bytes": peak,
+    }
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True, text=True, check=True,
+            cwd=os.path.dirname(__file__)
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def _format_bytes(size: float) -> str:
+    for unit in ("B", "KiB", "MiB"):
+        if abs(size) < 1024:
+            return f"{size:.0f} {unit}"
+        size /= 1024
+    return f"{size:.1f} GiB"
+
+
+def run(sizes: List[int], repeat: int, stages: List[str], output: Optional[str]) -> str:
+    """Exécute la suite et enregistre les résultats ; renvoie le chemin du fichier."""
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+    results = []
+
+    print(f"{'étape':<18} {'offres':>8} {'médiane':>11} {'min':>11} {'pic mémoire':>12}")
+    try:
+        for size in sizes:
+            ctx = Context(size, loop)
+            try:
+                for name in stages:
+                    func = STAGES[name](ctx)
+                    if func is None:
+                        print(f"{name:<18} {size:>8}   ignorée (dépendance indisponible)")
+                        continue
+                    result = {"stage": name, "size": size, **measure(func, loop, repeat)}
+                    results.append(result)
+                    print(
+                        f"{name:<18} {size:>8} {result['median_s'] * 1000:>8.2f} ms "
+                        f"{result['min_s'] * 1000:>8.2f} ms {_format_bytes(result['peak_bytes']):>12}"
+                    )
+            finally:
+                ctx.close()
+    finally:
+        loop.run_until_complete(browser_pool.close())
+        search_index.close()
+        loop.close()
+
+    document = {
+        "meta": {
+            "created_at": datetime.utcnow().isoformat() + "Z",
+            "git_commit": _git_commit(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "query": QUERY,
+            "sizes": sizes,
+            "repeat": repeat,
+        },
+        "results": results,
+    }
+
+    if output is None:
+        os.makedirs(RESULTS_DIR, exist_ok=True)
+        stamp = datetime.utcnow().strftime("%Y%m%d-%H%M%S")
+        output = os.path.join(RESULTS_DIR, f"{stamp}-{document['meta']['git_commit'] or 'local'}.json")
+    with open(output, "w", encoding="utf-8") as f:
+        json.dump(document, f, indent=2)
+    print(f"\nRésultats : {output}")
+    return output
+
+
+def compare(base_path: str, new_path: str, threshold: float) -> int:
+    """
+    Compare deux fichiers de résultats.
+
+    Returns:
+        Nombre de régressions (temps médian ou pic mémoire en hausse de plus
+        de `threshold` %)
+    """
+    with open(base_path, encoding="utf-8") as f:
+        base = json.load(f)
+    with open(new_path, encoding="utf-8") as f:
+        new = json.load(f)
+
+    base_results = {(r["stage"], r["size"]): r for r in base["results"]}
+    regressions = 0
+
+    print(f"base : {base['meta'].get('git_commit')}  nouveau : {new['meta'].get('git_commit')}\n")
+    print(f"{'étape':<18} {'offres':>8} {'base':>11} {'nouveau':>11} {'écart':>8} {'mémoire':>8}")
+    for result in new["results"]:
+        previous = base_results.get((result["stage"], result["size"]))
+        if previous is None:
+            continue
+        time_delta = _delta(previous["median_s"], result["median_s"])
+        memory_delta = _delta(previous["peak_bytes"], result["peak_bytes"])
+        regressed = time_delta > threshold or memory_delta > threshold
+        regressions += regressed
+        print(
+            f"{result['stage']:<18} {result['size']:>8} "
+            f"{previous['median_s'] * 1000:>8.2f} ms {result['median_s'] * 1000:>8.2f} ms "
+            f"{time_delta:>+7.1f}% {memory_delta:>+7.1f}%"
+            + ("  << régression" if regressed else "")
+        )
+    return regressions
+
+
+def _delta(before: float, after: float) -> float:
+    if before == 0:
+        return 0.0 if after == 0 else float("inf")
+    return (after - before) / before * 100
+
+
+def record() -> None:
+    """Réenregistre les fixtures depuis les sources réelles (réseau requis)."""
+
+    async def fetch():
+        async with httpx.AsyncClient(timeout=30.0, follow_redirects=True) as client:
+            response = await client.get(remoteok.REMOTEOK_API_URL, headers=remoteok.HEADERS)
+            response.raise_for_status()
+            _write_json("remoteok.json", response.json())
+
+            response = await client.get(
+                jobicy.JOBICY_URL, params={"count": jobicy.JOBICY_MAX_COUNT}, headers=jobicy.HEADERS
+            )
+            response.raise_for_status()
+            _write_json("jobicy.json", response.json())
+
+        if PLAYWRIGHT_AVAILABLE:
+            async with browser_pool.page() as page:
+                await page.goto(f"{WTTJ_BASE_URL}/fr/jobs?query=python", wait_until="networkidle")
+                with open(feeds.fixture_path("wttj_search.html"), "w", encoding="utf-8") as f:
+                    f.write(await page.content())
+            await browser_pool.close()
+
+    asyncio.run(fetch())
+    print(f"Fixtures enregistrées dans {feeds.FIXTURES_DIR}")
+
+
+def _write_json(name: str, data: Any) -> None:
+    with open(feeds.fixture_path(name), "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2, ensure_ascii=False)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Benchmarks JobScraper")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = commands.add_parser("run", help="Exécuter la suite")
+    run_parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES)
+    run_parser.add_argument("--repeat", type=int, default=3, help="Passages mesurés par étape")
+    run_parser.add_argument("--stages", nargs="+", choices=list(STAGES), default=list(STAGES))
+    run_parser.add_argument("--output", help="Fichier de résultats (JSON)")
+
+    compare_parser = commands.add_parser("compare", help="Comparer deux résultats")
+    compare_parser.add_argument("base")
+    compare_parser.add_argument("new")
+    compare_parser.add_argument("--threshold", type=float, default=10.0, help="Seuil de régression (%%)")
+
+    commands.add_parser("record", help="Réenregistrer les fixtures (réseau requis)")
+
+    args = parser.parse_args(argv)
+    if args.command == "run":
+        run(args.sizes, args.repeat, args.stages, args.output)
+    elif args.command == "compare":
+        sys.exit(1 if compare(args.base, args.new, args.threshold) else 0)
+    else:
+        record()
+
+
+if __name__ == "__main__":
+    main()
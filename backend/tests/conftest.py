@@ -0,0 +1,10 @@
+import os
+import tempfile
+
+# Configuration isolée, fixée avant l'import de l'application : index
+# temporaire, pas de crawler ni de cache partagé, pas de limitation de débit
+_WORK_DIR = tempfile.mkdtemp(prefix="jobscraper-tests-")
+os.environ["SEARCH_INDEX_PATH"] = os.path.join(_WORK_DIR, "index.sqlite3")
+os.environ["CRAWLER_ENABLED"] = "false"
+os.environ["CACHE_BACKEND"] = "memory"
+os.environ["SCRAPER_DELAY"] = "0"
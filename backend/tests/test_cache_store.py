@@ -0,0 +1,115 @@
+"""Tests des stockages de cache (mémoire, SQLite, Redis)."""
+import asyncio
+import fnmatch
+import time
+
+import pytest
+
+from app.services.cache_store import CacheStore, MemoryStore, RedisStore, SQLiteStore
+
+
+class FakeRedis:
+    """Client Redis minimal en mémoire : les commandes utilisées par RedisStore."""
+
+    def __init__(self):
+        self.data = {}
+        self.closed = False
+
+    def get(self, key):
+        entry = self.data.get(key)
+        if entry is None:
+            return None
+        value, expires_at = entry
+        if expires_at is not None and time.time() >= expires_at:
+            del self.data[key]
+            return None
+        return value
+
+    def set(self, key, value, px=None):
+        self.data[key] = (value, time.time() + px / 1000 if px is not None else None)
+
+    def delete(self, *keys):
+        for key in keys:
+            self.data.pop(key, None)
+
+    def scan_iter(self, match):
+        return [key for key in list(self.data) if fnmatch.fnmatchcase(key, match)]
+
+    def close(self):
+        self.closed = True
+
+
+@pytest.fixture(params=["memory", "sqlite", "redis"])
+def store(request, tmp_path):
+    if request.param == "memory":
+        store = MemoryStore()
+    elif request.param == "sqlite":
+        store = SQLiteStore(str(tmp_path / "cache.sqlite3"))
+    else:
+        store = RedisStore("redis://unused", client=FakeRedis())
+    yield store
+    store.close()
+
+
+def test_base_class_is_abstract():
+    with pytest.raises(TypeError):
+        CacheStore()
+
+
+def test_set_get_delete(store):
+    assert store.get("feeds", "a") is None
+    store.set("feeds", "a", b"1")
+    store.set("feeds", "a", b"2")
+    assert store.get("feeds", "a") == b"2"
+
+    store.delete("feeds", "a")
+    assert store.get("feeds", "a") is None
+
+
+def test_namespaces_are_separate(store):
+    store.set("feeds", "a", b"feed")
+    store.set("results", "a", b"result")
+
+    store.clear("feeds")
+
+    assert store.get("feeds", "a") is None
+    assert store.get("results", "a") == b"result"
+
+
+def test_entries_expire(store):
+    store.set("feeds", "short", b"1", ttl=0.01)
+    store.set("feeds", "long", b"2", ttl=60)
+    time.sleep(0.02)
+
+    assert store.get("feeds", "short") is None
+    assert store.get("feeds", "long") == b"2"
+
+
+def test_async_variants(store):
+    async def scenario():
+        await store.aset("feeds", "a", b"1")
+        return await store.aget("feeds", "a")
+
+    assert asyncio.run(scenario()) == b"1"
+
+
+def test_sqlite_store_is_shared_between_connections(tmp_path):
+    path = str(tmp_path / "cache.sqlite3")
+    writer, reader = SQLiteStore(path), SQLiteStore(path)
+    try:
+        writer.set("results", "id", b"jeu", ttl=60)
+        assert reader.get("results", "id") == b"jeu"
+    finally:
+        writer.close()
+        reader.close()
+
+
+def test_redis_store_prefixes_keys():
+    client = FakeRedis()
+    store = RedisStore("redis://unused", prefix="app", client=client)
+
+    store.set("feeds", "remoteok", b"1", ttl=1)
+    store.close()
+
+    assert list(client.data) == ["app:feeds:remoteok"]
+    assert client.closed
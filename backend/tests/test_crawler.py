@@ -0,0 +1,67 @@
+"""Tests du crawler et de la couverture de l'index."""
+import asyncio
+
+from app.models import JobRecord
+from app.services import crawler as crawler_module
+from app.services.crawler import Crawler
+from app.services.search_index import JobIndex
+
+
+def make_job(source: str, number: int) -> JobRecord:
+    return JobRecord(
+        title=f"Offre {number}",
+        company="Acme",
+        location="Remote",
+        url=f"https://example.com/{source}/{number}",
+        source=source,
+        scraped_at="2024-01-01T00:00:00Z",
+    )
+
+
+def run_crawl(monkeypatch, source: str, available: int, max_results: int):
+    calls = []
+
+    async def fake_scraper(keywords: str, max_results: int):
+        calls.append(keywords)
+        return [make_job(source, n) for n in range(min(available, max_results))]
+
+    monkeypatch.setitem(crawler_module.SCRAPERS, source, fake_scraper)
+    index = JobIndex(":memory:")
+    crawler = Crawler(
+        index=index, sources=[source], queries=["developer", "data"],
+        interval=0, max_results=max_results
+    )
+    asyncio.run(crawler.run_once())
+    return index, calls
+
+
+def test_full_feed_source_is_crawled_without_keywords(monkeypatch):
+    index, calls = run_crawl(monkeypatch, "remoteok", available=3, max_results=10)
+
+    assert calls == [""]
+    assert index.covered_sources() == {"remoteok"}
+    assert index.count() == 3
+
+
+def test_capped_crawl_does_not_cover_the_source(monkeypatch):
+    index, _ = run_crawl(monkeypatch, "remoteok", available=20, max_results=10)
+
+    assert index.covered_sources() == set()
+
+
+def test_query_driven_source_falls_back_to_live(monkeypatch):
+    index, calls = run_crawl(monkeypatch, "welcometothejungle", available=3, max_results=10)
+
+    assert calls == ["developer", "data"]
+    assert index.covered_sources() == set()
+
+
+def test_stale_crawl_no_longer_covers_the_source(monkeypatch):
+    index, _ = run_crawl(monkeypatch, "remoteok", available=3, max_results=10)
+    assert index.covered_sources(max_age=60) == {"remoteok"}
+
+    with index._connection() as conn:
+        conn.execute("UPDATE crawl_state SET crawled_at = '2020-01-01T00:00:00Z'")
+
+    assert index.covered_sources(max_age=60) == set()
+    assert index.covered_sources() == {"remoteok"}
@@ -0,0 +1,161 @@
+"""Tests de la déduplication (SimHash + LSH)."""
+import hashlib
+import random
+import unicodedata
+
+from app.models import JobRecord
+from app.services.dedup import (
+    MAX_DISTANCE, SIMHASH_BITS, TAG_RE, WORD_RE, cluster_fingerprints, deduplicate_jobs,
+    normalize_text, simhash
+)
+
+
+def reference_simhash(features):
+    # SimHash sans astuce : un compteur par bit
+    counters = [0] * SIMHASH_BITS
+    for feature in features:
+        value = int.from_bytes(
+            hashlib.blake2b(feature.encode("utf-8"), digest_size=8).digest(), "big"
+        )
+        for bit in range(SIMHASH_BITS):
+            counters[bit] += value >> bit & 1
+    threshold = len(features) // 2
+    return sum(1 << bit for bit, count in enumerate(counters) if count > threshold)
+
+
+def reference_clusters(fingerprints):
+    # Comparaison de toutes les paires, fermée par transitivité
+    parent = list(range(len(fingerprints)))
+
+    def find(i):
+        while parent[i] != i:
+            i = parent[i]
+        return i
+
+    for i, a in enumerate(fingerprints):
+        for j in range(i):
+            if bin(a ^ fingerprints[j]).count("1") <= MAX_DISTANCE:
+                parent[find(i)] = find(j)
+    return [find(i) for i in range(len(fingerprints))]
+
+
+def partition(roots):
+    groups = {}
+    for i, root in enumerate(roots):
+        groups.setdefault(root, []).append(i)
+    return sorted(groups.values())
+
+
+def flip_bits(value, count, rng):
+    for bit in rng.sample(range(SIMHASH_BITS), count):
+        value ^= 1 << bit
+    return value
+
+
+def test_simhash_matches_per_bit_counters():
+    rng = random.Random(0)
+    words = [f"mot{n}" for n in range(300)]
+    for size in (0, 1, 2, 7, 50, 400):
+        features = [rng.choice(words) for _ in range(size)]
+        assert simhash(features) == reference_simhash(features)
+
+
+def reference_normalize(text):
+    text = unicodedata.normalize("NFKD", TAG_RE.sub(" ", text))
+    text = "".join(c for c in text if not unicodedata.combining(c))
+    return WORD_RE.findall(text.lower())
+
+
+def test_normalize_text_strips_accents_and_tags():
+    assert normalize_text("Développeur <b>Senior</b> C++ à Paris") == [
+        "developpeur", "senior", "c", "a", "paris"
+    ]
+    # Les caractères sans décomposition séparent les mots, comme la ponctuation
+    for text in ("Cœur de métier", "Straße", "ＦＵＬＬ－ＴＩＭＥ", "plain ascii text"):
+        assert normalize_text(text) == reference_normalize(text)
+
+
+def test_every_distance_up_to_max_is_found():
+    rng = random.Random(1)
+    for distance in range(MAX_DISTANCE + 1):
+        for _ in range(200):
+            base = rng.getrandbits(SIMHASH_BITS)
+            roots = cluster_fingerprints([base, flip_bits(base, distance, rng)])
+            assert roots[0] == roots[1], (distance, base)
+
+
+def test_distance_above_max_is_not_merged():
+    rng = random.Random(2)
+    base = rng.getrandbits(SIMHASH_BITS)
+    roots = cluster_fingerprints([base, flip_bits(base, MAX_DISTANCE + 1, rng)])
+    assert roots[0] != roots[1]
+
+
+def test_clusters_match_pairwise_comparison():
+    rng = random.Random(3)
+    fingerprints = []
+    for _ in range(60):
+        base = rng.getrandbits(SIMHASH_BITS)
+        fingerprints.append(base)
+        for _ in range(rng.randrange(4)):
+            fingerprints.append(flip_bits(base, rng.randrange(12), rng))
+    rng.shuffle(fingerprints)
+
+    assert partition(cluster_fingerprints(fingerprints)) == partition(
+        reference_clusters(fingerprints)
+    )
+
+
+def make_job(source, title="Développeur Python", company="Acme", **fields):
+    return JobRecord(
+        title=title,
+        company=company,
+        location="Remote",
+        url=f"https://{source}.example.com/{title}",
+        source=source,
+        description="Nous recherchons un développeur Python expérimenté pour notre équipe.",
+        **fields
+    )
+
+
+def test_same_offer_on_two_sources_is_merged():
+    jobs = [make_job("remoteok"), make_job("jobicy", salary="50k")]
+
+    unique, duplicates = deduplicate_jobs(jobs)
+
+    assert duplicates == 1
+    assert len(unique) == 1
+    # L'offre la plus complète est gardée, avec toutes les sources
+    assert unique[0].salary == "50k"
+    assert unique[0].sources == ["jobicy", "remoteok"]
+
+
+def test_same_source_near_duplicates_are_kept():
+    jobs = [make_job("remoteok"), make_job("remoteok", title="Développeur Python ")]
+
+    unique, duplicates = deduplicate_jobs(jobs)
+
+    assert duplicates == 0
+    assert len(unique) == 2
+
+
+def test_groups_never_hold_two_offers_of_one_source():
+    # jobicy est proche des deux offres remoteok : une seule la rejoint
+    jobs = [make_job("remoteok"), make_job("jobicy"), make_job("remoteok")]
+
+    unique, duplicates = deduplicate_jobs(jobs)
+
+    assert duplicates == 1
+    assert [job.sources for job in unique] == [["jobicy", "remoteok"], None]
+
+
+def test_different_offers_are_not_merged():
+    jobs = [
+        make_job("remoteok"),
+        make_job("jobicy", title="Product Designer", company="Globex"),
+    ]
+
+    unique, duplicates = deduplicate_jobs(jobs)
+
+    assert duplicates == 0
+    assert unique == jobs
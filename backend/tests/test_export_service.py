@@ -0,0 +1,79 @@
+"""Tests des exports en flux (CSV, JSON, NDJSON, gzip)."""
+import csv
+import gzip
+import io
+import json
+
+import pytest
+
+from app.models import JobRecord
+from app.services.export_service import (
+    CSV_FIELDNAMES, encode_chunks, gzip_chunks, iter_csv, iter_json, iter_ndjson
+)
+
+
+def make_jobs() -> list:
+    return [
+        JobRecord(
+            title='Développeur "Python", senior',
+            company="Acme, Inc.",
+            location="Paris\nLyon",
+            url="https://example.com/jobs/1",
+            source="remoteok",
+            salary="45 000 €",
+            salary_min=45000,
+            salary_max=45000,
+            description="Ligne 1,\n\"citée\"\nLigne 3 ☃",
+            tags=["python", "remote"],
+        ),
+        JobRecord(
+            title="Data engineer",
+            company="Globex",
+            location="Remote",
+            url="https://example.com/jobs/2",
+            source="jobicy",
+        ),
+    ]
+
+
+@pytest.mark.parametrize("jobs", [[], make_jobs()[:1], make_jobs()])
+def test_streamed_json_is_identical_to_json_dumps(jobs):
+    expected = json.dumps(
+        [job.to_dict(by_alias=True) for job in jobs], indent=2, ensure_ascii=False
+    )
+    assert "".join(iter_json(jobs)) == expected
+
+
+def test_csv_round_trip_keeps_commas_quotes_and_newlines():
+    jobs = make_jobs()
+    rows = list(csv.DictReader(io.StringIO("".join(iter_csv(jobs)), newline="")))
+
+    assert len(rows) == len(jobs)
+    for row, job in zip(rows, jobs):
+        expected = job.to_dict()
+        expected["tags"] = ", ".join(expected["tags"] or [])
+        assert list(row) == CSV_FIELDNAMES
+        assert row == {
+            name: "" if expected[name] is None else str(expected[name])
+            for name in CSV_FIELDNAMES
+        }
+
+
+def test_ndjson_round_trip_gives_one_object_per_line():
+    jobs = make_jobs()
+    lines = "".join(iter_ndjson(jobs)).splitlines()
+
+    assert [json.loads(line) for line in lines] == [job.to_dict(by_alias=True) for job in jobs]
+
+
+def test_gzip_stream_decompresses_to_the_plain_body():
+    jobs = make_jobs() * 200
+    plain = b"".join(encode_chunks(iter_json(jobs), chunk_size=1024))
+    compressed = list(gzip_chunks(encode_chunks(iter_json(jobs), chunk_size=1024)))
+
+    assert len(compressed) > 1
+    assert gzip.decompress(b"".join(compressed)) == plain
+
+
+def test_gzip_of_an_empty_stream_is_valid():
+    assert gzip.decompress(b"".join(gzip_chunks([]))) == b""
@@ -0,0 +1,64 @@
+"""Tests de l'extraction du texte des descriptions HTML."""
+import pytest
+
+from app.services.html_text import html_to_text
+
+
+@pytest.mark.parametrize("markup, expected", [
+    # Les espaces insécables sont normalisés comme les autres
+    ("Salaire &gt; 40K&nbsp;&euro; &amp; tickets", "Salaire > 40K € & tickets"),
+    ("&#233;quipe &#x2014; R&amp;D", "équipe — R&D"),
+    ("a < b et c > d", "a < b et c > d"),
+])
+def test_entities_are_decoded(markup, expected):
+    assert html_to_text(markup) == expected
+
+
+def test_block_tags_become_newlines():
+    markup = "<h2>Missions</h2><ul><li>Python</li><li>SQL</li></ul><p>Télétravail<br>partiel</p>"
+    assert html_to_text(markup) == "Missions\nPython\nSQL\nTélétravail\npartiel"
+
+
+def test_inline_tags_keep_words_apart_only_where_spaced():
+    markup = "<p>Stack <b>Python</b>, <em>Django</em>et<i>React</i></p>"
+    assert html_to_text(markup) == "Stack Python, DjangoetReact"
+
+
+def test_whitespace_is_collapsed():
+    assert html_to_text("<p>  un\n\n  deux\t trois  </p>  ") == "un deux trois"
+
+
+def test_script_style_and_comments_are_skipped():
+    markup = (
+        "<style>p { color: red }</style>"
+        "<p>Offre<script>var x = '<p>pas du texte</p>';</script> visible</p>"
+        "<!-- commentaire <b>caché</b> -->"
+    )
+    assert html_to_text(markup) == "Offre visible"
+
+
+def test_unclosed_script_hides_the_rest():
+    assert html_to_text("<p>Début</p><script>alert(1)") == "Début"
+
+
+@pytest.mark.parametrize("markup, expected", [
+    ("<p>Texte coupé <a href=\"https://exa", "Texte coupé"),
+    ("<p>Texte <b>gras", "Texte gras"),
+    ("<div><p>Sans fermeture", "Sans fermeture"),
+    ("<p>Fin</", "Fin"),
+])
+def test_unclosed_or_truncated_tags(markup, expected):
+    assert html_to_text(markup) == expected
+
+
+def test_max_chars_cuts_the_text():
+    markup = "<p>" + "mot " * 1000 + "</p>"
+    text = html_to_text(markup, max_chars=20)
+
+    assert len(text) <= 20
+    assert text == "mot mot mot mot mot"
+
+
+def test_max_chars_stops_before_later_blocks():
+    markup = "<p>Premier bloc</p>" + "<p>suite</p>" * 1000
+    assert html_to_text(markup, max_chars=12) == "Premier bloc"
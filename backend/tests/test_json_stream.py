@@ -0,0 +1,85 @@
+"""Tests de la lecture incrémentale des tableaux JSON."""
+import json
+from pathlib import Path
+
+import pytest
+
+from app.services.json_stream import iter_array_items
+from app.services.keyword_matcher import KeywordMatcher
+
+
+def items(data: bytes) -> list:
+    return [json.loads(item) for item in iter_array_items(data)]
+
+
+@pytest.mark.parametrize("value", [
+    [],
+    [1, -2.5e3, True, False, None, "texte"],
+    [{"id": 1, "tags": ["python", "remote"], "location": {"city": "Paris"}}],
+    # Imbrication plus profonde que l'expression rapide (deux niveaux)
+    [{"a": {"b": {"c": [{"d": [1, [2, [3]]]}]}}}, [[[]]], {}],
+    # Chaînes avec guillemets, crochets, accolades et échappements
+    [{"description": "un \"devis\" {pas} [un tableau], \\ fin\\"}, "é☃😀"],
+    [{"legal": "En utilisant l'API…"}, {"position": "Développeur", "salary_min": 0}],
+])
+def test_items_match_json_loads(value):
+    for data in (
+        json.dumps(value), json.dumps(value, indent=2), json.dumps(value, ensure_ascii=False)
+    ):
+        assert items(data.encode("utf-8")) == value
+
+
+def test_items_are_raw_bytes_of_each_element():
+    assert list(iter_array_items(b' [ {"a": 1} ,\n"b" , 3 ] ')) == [b'{"a": 1}', b'"b"', b"3"]
+
+
+@pytest.mark.parametrize("data", [b"", b"   ", b'{"error": "rate limited"}', b'"[1, 2]"', b"null"])
+def test_non_array_input_yields_nothing(data):
+    assert list(iter_array_items(data)) == []
+
+
+@pytest.mark.parametrize("data", [
+    b"[",
+    b'[{"a": 1}',
+    b'[{"a": 1},',
+    b'[{"a": "non termine',
+    b'[{"a": {"b": [1, 2',
+    b'[1 2]',
+])
+def test_truncated_or_invalid_arrays_raise(data):
+    with pytest.raises(json.JSONDecodeError):
+        list(iter_array_items(data))
+
+
+def test_items_before_an_error_are_still_produced():
+    stream = iter_array_items(b'[{"a": 1}, {"b": 2}, {"c": ')
+
+    assert json.loads(next(stream)) == {"a": 1}
+    assert json.loads(next(stream)) == {"b": 2}
+    with pytest.raises(json.JSONDecodeError):
+        next(stream)
+
+
+FIXTURES = Path(__file__).resolve().parent.parent / "benchmarks" / "fixtures"
+
+
+def test_recorded_remoteok_feed_matches_json_loads():
+    data = (FIXTURES / "remoteok.json").read_bytes()
+    assert items(data) == json.loads(data)
+
+
+@pytest.mark.parametrize("keywords", [
+    "python", "react OR vue", "senior AND backend", "engineer -senior", '"full stack"',
+    "c++", "développeur", "NOT python",
+])
+def test_screen_keeps_every_matching_feed_item(keywords):
+    matcher = KeywordMatcher(keywords)
+    data = (FIXTURES / "remoteok.json").read_bytes()
+    for raw in iter_array_items(data):
+        job = json.loads(raw)
+        fields = [
+            job.get("position"), job.get("company"), job.get("description"),
+            *(job.get("tags") or [])
+        ]
+        if matcher.matches(*fields):
+            assert matcher.may_match(raw)
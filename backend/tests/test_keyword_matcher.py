@@ -0,0 +1,96 @@
+"""Tests de la syntaxe de recherche par mots-clés."""
+import json
+
+import pytest
+
+from app.services.keyword_matcher import KeywordMatcher
+
+
+def matches(keywords: str, *fields: str) -> bool:
+    return KeywordMatcher(keywords).matches(*fields)
+
+
+@pytest.mark.parametrize("keywords, text, expected", [
+    ("python", "Développeur Python senior", True),
+    ("python django", "Développeur Django", True),
+    ("python OR django", "Développeur Go", False),
+    ("python AND django", "Python et Flask", False),
+    ("python AND django", "Python et Django", True),
+    ("python NOT senior", "Python senior", False),
+    ("python NOT senior", "Python junior", True),
+    ("python -senior", "Python senior", False),
+    ("python -senior", "Django junior", False),
+    ("(python OR go) AND remote", "Go, full remote", True),
+    ("(python OR go) AND remote", "Python, sur site", False),
+    ("NOT php", "Développeur Java", True),
+])
+def test_operators(keywords, text, expected):
+    assert matches(keywords, text) is expected
+
+
+def test_phrases_match_consecutive_words():
+    assert matches('"data engineer"', "Senior Data   Engineer")
+    assert not matches('"data engineer"', "Engineer, data team")
+
+
+def test_word_boundaries():
+    assert not matches("java", "Développeur JavaScript")
+    assert matches("java", "Java/Kotlin")
+    assert matches("c++", "Développeur C++ embarqué")
+    assert not matches("c++", "Développeur C embarqué")
+    assert matches("c#", "Développeur C# .NET")
+    assert matches(".net", "Développeur C# .NET")
+
+
+def test_lowercase_operators_are_words():
+    assert matches("rock and roll", "Roll")
+    assert not matches("rock AND roll", "Roll")
+
+
+def test_terms_do_not_span_fields():
+    assert not matches('"acme python"', "Acme", "Python")
+    assert matches("acme AND python", "Acme", "Python")
+
+
+def test_empty_query_matches_everything():
+    assert matches("", "n'importe quoi")
+    assert matches("   ", "n'importe quoi")
+
+
+def test_malformed_syntax_is_tolerated():
+    assert matches("(python OR", "Python")
+    assert matches("python AND", "Python")
+    assert matches('"data engineer', "Data Engineer")
+
+
+def test_excluded_terms_and_rejects():
+    matcher = KeywordMatcher("python -senior -lead")
+
+    assert matcher.terms == ["python"]
+    assert matcher.excluded == ["senior", "lead"]
+    assert matcher.rejects("Lead developer")
+    assert not matcher.rejects("Python developer")
+
+
+@pytest.mark.parametrize("keywords", [
+    "python", "c++", "c#", '"data engineer"', "python -senior", "NOT php",
+    "développeur", "go AND (remote OR télétravail)",
+])
+def test_raw_screen_never_rejects_a_match(keywords):
+    matcher = KeywordMatcher(keywords)
+    offers = [
+        {"position": "Développeur Python", "description": "Télétravail \"complet\""},
+        {"position": "C++ / C# engineer", "tags": ["remote", "go"]},
+        {"position": "Data Engineer", "description": "PHP, senior"},
+        {"position": "Designer", "description": "rien à voir"},
+    ]
+    for offer in offers:
+        raw = json.dumps(offer).encode("utf-8")
+        fields = [offer.get("position"), offer.get("description"), *offer.get("tags", [])]
+        if matcher.matches(*fields):
+            assert matcher.may_match(raw), (keywords, offer)
+
+
+def test_raw_screen_rejects_absent_terms():
+    assert not KeywordMatcher("python").may_match(b'{"position": "Designer"}')
+    assert KeywordMatcher("python").may_match(b'{"position": "Python dev"}')
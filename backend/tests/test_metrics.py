@@ -0,0 +1,26 @@
+"""Tests des métriques Prometheus."""
+import pytest
+
+from app.services.metrics import MetricsRegistry, _Metric
+
+
+def test_metric_base_is_abstract():
+    with pytest.raises(TypeError):
+        _Metric("base", "Sans séries")
+
+
+def test_registry_renders_counters_and_histograms():
+    registry = MetricsRegistry()
+    counter = registry.counter("jobs_total", "Offres", ["source"])
+    histogram = registry.histogram("duration_seconds", "Durée", buckets=(0.1, 1.0))
+    counter.inc(source="remoteok")
+    counter.inc(2, source="remoteok")
+    histogram.observe(0.5)
+
+    lines = registry.render().splitlines()
+
+    assert 'jobs_total{source="remoteok"} 3' in lines
+    assert 'duration_seconds_bucket{le="0.1"} 0' in lines
+    assert 'duration_seconds_bucket{le="1"} 1' in lines
+    assert 'duration_seconds_bucket{le="+Inf"} 1' in lines
+    assert "duration_seconds_count 1" in lines
@@ -0,0 +1,24 @@
+"""Tests de l'analyse des salaires en texte libre."""
+import pytest
+
+from app.models import parse_salary_range
+
+
+@pytest.mark.parametrize("salary, expected", [
+    # Le suffixe "K" ne s'applique qu'au nombre qu'il suit
+    ("40-50K€", (40, 50000)),
+    ("40K-50K€", (40000, 50000)),
+    ("40K-50000", (40000, 50000)),
+    ("45 000 €", (45000, 45000)),
+    ("45,000 USD", (45000, 45000)),
+    ("55K", (55000, 55000)),
+    ("60000", (60000, 60000)),
+    ("3.5K - 4K / mois", (3500, 4000)),
+])
+def test_ranges_and_single_values(salary, expected):
+    assert parse_salary_range(salary) == expected
+
+
+@pytest.mark.parametrize("salary", [None, "", "Selon profil", "K€"])
+def test_text_without_digits_gives_nothing(salary):
+    assert parse_salary_range(salary) == (None, None)
@@ -0,0 +1,95 @@
+"""Tests du limiteur de débit par hôte."""
+import asyncio
+
+import pytest
+
+from app.services import rate_limiter as rate_limiter_module
+from app.services.rate_limiter import HostRateLimiter, TokenBucket
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(rate_limiter_module, "time", clock)
+    return clock
+
+
+def test_burst_is_free_then_requests_are_spaced(clock):
+    bucket = TokenBucket(rate=2.0, capacity=2)
+
+    assert bucket.reserve() == 0.0
+    assert bucket.reserve() == 0.0
+    # Au-delà de la rafale, chaque requête attend son tour (0,5 s d'écart)
+    assert bucket.reserve() == pytest.approx(0.5)
+    assert bucket.reserve() == pytest.approx(1.0)
+
+
+def test_tokens_come_back_over_time(clock):
+    bucket = TokenBucket(rate=2.0, capacity=2)
+    for _ in range(3):
+        bucket.reserve()
+
+    clock.now += 1.5
+    assert bucket.reserve() == 0.0
+    # Le solde ne dépasse jamais la capacité, même après une longue pause
+    clock.now += 60
+    assert [bucket.reserve() for _ in range(3)] == [0.0, 0.0, pytest.approx(0.5)]
+
+
+def test_refund_gives_the_slot_back(clock):
+    bucket = TokenBucket(rate=1.0, capacity=1)
+    bucket.reserve()
+
+    assert bucket.reserve() == pytest.approx(1.0)
+    bucket.refund()
+    assert bucket.reserve() == pytest.approx(1.0)
+
+
+def test_host_delays_apply_even_without_a_global_delay(clock):
+    limiter = HostRateLimiter(delay=0, burst=1, host_delays={"jobicy.com": 2.0})
+
+    assert limiter._bucket("remoteok.com") is None
+    bucket = limiter._bucket("jobicy.com")
+    assert bucket is not None and bucket.rate == pytest.approx(0.5)
+
+
+def test_acquire_waits_on_a_host_specific_delay(clock, monkeypatch):
+    waits = []
+
+    async def fake_sleep(seconds):
+        waits.append(seconds)
+
+    monkeypatch.setattr(rate_limiter_module.asyncio, "sleep", fake_sleep)
+    limiter = HostRateLimiter(delay=0, burst=1, host_delays={"jobicy.com": 2.0})
+
+    async def scenario():
+        for _ in range(2):
+            await limiter.acquire("https://jobicy.com/api/v2/remote-jobs")
+            await limiter.acquire("https://remoteok.com/api")
+
+    asyncio.run(scenario())
+    assert waits == [pytest.approx(2.0)]
+
+
+def test_cancelled_wait_refunds_its_token(clock):
+    limiter = HostRateLimiter(delay=10.0, burst=1)
+
+    async def scenario():
+        await limiter.acquire("https://remoteok.com/api")
+        waiter = asyncio.create_task(limiter.acquire("https://remoteok.com/api"))
+        await asyncio.sleep(0)
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+
+    asyncio.run(scenario())
+    # Le créneau annulé est rendu : la requête suivante n'attend pas 20 s
+    assert limiter._bucket("remoteok.com").reserve() == pytest.approx(10.0)
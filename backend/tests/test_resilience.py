@@ -0,0 +1,121 @@
+"""Tests des disjoncteurs et du budget de nouvelles tentatives."""
+import pytest
+
+from app.services import resilience
+from app.services.resilience import (
+    CLOSED, HALF_OPEN, OPEN, CircuitBreaker, CircuitBreakers, RetryBudget
+)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(resilience, "time", clock)
+    return clock
+
+
+def test_breaker_opens_after_consecutive_failures(clock):
+    breaker = CircuitBreaker("remoteok", failure_threshold=3, cooldown=30)
+
+    breaker.record_failure(RuntimeError("502"))
+    breaker.record_failure()
+    assert breaker.state == CLOSED and breaker.allow()
+
+    breaker.record_failure()
+    assert breaker.state == OPEN
+    assert not breaker.allow()
+    assert breaker.last_error == "502"
+    assert breaker.retry_in == 30
+
+
+def test_success_resets_the_failure_count(clock):
+    breaker = CircuitBreaker("remoteok", failure_threshold=2, cooldown=30)
+
+    breaker.record_failure()
+    breaker.record_success()
+    breaker.record_failure()
+
+    assert breaker.state == CLOSED
+
+
+def test_half_open_lets_a_single_trial_through(clock):
+    breaker = CircuitBreaker("remoteok", failure_threshold=1, cooldown=30)
+    breaker.record_failure()
+
+    clock.now += 30
+    assert breaker.state == HALF_OPEN
+    assert breaker.allow()
+    assert not breaker.allow()
+
+    breaker.record_success()
+    assert breaker.state == CLOSED
+    assert breaker.allow()
+
+
+def test_failed_trial_reopens_the_breaker(clock):
+    breaker = CircuitBreaker("remoteok", failure_threshold=3, cooldown=30)
+    for _ in range(3):
+        breaker.record_failure()
+
+    clock.now += 31
+    assert breaker.allow()
+    breaker.record_failure()
+
+    assert breaker.state == OPEN
+    clock.now += 29
+    assert not breaker.allow()
+
+
+def test_released_trial_can_be_retried(clock):
+    breaker = CircuitBreaker("remoteok", failure_threshold=1, cooldown=30)
+    breaker.record_failure()
+    clock.now += 30
+
+    assert breaker.allow()
+    breaker.release()
+    assert breaker.allow()
+
+
+def test_degraded_lists_open_sources(clock):
+    breakers = CircuitBreakers(failure_threshold=1, cooldown=30)
+    breakers.get("remoteok").record_failure()
+    breakers.get("jobicy").record_success()
+
+    assert breakers.degraded() == ["remoteok"]
+    assert breakers.degraded(["jobicy", "welcometothejungle"]) == []
+    assert breakers.snapshot()["remoteok"]["state"] == OPEN
+
+
+def test_retry_budget_has_a_floor(clock):
+    budget = RetryBudget(ratio=0.1, min_per_second=0.2, window=10)
+
+    # 0.2/s sur 10 s : 2 nouvelles tentatives sans aucun scraping
+    assert budget.try_acquire()
+    assert budget.try_acquire()
+    assert not budget.try_acquire()
+
+
+def test_retry_budget_grows_with_calls(clock):
+    budget = RetryBudget(ratio=0.5, min_per_second=0, window=10)
+    for _ in range(4):
+        budget.record_call()
+
+    assert [budget.try_acquire() for _ in range(3)] == [True, True, False]
+
+
+def test_retry_budget_window_slides(clock):
+    budget = RetryBudget(ratio=0, min_per_second=0.1, window=10)
+
+    assert budget.try_acquire()
+    assert not budget.try_acquire()
+
+    clock.now += 11
+    assert budget.try_acquire()
@@ -0,0 +1,64 @@
+"""Tests du cache des jeux de résultats."""
+import asyncio
+
+from app.models import SearchRequest
+from app.services.cache_store import MemoryStore
+from app.services.result_cache import ResultSetCache, result_set_key
+
+
+def make_cache(store=None) -> ResultSetCache:
+    return ResultSetCache(ttl=60, max_entries=10, max_jobs=1000, idle_ttl=60, store=store)
+
+
+def test_each_computed_set_gets_its_own_id():
+    cache = make_cache()
+    first = cache.put("python", [], [], scraped_at="t1")
+    second = cache.put("python", [], [], scraped_at="t2")
+
+    assert first.id != second.id
+    # Le premier jeu reste lisible pour sa pagination ou son export
+    assert cache.get(first.id) is first
+    assert cache.get(second.id) is second
+
+
+def test_fresh_lookup_returns_latest_set_for_key():
+    cache = make_cache()
+    cache.put("python", [], [], scraped_at="t1")
+    latest = cache.put("python", [], [], scraped_at="t2")
+
+    assert cache.get_fresh("python") is latest
+    assert cache.get_fresh("java") is None
+
+
+def test_eviction_drops_key_index():
+    cache = ResultSetCache(ttl=60, max_entries=1, max_jobs=1000, idle_ttl=60)
+    first = cache.put("python", [], [], scraped_at="t1")
+    cache.put("java", [], [], scraped_at="t2")
+
+    assert cache.get(first.id) is None
+    assert cache.get_fresh("python") is None
+
+
+def test_shared_store_serves_other_workers():
+    store = MemoryStore(shared=True)
+    writer = make_cache(store)
+    reader = make_cache(store)
+
+    async def scenario():
+        stored = await writer.aput("python", [], [], scraped_at="t1", request={"keywords": "python"})
+        by_key = await reader.aget_fresh("python")
+        by_id = await reader.aget(stored.id)
+        return stored, by_key, by_id
+
+    stored, by_key, by_id = asyncio.run(scenario())
+    assert by_key is not None and by_key.id == stored.id
+    assert by_key.key == "python"
+    assert by_id is not None and by_id.request == {"keywords": "python"}
+
+
+def test_operator_case_changes_the_key():
+    def key(keywords):
+        return result_set_key(SearchRequest(keywords=keywords))
+
+    assert key("python NOT senior") != key("python not senior")
+    assert key("  python   NOT senior ") == key("python NOT senior")
@@ -0,0 +1,78 @@
+"""Tests de l'index plein texte."""
+import pytest
+
+from app.models import JobRecord
+from app.services.search_index import JobIndex
+
+
+def make_job(title: str, description: str = "") -> JobRecord:
+    return JobRecord(
+        title=title,
+        company="Acme",
+        location="Remote",
+        url=f"https://example.com/{title}",
+        source="remoteok",
+        description=description,
+    )
+
+
+@pytest.fixture
+def index():
+    index = JobIndex(":memory:")
+    index.upsert([
+        make_job("Développeur C++"),
+        make_job("Développeur C#"),
+        make_job("Développeur C"),
+        make_job("Développeur Python", "Django, remote"),
+    ])
+    yield index
+    index.close()
+
+
+def titles(result):
+    jobs, _ = result
+    return sorted(job.title for job in jobs)
+
+
+def test_punctuated_terms_are_not_reduced_to_their_letters(index):
+    # FTS5 tokenise `c++` et `c#` en `c` : le matcher doit trancher
+    assert titles(index.search("c++")) == ["Développeur C++"]
+    assert titles(index.search("c#")) == ["Développeur C#"]
+    assert titles(index.search("c++ OR c#")) == ["Développeur C#", "Développeur C++"]
+
+
+def test_index_applies_operators(index):
+    assert titles(index.search("python AND remote")) == ["Développeur Python"]
+    assert titles(index.search("développeur -python")) == [
+        "Développeur C", "Développeur C#", "Développeur C++"
+    ]
+
+
+def test_filtered_candidates_do_not_eat_the_limit():
+    index = JobIndex(":memory:")
+    # Les offres « senior » sont classées en tête par BM25 (mot répété dans
+    # le titre) : un LIMIT avant le matcher ne laisserait aucun résultat
+    index.upsert(
+        [make_job(f"Senior Python Python developer {n}") for n in range(100)]
+        + [make_job(f"Developer {n}", "python") for n in range(100)]
+    )
+
+    jobs, exhausted = index.search("python -senior", limit=50)
+    assert len(jobs) == 50
+    assert all("Senior" not in job.title for job in jobs)
+    assert not exhausted
+
+    jobs, exhausted = index.search("python -senior", limit=500)
+    assert len(jobs) == 100
+    assert exhausted
+    index.close()
+
+
+def test_accept_filter_is_applied_while_reading():
+    index = JobIndex(":memory:")
+    index.upsert([make_job(f"Python {n}") for n in range(10)])
+
+    jobs, exhausted = index.search("python", limit=3, accept=lambda job: job.title.endswith("7"))
+    assert [job.title for job in jobs] == ["Python 7"]
+    assert exhausted
+    index.close()
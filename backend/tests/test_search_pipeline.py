@@ -0,0 +1,133 @@
+"""Tests du pipeline de recherche (scrapers en parallèle, regroupement)."""
+import asyncio
+
+from app.main import (
+    build_search_response, coalesced_scraper, iter_scrapers, run_scrapers,
+    scraper_call_key, sources_exhausted
+)
+from app.models import JobRecord
+from app.services.result_cache import ResultSet
+from app.services.resilience import circuit_breakers
+
+
+def make_job(source: str, number: int) -> JobRecord:
+    return JobRecord(
+        title=f"Offre {number}",
+        company="Acme",
+        location="Remote",
+        url=f"https://example.com/{source}/{number}",
+        source=source,
+    )
+
+
+def test_call_key_keeps_operator_case_and_ignores_quantity():
+    key = scraper_call_key("remoteok", {"keywords": "python NOT senior"})
+
+    assert key != scraper_call_key("remoteok", {"keywords": "python not senior"})
+    assert key == scraper_call_key("remoteok", {"keywords": " python  NOT senior "})
+
+
+def test_searches_differing_in_quantity_share_one_scrape():
+    calls = []
+
+    async def scraper(keywords: str, max_results: int):
+        calls.append(max_results)
+        await asyncio.sleep(0.01)
+        return [make_job("fake", n) for n in range(max_results)]
+
+    async def scenario():
+        return await asyncio.gather(
+            coalesced_scraper(scraper, "fake", max_results=40, keywords="python"),
+            coalesced_scraper(scraper, "fake", max_results=10, keywords="python"),
+        )
+
+    circuit_breakers.reset()
+    large, small = asyncio.run(scenario())
+    assert calls == [40]
+    assert len(large) == 40
+    assert small == large[:10]
+
+
+async def finished(source: str, count: int):
+    return [make_job(source, n) for n in range(count)]
+
+
+async def failing(message: str):
+    raise RuntimeError(message)
+
+
+class SlowScraper:
+    """Scraper qui ne termine jamais avant le délai et note son annulation."""
+
+    def __init__(self):
+        self.cancelled = False
+
+    async def __call__(self):
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            self.cancelled = True
+            raise
+        return [make_job("slow", 0)]
+
+
+def test_deadline_cancels_slow_sources_and_keeps_the_others():
+    slow = SlowScraper()
+
+    async def scenario():
+        return [
+            (source, len(jobs), error)
+            async for source, jobs, error in iter_scrapers(
+                [("slow", slow()), ("fast", finished("fast", 3))], deadline_ms=50
+            )
+        ]
+
+    assert asyncio.run(scenario()) == [
+        ("fast", 3, None),
+        ("slow", 0, "délai dépassé (50 ms)"),
+    ]
+    assert slow.cancelled
+
+
+def test_partial_results_are_merged_in_source_order():
+    slow = SlowScraper()
+    all_jobs, errors, failed = asyncio.run(run_scrapers([
+        ("fast", finished("fast", 2)),
+        ("slow", slow()),
+        ("broken", failing("502")),
+        ("other", finished("other", 1)),
+    ], deadline_ms=50))
+
+    assert [job.url for job in all_jobs] == [
+        "https://example.com/fast/0", "https://example.com/fast/1",
+        "https://example.com/other/0",
+    ]
+    assert errors == ["slow: délai dépassé (50 ms)", "broken: 502"]
+    assert failed == {"slow", "broken"}
+
+
+def test_failed_sources_keep_the_set_incomplete():
+    jobs = [make_job("fast", n) for n in range(2)]
+
+    assert sources_exhausted(jobs, max_results=10)
+    assert not sources_exhausted(jobs, max_results=10, failed_sources={"slow"})
+    assert not sources_exhausted([], max_results=10, failed_sources={"slow"})
+    assert not sources_exhausted(jobs, max_results=2)
+
+
+def test_truncated_set_reports_totals_as_a_lower_bound():
+    jobs = [make_job("fake", n) for n in range(25)]
+
+    def page(complete):
+        result_set = ResultSet(
+            id="rs", jobs=jobs, errors=[], scraped_at="t1", complete=complete
+        )
+        return build_search_response(result_set, page=2, limit=20)
+
+    truncated = page(complete=False)
+    assert truncated.total_results == 25 and not truncated.complete
+    assert truncated.has_next
+    assert truncated.model_dump(by_alias=True)["complete"] is False
+
+    finished = page(complete=True)
+    assert finished.complete and not finished.has_next
@@ -0,0 +1,93 @@
+"""Tests de la recherche progressive (Server-Sent Events)."""
+import json
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app import main
+from app.models import JobRecord
+from app.scrapers.errors import ScraperHTTPError
+from app.services.resilience import circuit_breakers
+
+
+def make_job(source: str, number: int) -> JobRecord:
+    return JobRecord(
+        title=f"Python {source} {number}",
+        company="Acme",
+        location="Remote",
+        url=f"https://example.com/{source}/{number}",
+        source=source,
+    )
+
+
+def fake_scraper(source: str, count: int):
+    async def scrape(keywords, max_results, **kwargs):
+        return [make_job(source, n) for n in range(min(count, max_results))]
+    return scrape
+
+
+async def broken_scraper(keywords, max_results, **kwargs):
+    raise ScraperHTTPError("jobicy", "HTTP 403", status_code=403)
+
+
+@pytest.fixture
+def client(monkeypatch):
+    monkeypatch.setattr(main, "scrape_remoteok", fake_scraper("remoteok", 3))
+    monkeypatch.setattr(main, "scrape_welcometothejungle", fake_scraper("welcometothejungle", 2))
+    monkeypatch.setattr(main, "scrape_jobicy", broken_scraper)
+    circuit_breakers.reset()
+    yield TestClient(main.app)
+    circuit_breakers.reset()
+
+
+def read_events(response) -> list:
+    events = []
+    for block in response.text.split("\n\n"):
+        if not block.strip():
+            continue
+        lines = dict(line.split(": ", 1) for line in block.splitlines())
+        events.append((lines["event"], json.loads(lines["data"])))
+    return events
+
+
+def test_one_source_event_per_source_then_done(client):
+    response = client.get("/api/search/stream", params=[
+        ("keywords", "python"), ("sources", "remoteok"), ("sources", "welcometothejungle"),
+    ])
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/event-stream")
+    events = read_events(response)
+    names = [name for name, _ in events]
+    assert sorted(names[:-1]) == ["source", "source"] and names[-1] == "done"
+
+    by_source = {data["source"]: data for name, data in events if name == "source"}
+    assert by_source["remoteok"]["count"] == 3
+    assert by_source["welcometothejungle"]["count"] == 2
+    assert all(data["error"] is None for data in by_source.values())
+
+    done = events[-1][1]
+    assert done["totalResults"] == 5
+    assert done["resultSetId"]
+    assert done["errors"] is None
+    # Le jeu annoncé est relisible page par page
+    page = client.get(f"/api/search/{done['resultSetId']}", params={"page": 1, "limit": 2})
+    assert page.status_code == 200 and page.json()["totalResults"] == 5
+
+
+def test_failed_source_gets_an_error_event(client):
+    response = client.get("/api/search/stream", params=[
+        ("keywords", "python"), ("sources", "remoteok"), ("sources", "jobicy"),
+    ])
+
+    events = read_events(response)
+    assert [name for name, _ in events].count("done") == 1
+    failed = next(data for name, data in events if name == "source" and data["source"] == "jobicy")
+    assert failed["count"] == 0 and failed["results"] == []
+    assert "HTTP 403" in failed["error"]
+
+    done = events[-1][1]
+    assert done["totalResults"] == 3
+    assert any(error.startswith("jobicy:") for error in done["errors"])
+    # Une source en erreur n'est pas épuisée : le jeu reste incomplet
+    assert done["complete"] is False
@@ -0,0 +1,139 @@
+"""Tests du regroupement des appels concurrents."""
+import asyncio
+
+import pytest
+
+from app.services.single_flight import SingleFlight
+
+
+class Upstream:
+    """Appel amont qui compte ses exécutions et attend d'être libéré."""
+
+    def __init__(self, result="ok", error=None):
+        self.calls = 0
+        self.cancelled = False
+        self.release = asyncio.Event()
+        self.result = result
+        self.error = error
+
+    async def __call__(self):
+        self.calls += 1
+        try:
+            await self.release.wait()
+        except asyncio.CancelledError:
+            self.cancelled = True
+            raise
+        if self.error is not None:
+            raise self.error
+        return self.result
+
+
+def test_concurrent_identical_calls_share_one_execution():
+    async def scenario():
+        flights = SingleFlight()
+        upstream = Upstream()
+        callers = [asyncio.create_task(flights.run("remoteok", upstream)) for _ in range(5)]
+        await asyncio.sleep(0)
+        assert flights.in_flight("remoteok")
+        upstream.release.set()
+        results = await asyncio.gather(*callers)
+        return flights, upstream, results
+
+    flights, upstream, results = asyncio.run(scenario())
+    assert upstream.calls == 1
+    assert results == ["ok"] * 5
+    assert not flights.in_flight("remoteok")
+
+
+def test_different_keys_run_separately():
+    async def scenario():
+        flights = SingleFlight()
+        upstream = Upstream()
+        upstream.release.set()
+        await asyncio.gather(flights.run("a", upstream), flights.run("b", upstream))
+        return upstream
+
+    assert asyncio.run(scenario()).calls == 2
+
+
+def test_nothing_is_remembered_after_completion():
+    async def scenario():
+        flights = SingleFlight()
+        upstream = Upstream()
+        upstream.release.set()
+        await flights.run("remoteok", upstream)
+        await flights.run("remoteok", upstream)
+        return upstream
+
+    assert asyncio.run(scenario()).calls == 2
+
+
+def test_errors_reach_every_caller():
+    async def scenario():
+        flights = SingleFlight()
+        upstream = Upstream(error=RuntimeError("502"))
+        callers = [asyncio.create_task(flights.run("remoteok", upstream)) for _ in range(3)]
+        await asyncio.sleep(0)
+        upstream.release.set()
+        return await asyncio.gather(*callers, return_exceptions=True)
+
+    results = asyncio.run(scenario())
+    assert [str(result) for result in results] == ["502"] * 3
+
+
+def test_cancelling_one_caller_keeps_the_shared_call():
+    async def scenario():
+        flights = SingleFlight()
+        upstream = Upstream()
+        first = asyncio.create_task(flights.run("remoteok", upstream))
+        second = asyncio.create_task(flights.run("remoteok", upstream))
+        await asyncio.sleep(0)
+        first.cancel()
+        await asyncio.sleep(0)
+        upstream.release.set()
+        with pytest.raises(asyncio.CancelledError):
+            await first
+        return upstream, await second
+
+    upstream, result = asyncio.run(scenario())
+    assert result == "ok"
+    assert upstream.calls == 1
+    assert not upstream.cancelled
+
+
+def test_shared_call_is_cancelled_when_every_caller_leaves():
+    async def scenario():
+        flights = SingleFlight()
+        upstream = Upstream()
+        callers = [asyncio.create_task(flights.run("remoteok", upstream)) for _ in range(2)]
+        await asyncio.sleep(0)
+        for caller in callers:
+            caller.cancel()
+        await asyncio.gather(*callers, return_exceptions=True)
+        await asyncio.sleep(0)
+        return flights, upstream
+
+    flights, upstream = asyncio.run(scenario())
+    assert upstream.cancelled
+    assert not flights.in_flight("remoteok")
+
+
+def test_larger_request_starts_a_wider_call():
+    async def scenario():
+        flights = SingleFlight()
+        narrow, wide = Upstream("narrow"), Upstream("wide")
+        first = asyncio.create_task(flights.run("remoteok", narrow, size=10))
+        await asyncio.sleep(0)
+        second = asyncio.create_task(flights.run("remoteok", wide, size=50))
+        await asyncio.sleep(0)
+        # Les appelants suivants rejoignent l'appel le plus large
+        assert flights.in_flight("remoteok", 50)
+        third = asyncio.create_task(flights.run("remoteok", narrow, size=20))
+        await asyncio.sleep(0)
+        narrow.release.set()
+        wide.release.set()
+        return narrow, await asyncio.gather(first, second, third)
+
+    narrow, results = asyncio.run(scenario())
+    assert results == ["narrow", "wide", "wide"]
+    assert narrow.calls == 1
@@ -0,0 +1,59 @@
+"""Tests du tirage borné des flux d'offres."""
+import asyncio
+
+from app.models import JobRecord
+from app.scrapers.stream import take
+
+
+class Feed:
+    """Flux d'offres qui compte les offres produites et note sa fermeture."""
+
+    def __init__(self, count: int):
+        self.count = count
+        self.produced = 0
+        self.closed = False
+
+    async def __call__(self):
+        try:
+            for number in range(self.count):
+                self.produced += 1
+                yield JobRecord(
+                    title=f"Offre {number}",
+                    company="Acme",
+                    location="Remote",
+                    url=f"https://example.com/{number}",
+                    source="fake",
+                )
+        finally:
+            self.closed = True
+
+
+def test_take_stops_after_the_limit_and_closes_the_stream():
+    feed = Feed(100)
+    jobs = asyncio.run(take(feed(), 3))
+
+    assert [job.title for job in jobs] == ["Offre 0", "Offre 1", "Offre 2"]
+    assert feed.produced == 3
+    assert feed.closed
+
+
+def test_take_returns_everything_from_a_short_stream():
+    feed = Feed(2)
+    jobs = asyncio.run(take(feed(), 10))
+
+    assert len(jobs) == 2
+    assert feed.closed
+
+
+def test_take_zero_reads_nothing_but_still_closes():
+    feed = Feed(5)
+    stream = feed()
+
+    async def scenario():
+        # Flux démarré puis abandonné : seule sa fermeture doit avoir lieu
+        await stream.__anext__()
+        return await take(stream, 0)
+
+    assert asyncio.run(scenario()) == []
+    assert feed.produced == 1
+    assert feed.closed
@@ -0,0 +1,39 @@
+"""Tests de l'analyse des liens d'offres Welcome to the Jungle."""
+from app.scrapers.welcometothejungle import WTTJ_BASE_URL, _parse_job_links
+
+
+def test_links_give_title_company_and_absolute_url():
+    jobs = _parse_job_links(
+        ["/fr/companies/acme-corp/jobs/developpeur-python_paris"], max_results=10
+    )
+
+    assert jobs == [{
+        "title": "Developpeur Python_Paris",
+        "company": "Acme Corp",
+        "url": f"{WTTJ_BASE_URL}/fr/companies/acme-corp/jobs/developpeur-python_paris",
+    }]
+
+
+def test_absolute_links_are_kept_as_is():
+    href = "https://www.welcometothejungle.com/fr/companies/acme/jobs/data-engineer"
+    assert _parse_job_links([href], max_results=10)[0]["url"] == href
+
+
+def test_duplicates_and_other_links_are_skipped():
+    hrefs = [
+        "",
+        "/fr/companies/acme",
+        "/fr/jobs",
+        "/fr/companies/acme/jobs/devops",
+        "/fr/companies/acme/jobs/devops",
+        "/fr/companies/globex/jobs/designer?q=1",
+    ]
+
+    jobs = _parse_job_links(hrefs, max_results=10)
+
+    assert [job["title"] for job in jobs] == ["Devops", "Designer"]
+
+
+def test_max_results_stops_early():
+    hrefs = [f"/fr/companies/acme/jobs/offre-{n}" for n in range(5)]
+    assert len(_parse_job_links(hrefs, max_results=3)) == 3
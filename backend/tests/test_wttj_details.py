@@ -0,0 +1,114 @@
+"""Tests de l'enrichissement des offres WTTJ depuis leur JSON-LD."""
+import asyncio
+import json
+
+from app.scrapers.wttj_details import JobDetailEnricher, extract_job_posting, posting_fields
+
+POSTING = {
+    "@context": "https://schema.org",
+    "@type": "JobPosting",
+    "title": " Développeur Python ",
+    "hiringOrganization": {"@type": "Organization", "name": "Acme"},
+    "employmentType": ["FULL_TIME"],
+    "jobLocation": [
+        {"address": {"addressLocality": "Paris"}},
+        {"address": {"addressLocality": "Lyon"}},
+        {"address": {"addressLocality": "Paris"}},
+    ],
+    "baseSalary": {
+        "currency": "EUR",
+        "value": {"minValue": 3500, "maxValue": 4000, "unitText": "MONTH"},
+    },
+    "experienceRequirements": {"monthsOfExperience": 36},
+    "datePosted": "2024-05-02",
+}
+
+
+def page(*blocks: str) -> str:
+    scripts = "".join(
+        f'<script type="application/ld+json">{block}</script>' for block in blocks
+    )
+    return f"<html><head>{scripts}</head><body></body></html>"
+
+
+def test_posting_in_a_graph_is_found():
+    data = {"@context": "https://schema.org", "@graph": [
+        {"@type": "Organization", "name": "Acme"},
+        POSTING,
+    ]}
+    assert extract_job_posting(page(json.dumps(data))) == POSTING
+
+
+def test_posting_in_a_list_is_found():
+    data = [{"@type": "BreadcrumbList"}, POSTING]
+    assert extract_job_posting(page(json.dumps(data))) == POSTING
+
+
+def test_invalid_blocks_are_skipped():
+    html = page('{"@type": "JobPosting", "title": ', json.dumps(POSTING))
+    assert extract_job_posting(html) == POSTING
+
+
+def test_page_without_posting_gives_none():
+    assert extract_job_posting(page("{invalide")) is None
+    assert extract_job_posting(page(json.dumps({"@type": "Organization"}))) is None
+    assert extract_job_posting("<html></html>") is None
+
+
+def test_fields_are_mapped_to_job_record_names():
+    assert posting_fields(POSTING) == {
+        "title": "Développeur Python",
+        "company": "Acme",
+        "location": "Paris, Lyon",
+        "contract_type": "CDI",
+        "experience_level": "Confirmé",
+        "posted_at": "2024-05-02",
+        "salary": "42000-48000 EUR",
+        "salary_min": 42000,
+        "salary_max": 48000,
+        "salary_currency": "EUR",
+    }
+
+
+def test_missing_fields_are_left_out():
+    fields = posting_fields({"@type": "JobPosting", "jobLocationType": "TELECOMMUTE"})
+    assert fields == {"location": "Remote"}
+
+
+class CountingEnricher(JobDetailEnricher):
+    """Enrichisseur dont les pages sont simulées et les lectures comptées."""
+
+    def __init__(self, pages, **kwargs):
+        super().__init__(concurrency=2, ttl=3600, **kwargs)
+        self.pages = pages
+        self.fetches = []
+
+    async def _fetch(self, url):
+        self.fetches.append(url)
+        return self.pages.get(url)
+
+
+def test_failed_pages_are_not_fetched_again_within_the_negative_ttl():
+    enricher = CountingEnricher({"ok": {"title": "Dev"}, "empty": {}}, negative_ttl=60)
+
+    async def scenario():
+        first = await enricher.enrich(["ok", "broken", "empty"], timeout=1)
+        second = await enricher.enrich(["ok", "broken", "empty"], timeout=1)
+        return first, second
+
+    first, second = asyncio.run(scenario())
+    assert first == second == {"ok": {"title": "Dev"}}
+    assert sorted(enricher.fetches) == ["broken", "empty", "ok"]
+
+
+def test_failed_pages_are_retried_once_the_negative_entry_expires():
+    enricher = CountingEnricher({}, negative_ttl=60)
+
+    async def scenario():
+        await enricher.enrich(["broken"], timeout=1)
+        expires_at, fields = enricher._entries["broken"]
+        enricher._entries["broken"] = (expires_at - 61, fields)
+        await enricher.enrich(["broken"], timeout=1)
+
+    asyncio.run(scenario())
+    assert enricher.fetches == ["broken", "broken"]
@@ -1,6 +1,6 @@
 import { useState, useCallback, useEffect } from 'react';
 import type { SearchRequest, SearchResponse, AppState, JobOffer } from './types';
-import { searchJobs, exportResults, downloadBlob } from './services/api';
+import { searchJobs, fetchResultPage, exportResults, downloadBlob } from './services/api';
 import SearchForm from './components/SearchForm';
 import JobCard from './components/JobCard';
 import Pagination from './components/Pagination';
@@ -80,17 +80,30 @@ function App() {
     }
   }, [searchHistory]);
 
-  const handlePageChange = useCallback((page: number) => {
+  const handlePageChange = useCallback(async (page: number) => {
     if (!lastRequest) return;
-    handleSearch({ ...lastRequest, page });
-  }, [lastRequest, handleSearch]);
+    const resultSetId = searchResponse?.resultSetId;
+    if (!resultSetId) {
+      handleSearch({ ...lastRequest, page });
+      return;
+    }
+
+    // Les pages suivantes sont decoupees cote serveur, sans nouveau scraping
+    try {
+      const response = await fetchResultPage(resultSetId, page, lastRequest.limit);
+      setSearchResponse(response);
+      setLastRequest({ ...lastRequest, page });
+    } catch {
+      handleSearch({ ...lastRequest, page });
+    }
+  }, [lastRequest, searchResponse, handleSearch]);
 
   const handleExport = async (format: 'csv' | 'json') => {
-    if (!searchResponse || searchResponse.totalResults === 0) return;
+    if (!searchResponse || searchResponse.totalResults === 0 || !searchResponse.resultSetId) return;
 
     setExportLoading(true);
     try {
-      const blob = await exportResults(format);
+      const blob = await exportResults(format, searchResponse.resultSetId);
       const filename = `job_offers_${new Date().toISOString().split('T')[0]}.${format}`;
       downloadBlob(blob, filename);
       showToast(`Export ${format.toUpperCase()} telecharge !`);
@@ -231,7 +244,7 @@ function App() {
               <div className="flex flex-col sm:flex-row sm:items-center sm:justify-between gap-4 mb-6">
                 <div>
                   <h2 className="text-lg font-semibold text-gray-900 dark:text-white">
-                    {searchResponse.totalResults} resultats trouves
+                    {searchResponse.totalResults}{searchResponse.complete === false ? '+' : ''} resultats trouves
                   </h2>
                   {searchResponse.errors && searchResponse.errors.length > 0 && (
                     <p className="text-sm text-yellow-600 dark:text-yellow-400 mt-1">
@@ -18,8 +18,28 @@ export async function searchJobs(request: SearchRequest): Promise<SearchResponse
   return response.json();
 }
 
-export async function exportResults(format: 'csv' | 'json'): Promise<Blob> {
-  const response = await fetch(`${API_BASE}/export?format=${format}`);
+export async function fetchResultPage(
+  resultSetId: string,
+  page: number,
+  limit?: number
+): Promise<SearchResponse> {
+  const params = new URLSearchParams({ page: String(page) });
+  if (limit) params.set('limit', String(limit));
+  const response = await fetch(`${API_BASE}/search/${resultSetId}?${params}`);
+
+  if (!response.ok) {
+    throw new Error(`Erreur API: ${response.status}`);
+  }
+
+  return response.json();
+}
+
+export async function exportResults(
+  format: 'csv' | 'json',
+  resultSetId: string
+): Promise<Blob> {
+  const params = new URLSearchParams({ format, resultSet: resultSetId });
+  const response = await fetch(`${API_BASE}/export?${params}`);
 
   if (!response.ok) {
     throw new Error(`Erreur export: ${response.status}`);
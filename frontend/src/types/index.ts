@@ -4,6 +4,9 @@ export interface JobOffer {
   company: string;
   location: string;
   salary?: string;
+  salaryMin?: number;
+  salaryMax?: number;
+  salaryCurrency?: string;
   contractType?: string;
   experienceLevel?: string;
   description?: string;
@@ -12,6 +15,7 @@ export interface JobOffer {
   postedAt?: string;
   scrapedAt: string;
   tags?: string[];
+  sources?: string[];
 }
 
 export interface SearchRequest {
@@ -26,6 +30,8 @@ export interface SearchRequest {
   sortBy?: 'date' | 'salary' | 'relevance';
   page?: number;
   limit?: number;
+  deadlineMs?: number;
+  mode?: 'index' | 'live';
 }
 
 export interface SearchResponse {
@@ -39,6 +45,11 @@ export interface SearchResponse {
   totalPages: number;
   hasNext: boolean;
   hasPrevious: boolean;
+  resultSetId?: string;
+  duplicatesCollapsed?: number;
+  degradedSources?: string[];
+  // Faux tant que les sources ont d'autres offres : les totaux sont des minimums
+  complete?: boolean;
 }
 
 export type AppState = 'initial' | 'loading' | 'results' | 'empty' | 'error';